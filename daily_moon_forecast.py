@@ -1,7 +1,8 @@
 # File: weekly_forecast_definitive.py
 
 import datetime
-from vedastro import Calculate, Time, GeoLocation, PlanetName, Ayanamsa
+from vedastro import Calculate, Time, GeoLocation, PlanetName, Ayanamsa, ConstellationName
+from vedastro import to_julian_day, julian_day_to_time, ingress_times, planet_nirayana_longitude
 
 # Using the Lahiri Ayanamsa, our confirmed standard for accurate transitions.
 CHOSEN_AYANAMSA = Ayanamsa.Lahiri
@@ -30,16 +31,25 @@ def get_daily_lunar_details(date_obj: datetime.datetime, geo_location: GeoLocati
     # 3. Map the reliable 0-360 degree progress to our desired 0.0-2.0 float scale.
     lunar_float = (cycle_progress_degrees / 360.0) * 2.0
 
-    # --- Determine Nakshatra Transition ---
-    start_time = Time(f"00:01 {date_str} {timezone_offset}", geo_location)
-    end_time = Time(f"23:59 {date_str} {timezone_offset}", geo_location)
-    start_nakshatra = str(Calculate.PlanetConstellation(PlanetName.Moon, start_time))
-    end_nakshatra = str(Calculate.PlanetConstellation(PlanetName.Moon, end_time))
-    
+    # --- Determine Nakshatra Transitions ---
+    # Exact ingress instants from the local root finder, so a day with two
+    # transitions is not mistaken for one and the change time is known.
+    day_start = to_julian_day(Time(f"00:00 {date_str} {timezone_offset}", geo_location))
+    times, from_index, to_index = ingress_times(PlanetName.Moon, day_start, day_start + 1.0, 360.0 / 27.0)
+    if len(times):
+        start_index = from_index[0]
+    else:
+        start_index = int(planet_nirayana_longitude(PlanetName.Moon, day_start) // (360.0 / 27.0))
+    start_nakshatra = ConstellationName(start_index + 1).name
+    end_nakshatra = ConstellationName(to_index[-1] + 1).name if len(times) else start_nakshatra
+    transitions = [(julian_day_to_time(jd, geo_location, timezone_offset).time_string.split()[0],
+                    ConstellationName(index + 1).name) for jd, index in zip(times, to_index)]
+
     return {
         "lunar_float": lunar_float,
         "start_nakshatra": start_nakshatra,
-        "end_nakshatra": end_nakshatra
+        "end_nakshatra": end_nakshatra,
+        "transitions": transitions
     }
 
 def run_weekly_forecast_definitive():
@@ -79,10 +89,12 @@ def run_weekly_forecast_definitive():
 
             print(f"  Lunar Float: {lunar_float:.4f} ({interpretation})")
             
-            if lunar_data['start_nakshatra'] == lunar_data['end_nakshatra']:
+            if not lunar_data['transitions']:
                 print(f"  Nakshatra:   The Moon remains in '{lunar_data['start_nakshatra']}' all day.")
             else:
-                print(f"  Nakshatra:   Transition from '{lunar_data['start_nakshatra']}' into '{lunar_data['end_nakshatra']}'.")
+                print(f"  Nakshatra:   Starts the day in '{lunar_data['start_nakshatra']}'.")
+                for clock, nakshatra in lunar_data['transitions']:
+                    print(f"               Enters '{nakshatra}' at {clock}.")
 
             current_date += datetime.timedelta(days=1)
 
@@ -0,0 +1,33 @@
+from vedastro import *  # install via pip
+
+# PART 0 : Set API key (only needed for the API comparison in PART 3)
+Calculate.SetAPIKey('FreeAPIUser')  # ⚡ unlimited speed  API key from "vedastro.org/Account"
+
+#PART 1 : PREPARE NEEDED DATA
+#-----------------------------------
+
+# set birth location
+geolocation = GeoLocation("Tokyo, Japan", 139.83, 35.65)
+
+# group all birth time data together
+birth_time = Time("23:40 31/12/2010 +08:00", geolocation)
+
+#PART 2 : CALCULATE LOCALLY, NO API CALLS
+#-----------------------------------
+
+# every Ayanamsa member works, same setting as used by the calculator
+Calculate.Ayanamsa = Ayanamsa.Raman
+print(f"Raman Ayanamsa : {ayanamsa_degree(birth_time)}")
+
+# many times at once, eg: every 1st of January from 1900 to 2100
+jd_list = julian_day(range(1900, 2101), 1, 1)
+lahiri_list = ayanamsa_degree(jd_list, Ayanamsa.Lahiri)
+print(f"Lahiri 1900 -> 2100 : {lahiri_list[0]:.4f} -> {lahiri_list[-1]:.4f}")
+
+# sayana to nirayana without a request
+print(f"Nirayana Longitude : {nirayana_longitude(280.0, birth_time, Ayanamsa.Lahiri)}")
+
+#PART 3 : CHECK AGAINST API
+#-----------------------------------
+for row in ayanamsa_parity_table([birth_time]):
+    print(f"{row['case'][0].name:<15} local {row['local']:.6f} api {row['api']} diff {row['difference']}")
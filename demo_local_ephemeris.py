@@ -0,0 +1,44 @@
+from vedastro import *  # install via pip
+from vedastro.validation import parse_degrees, angle_difference
+import numpy as np
+
+# PART 0 : Set API key (only needed for the API comparison in PART 3)
+Calculate.SetAPIKey('FreeAPIUser')  # ⚡ unlimited speed  API key from "vedastro.org/Account"
+
+#PART 1 : PREPARE NEEDED DATA
+#-----------------------------------
+
+# set birth location
+geolocation = GeoLocation("Tokyo, Japan", 139.83, 35.65)
+
+# group all birth time data together
+birth_time = Time("23:40 31/12/2010 +08:00", geolocation)
+
+#PART 2 : CALCULATE LOCALLY, NO API CALLS
+#-----------------------------------
+
+Calculate.Ayanamsa = Ayanamsa.Lahiri
+
+# all nine grahas for the birth time
+for planet in [PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury, PlanetName.Jupiter,
+               PlanetName.Venus, PlanetName.Saturn, PlanetName.Rahu, PlanetName.Ketu]:
+    print(f"{planet.name:<8} : {planet_nirayana_longitude(planet, birth_time):.4f}")
+
+# outer planets & true nodes go by name
+print(f"Uranus   : {planet_nirayana_longitude('Uranus', birth_time):.4f}")
+print(f"True Rahu: {planet_nirayana_longitude('TrueRahu', birth_time):.4f}")
+
+# hourly Saturn for 20 years in one call
+jd_list = julian_day(2000, 1, 1) + np.arange(20 * 365 * 24) / 24.0
+saturn_list = planet_nirayana_longitude(PlanetName.Saturn, jd_list)
+print(f"Saturn hourly 2000 -> 2020 : {len(saturn_list)} positions")
+
+# expected error against Swiss Ephemeris in arcseconds (rms, max)
+print(f"Mars error budget : {EPHEMERIS_ERROR_BUDGET[PlanetName.Mars]}")
+
+#PART 3 : CHECK AGAINST API
+#-----------------------------------
+for planet in [PlanetName.Moon, PlanetName.Saturn]:
+    local = planet_nirayana_longitude(planet, birth_time)
+    api = parse_degrees(Calculate.PlanetNirayanaLongitude(planet, birth_time))
+    print(f"{planet.name:<8} local {local:.4f} api {api:.4f} diff {angle_difference(local, api) * 3600:.1f}\"")
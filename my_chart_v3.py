@@ -93,10 +93,13 @@ def process_daily_snapshot(task_data):
     try:
         date_str = current_date.strftime('%d/%m/%Y')
         noon_time_obj = Time(f"12:00 {date_str} {timezone_offset}", geo_location)
-        start_time_obj = Time(f"00:01 {date_str} {timezone_offset}", geo_location)
-        end_time_obj = Time(f"23:59 {date_str} {timezone_offset}", geo_location)
-        moon_start_nak = str(Calculate.PlanetConstellation(PlanetName.Moon, start_time_obj))
-        moon_end_nak = str(Calculate.PlanetConstellation(PlanetName.Moon, end_time_obj))
+        # exact Moon nakshatra ingresses over the local day, catches days with 2 transitions
+        day_start = to_julian_day(Time(f"00:00 {date_str} {timezone_offset}", geo_location))
+        ingress_jds, from_nak, to_nak = ingress_times(PlanetName.Moon, day_start, day_start + 1.0, 360.0 / 27.0, CHOSEN_AYANAMSA)
+        start_index = from_nak[0] if len(ingress_jds) else int(planet_nirayana_longitude(PlanetName.Moon, day_start, CHOSEN_AYANAMSA) // (360.0 / 27.0))
+        moon_start_nak = ConstellationName(start_index + 1).name
+        moon_end_nak = ConstellationName(to_nak[-1] + 1).name if len(ingress_jds) else moon_start_nak
+        moon_transits = [{"time": julian_day_to_time(jd, geo_location, timezone_offset).time_string, "nakshatra": ConstellationName(index + 1).name} for jd, index in zip(ingress_jds, to_nak)]
         sun_lon_obj = Calculate.PlanetNirayanaLongitude(PlanetName.Sun, noon_time_obj)
         moon_lon_obj = Calculate.PlanetNirayanaLongitude(PlanetName.Moon, noon_time_obj)
         sun_lon = float(sun_lon_obj['TotalDegrees']); moon_lon = float(moon_lon_obj['TotalDegrees'])
@@ -112,7 +115,7 @@ def process_daily_snapshot(task_data):
             planet_lon_obj = Calculate.PlanetNirayanaLongitude(p_enum, noon_time_obj)
             nakshatra_obj = Calculate.PlanetConstellation(p_enum, noon_time_obj)
             planets_data.append({"name": p_enum.value, "absolute_longitude": round(float(planet_lon_obj.get('TotalDegrees', 0.0)), 4), "house": house_number, "nakshatra": str(nakshatra_obj)})
-        return {"timestamp": current_date.strftime("%Y-%m-%d 12:00:00"), "lunar_phase_float": round(lunar_float, 4), "moon_start_nakshatra": moon_start_nak, "moon_end_nakshatra": moon_end_nak, "planets": planets_data}
+        return {"timestamp": current_date.strftime("%Y-%m-%d 12:00:00"), "lunar_phase_float": round(lunar_float, 4), "moon_start_nakshatra": moon_start_nak, "moon_end_nakshatra": moon_end_nak, "moon_nakshatra_transits": moon_transits, "planets": planets_data}
     except Exception as e:
         print(f"Error processing {current_date.strftime('%d/%m/%Y')}: {e}")
         return None
@@ -146,12 +149,9 @@ def generate_and_save_all_data(profile_data):
             "absolute_longitude": float(lon_obj['TotalDegrees']), "sign": planet_sign_obj.get('Name', 'N/A'),
             "degree_str": planet_sign_obj.get('DegreesIn', {}).get('DegreeMinuteSecond', ''), "nakshatra": nakshatra_str
         })
-    angles_data = {
-        "AC": float(Calculate.HouseRasiSign(HouseName.House1, natal_birth_time).get('DegreesIn', {}).get('TotalDegrees', 0.0)),
-        "MC": float(Calculate.HouseRasiSign(HouseName.House10, natal_birth_time).get('DegreesIn', {}).get('TotalDegrees', 0.0)),
-        "DC": float(Calculate.HouseRasiSign(HouseName.House7, natal_birth_time).get('DegreesIn', {}).get('TotalDegrees', 0.0)),
-        "IC": float(Calculate.HouseRasiSign(HouseName.House4, natal_birth_time).get('DegreesIn', {}).get('TotalDegrees', 0.0)),
-    }
+    # all four angles from the local house engine, degrees inside their sign
+    natal_cusps = HouseCusps(natal_birth_time, natal_location.latitude, natal_location.longitude, CHOSEN_AYANAMSA)
+    angles_data = {name: float(longitude) % 30.0 for name, longitude in natal_cusps.angles().items()}
     all_divisional_charts_data = {}
     for chart_config in tqdm(DIVISIONAL_CHARTS_CONFIG, desc="Calculating Vargas"):
         d_number = chart_config['d_number']
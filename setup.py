@@ -11,6 +11,7 @@ setup(
         'packaging',
         'colorama',
         'requests',
+        'numpy',
         'pythonnet==3.0.2',
         'pycparser',
     ],
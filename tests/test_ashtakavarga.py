@@ -0,0 +1,25 @@
+import numpy as np
+
+from vedastro import PlanetName
+from vedastro.ashtakavarga import ASHTAKAVARGA_PLANETS, Ashtakavarga
+
+# bindus in each planet's table are fixed whatever the chart, 337 in all
+BHINNA_TOTALS = {
+    PlanetName.Sun: 48, PlanetName.Moon: 49, PlanetName.Mars: 39, PlanetName.Mercury: 54,
+    PlanetName.Jupiter: 56, PlanetName.Venus: 52, PlanetName.Saturn: 39,
+}
+
+
+def test_totals_for_any_chart():
+    charts = Ashtakavarga(np.random.default_rng(7).integers(0, 12, size=(50, 8)))
+    assert (charts.sarva.sum(axis=-1) == 337).all()
+    totals = charts.bhinna.sum(axis=-1)
+    for index, planet in enumerate(ASHTAKAVARGA_PLANETS):
+        assert (totals[:, index] == BHINNA_TOTALS[planet]).all()
+
+
+def test_sun_gives_its_own_table_bindus_from_its_sign():
+    # Sun in Leo, it gives bindus in the 1, 2, 4, 7, 8, 9, 10 & 11th from itself
+    chart = Ashtakavarga([4, 0, 0, 0, 0, 0, 0, 0])
+    given = chart.planet_ashtakvarga_bindu_by_planet(PlanetName.Sun, PlanetName.Sun)
+    assert np.flatnonzero(given).tolist() == sorted((4 + house - 1) % 12 for house in (1, 2, 4, 7, 8, 9, 10, 11))
@@ -0,0 +1,39 @@
+from vedastro import HouseName, PlanetName
+from vedastro.aspects import AspectMatrix
+
+P = PlanetName
+
+# ascendant 0 Aries with equal houses, every planet mid sign:
+# Sun & Mars in Aries, Moon Gemini, Mercury Libra, Jupiter Leo, Venus & Ketu
+# Scorpio, Saturn Capricorn, Rahu Taurus
+CHART = {
+    P.Sun: 15.0, P.Moon: 75.0, P.Mars: 15.0, P.Mercury: 195.0, P.Jupiter: 135.0,
+    P.Venus: 225.0, P.Saturn: 285.0, P.Rahu: 45.0, P.Ketu: 225.0,
+}
+
+
+def houses(*numbers):
+    return [HouseName(f"House{number}") for number in numbers]
+
+
+def test_special_aspects():
+    chart = AspectMatrix(CHART, ascendant_longitude=0.0)
+    # Mars 4th, 7th & 8th, Jupiter 5th, 7th & 9th, Saturn 3rd, 7th & 10th
+    assert chart.houses_in_aspect(P.Mars) == houses(4, 7, 8)
+    assert chart.houses_in_aspect(P.Jupiter) == houses(1, 9, 11)
+    assert chart.houses_in_aspect(P.Saturn) == houses(4, 7, 12)
+    assert chart.houses_in_aspect(P.Sun) == houses(7)
+    assert chart.planets_in_aspect(P.Mars) == [P.Mercury, P.Venus, P.Ketu]
+    assert chart.planets_aspecting_planet(P.Mercury) == [P.Sun, P.Mars, P.Saturn]
+    assert chart.is_planet_aspected_by_planet(P.Sun, P.Jupiter)
+    assert not chart.is_planet_aspected_by_planet(P.Jupiter, P.Sun)
+
+
+def test_special_aspects_are_full_strength():
+    chart = AspectMatrix(CHART, ascendant_longitude=0.0)
+    # 60 virupas once the visesha bonus tops up the 8th, 9th & 10th
+    assert chart.planet_aspect_degree(P.Venus, P.Mars) == 60.0
+    assert chart.planet_aspect_degree(P.Sun, P.Jupiter) == 60.0
+    assert chart.planet_aspect_degree(P.Mercury, P.Saturn) == 60.0
+    assert chart.planet_aspect_degree(P.Mercury, P.Sun) == 60.0
+    assert chart.planet_aspect_degree(P.Moon, P.Sun) == 15.0
@@ -0,0 +1,48 @@
+import json
+import os
+
+import numpy as np
+
+from vedastro import Ayanamsa, GeoLocation, Time, to_julian_day
+from vedastro.ayanamsa import API_AYANAMSA, ayanamsa_degree
+from vedastro.ephemeris import delta_t_seconds, nutation
+from vedastro.validation import angle_difference
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+# arc seconds, star & galactic systems drift away from precession the most
+TOLERANCE = 3.5
+LOOSE_TOLERANCE = {Ayanamsa.Galcent_Mula_Wilhelm: 20.0}
+
+
+def load(name):
+    with open(os.path.join(DATA, name)) as file:
+        return json.load(file)
+
+
+def test_every_ayanamsa_against_swiss_ephemeris():
+    reference = load("ayanamsa_reference.json")
+    jd = np.array(reference["julian_days"])
+    for name, degrees in reference["degrees"].items():
+        ayanamsa = Ayanamsa[name]
+        error = np.abs(angle_difference(ayanamsa_degree(jd, ayanamsa), np.array(degrees))) * 3600.0
+        assert error.max() < LOOSE_TOLERANCE.get(ayanamsa, TOLERANCE), name
+
+
+def test_api_ayanamsa_against_recorded_api():
+    # sayana - nirayana from the API is the true ayanamsa, mean plus nutation,
+    # the recorded values are rounded to whole arc seconds
+    reference = load("api_sun_tokyo_2011.json")
+    geolocation = GeoLocation("Tokyo, Japan", 139.83, 35.65)
+    jd = np.array([to_julian_day(Time(row[0], geolocation)) for row in reference["rows"]])
+    api = np.array([row[1] - row[2] for row in reference["rows"]])
+    local = ayanamsa_degree(jd, API_AYANAMSA) + nutation(jd + delta_t_seconds(jd) / 86400.0)[0]
+    assert np.abs(angle_difference(local, api)).max() * 3600.0 < 2.0
+
+
+def test_fagan_bradley_at_its_defining_epoch():
+    # the synetic vernal point was fixed at 24 02' 31.36" for B1950.0
+    published = 24.0 + 2.0 / 60.0 + 31.36 / 3600.0
+    local = ayanamsa_degree(2433282.42346, Ayanamsa.Fagan_Bradley)
+    assert abs(local - published) * 3600.0 < 1.0
+
@@ -0,0 +1,24 @@
+from vedastro import PlanetName
+from vedastro.dasa import VimshottariDasa
+
+BIRTH = 2447892.5
+YEAR = 365.25
+
+
+def test_balance_of_dasa_at_birth():
+    # Moon 20 Taurus is 3/4 through Rohini, 1/4 of the Moon's 10 years is left
+    dasa = VimshottariDasa(BIRTH, moon_longitude=50.0)
+    first, second = list(dasa.maha_dasas())[:2]
+    assert first.lord == PlanetName.Moon and second.lord == PlanetName.Mars
+    assert abs(first.end - (BIRTH + 2.5 * YEAR)) < 1e-6
+    assert abs(second.end - first.end - 7 * YEAR) < 1e-6
+
+
+def test_bhuktis_at_start_of_aswini():
+    # Moon at 0 Aries starts a whole Ketu dasa, its first bhukti is Ketu's own
+    dasa = VimshottariDasa(BIRTH, moon_longitude=0.0)
+    maha, bhukti = dasa.at_time(BIRTH + 0.1, levels=2)
+    assert maha.lords == (PlanetName.Ketu,) and maha.start == BIRTH
+    assert bhukti.lords == (PlanetName.Ketu, PlanetName.Ketu)
+    assert abs(bhukti.duration_days - 7 * 7 / 120.0 * YEAR) < 1e-6
+    assert [period.lord for period in maha][1] == PlanetName.Venus
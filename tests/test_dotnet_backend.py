@@ -0,0 +1,40 @@
+import pytest
+
+from vedastro import Ayanamsa, Calculate, GeoLocation, PlanetName, Time
+from vedastro import dotnet_backend
+
+TIME = Time("12:00 01/01/2024 +00:00", GeoLocation("Greenwich", 0.0, 51.48))
+
+
+@pytest.fixture
+def library(monkeypatch):
+    # no pythonnet here, record what would reach the library instead
+    calls = []
+    monkeypatch.setattr(dotnet_backend, "load_library", lambda: None)
+    monkeypatch.setattr(dotnet_backend, "_push_ayanamsa", lambda ayanamsa: calls.append(("ayanamsa", ayanamsa)))
+    monkeypatch.setattr(dotnet_backend, "invoke", lambda endpoint, arguments: calls.append((endpoint, arguments)) or 1.0)
+    return calls
+
+
+def test_dotnet_swaps_only_that_client(library):
+    class Client(Calculate):
+        pass
+
+    generated = Calculate.PlanetNirayanaLongitude
+    Client.SetBackend("dotnet")
+    try:
+        assert Client.PlanetNirayanaLongitude(PlanetName.Sun, time=TIME) == 1.0
+        assert library[-1] == ("PlanetNirayanaLongitude", {"planetName": PlanetName.Sun, "time": TIME})
+        assert Calculate.backend == "http" and Calculate.PlanetNirayanaLongitude == generated
+
+        Client.SetAyanamsa(Ayanamsa.Raman)
+        assert library[-1] == ("ayanamsa", Ayanamsa.Raman)
+    finally:
+        Client.SetBackend("http")
+    assert Client.backend == "http"
+    assert "PlanetNirayanaLongitude" not in Client.__dict__
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        Calculate.SetBackend("grpc")
@@ -0,0 +1,25 @@
+import pytest
+
+from vedastro.eclipse import EclipseTable
+from vedastro.julian_day import julian_day
+
+# greatest eclipse (UT) & gamma from the NASA eclipse catalogues
+KNOWN_ECLIPSES = [
+    ("Solar", "Total", julian_day(2017, 8, 21) + (18 + 25 / 60.0 + 32 / 3600.0) / 24.0, 0.4367),
+    ("Solar", "Total", julian_day(2024, 4, 8) + (18 + 17 / 60.0 + 16 / 3600.0) / 24.0, 0.3431),
+    ("Lunar", "Total", julian_day(2022, 11, 8) + (10 + 59 / 60.0 + 11 / 3600.0) / 24.0, 0.2570),
+]
+
+
+@pytest.fixture(scope="module")
+def table():
+    return EclipseTable(julian_day(2017, 1, 1), julian_day(2025, 1, 1), workers=1)
+
+
+@pytest.mark.parametrize("kind, kind_type, greatest, gamma", KNOWN_ECLIPSES)
+def test_known_eclipses(table, kind, kind_type, greatest, gamma):
+    found = table.next_solar_eclipse(greatest - 1.0) if kind == "Solar" else table.next_lunar_eclipse(greatest - 1.0)
+    assert abs(found - greatest) * 1440.0 < 2.0
+    row = [row for row in table.rows() if row["Time"] == found][0]
+    assert row["Type"] == kind_type
+    assert abs(row["Gamma"] - gamma) < 0.002
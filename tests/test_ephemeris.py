@@ -0,0 +1,42 @@
+import json
+import os
+
+import numpy as np
+
+from vedastro import Ayanamsa, GeoLocation, PlanetName, Time, to_julian_day
+from vedastro.ephemeris import EPHEMERIS_ERROR_BUDGET, planet_nirayana_longitude, planet_sayana_longitude
+from vedastro.validation import angle_difference
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def load(name):
+    with open(os.path.join(DATA, name)) as file:
+        return json.load(file)
+
+
+def arc_seconds(local, reference):
+    return np.abs(angle_difference(np.asarray(local), np.asarray(reference))) * 3600.0
+
+
+def test_within_error_budget_of_swiss_ephemeris():
+    reference = load("ephemeris_reference.json")
+    jd = np.array(reference["julian_days"])
+    degrees = dict(reference["degrees"])
+    degrees["Ketu"] = (np.array(degrees["Rahu"]) + 180.0) % 360.0
+    degrees["TrueKetu"] = (np.array(degrees["TrueRahu"]) + 180.0) % 360.0
+    for name, expected in degrees.items():
+        planet = PlanetName[name] if name in PlanetName.__members__ else name
+        error = arc_seconds(planet_nirayana_longitude(planet, jd, Ayanamsa.Lahiri), expected)
+        assert error.max() <= EPHEMERIS_ERROR_BUDGET[planet][1], name
+
+
+def test_sun_against_recorded_api():
+    # recorded values are rounded to whole arc seconds
+    reference = load("api_sun_tokyo_2011.json")
+    geolocation = GeoLocation("Tokyo, Japan", 139.83, 35.65)
+    jd = np.array([to_julian_day(Time(row[0], geolocation)) for row in reference["rows"]])
+    sayana, nirayana = (np.array([row[index] for row in reference["rows"]]) for index in (1, 2))
+    budget = EPHEMERIS_ERROR_BUDGET[PlanetName.Sun][1] + 1.0
+    assert arc_seconds(planet_sayana_longitude(PlanetName.Sun, jd), sayana).max() <= budget
+    assert arc_seconds(planet_nirayana_longitude(PlanetName.Sun, jd, Ayanamsa.Lahiri), nirayana).max() <= budget
@@ -0,0 +1,20 @@
+import pytest
+
+from vedastro import GeoLocation, Time
+from vedastro.gochara import GocharaTimeline, dasa_gochara_predicates
+
+GEOLOCATION = GeoLocation("Chennai", 80.27, 13.08)
+BIRTH = Time("10:30 15/08/1990 +05:30", GEOLOCATION)
+START = Time("00:00 01/01/2024 +05:30", GEOLOCATION)
+END = Time("00:00 01/01/2025 +05:30", GEOLOCATION)
+
+
+def test_dasa_predicates_need_dasa_levels():
+    with pytest.raises(ValueError, match="dasa_levels"):
+        GocharaTimeline(BIRTH, START, END, predicates=dasa_gochara_predicates())
+
+
+def test_dasa_predicates_cover_the_range():
+    timeline = GocharaTimeline(BIRTH, START, END, predicates=dasa_gochara_predicates(), dasa_levels=1)
+    assert timeline.events
+    assert all(tag == "DasaGochara" for _, tag, _, _, _ in timeline.events)
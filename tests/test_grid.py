@@ -0,0 +1,28 @@
+import numpy as np
+
+from vedastro import Calculate, GeoLocation, HouseName, Time, ZodiacName
+from vedastro.series import clear_series_cache
+
+TIME = Time("12:00 21/06/2024 +00:00", GeoLocation("", 0.0, 0.0))
+
+
+def test_house_sign_is_sign_of_house_middle():
+    # high latitudes give unequal houses, whole sign houses would differ here
+    for house in (HouseName.House4, HouseName.House10):
+        signs = Calculate.grid("HouseSignName", TIME, (-60, 60), (-180, 180), 30, houseNumber=house)
+        middles = Calculate.grid("HouseLongitude", TIME, (-60, 60), (-180, 180), 30, houseNumber=house)
+        expected = np.array([sign.name for sign in ZodiacName], dtype=object)[(middles // 30.0).astype(int) % 12]
+        assert (signs == expected).all()
+
+
+class ErrorTextCalculate(Calculate):
+    @classmethod
+    def SunriseTime(cls, time):
+        return "Error: API request failed with status code 500" if time.geolocation.latitude > 0 else "1.5"
+
+
+def test_error_text_cells_are_missing():
+    clear_series_cache()
+    cells = ErrorTextCalculate.grid("SunriseTime", TIME, (-10, 10), (0, 0), 10, local=False)
+    assert cells.dtype == np.float64
+    assert cells[:2, 0].tolist() == [1.5, 1.5] and np.isnan(cells[2, 0])
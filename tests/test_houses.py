@@ -0,0 +1,25 @@
+import numpy as np
+
+from vedastro.houses import _ascendant_from_armc, _midheaven_from_armc, ascendant_degrees_to_armc
+
+OBLIQUITY = 23.4392911
+
+
+def apart(a, b):
+    return np.abs((np.asarray(a) - b + 180.0) % 360.0 - 180.0)
+
+
+def test_ascendant_to_armc_round_trip():
+    ascendant = np.linspace(0.5, 359.5, 72)[:, None]
+    latitude = np.array([-60.0, -23.0, 0.0, 13.08, 51.48, 60.0])
+    armc = ascendant_degrees_to_armc(ascendant, OBLIQUITY, latitude)
+    back = _ascendant_from_armc(armc, OBLIQUITY, latitude)
+    assert apart(back, ascendant).max() * 3600.0 < 1e-3
+
+
+def test_equator_angles():
+    # at the equator the MC & ascendant are 90 degrees apart on the cardinal points
+    armc = np.array([0.0, 90.0, 180.0, 270.0])
+    assert apart(_midheaven_from_armc(armc, OBLIQUITY), [0.0, 90.0, 180.0, 270.0]).max() < 1e-9
+    assert apart(_ascendant_from_armc(armc, OBLIQUITY, 0.0), [90.0, 180.0, 270.0, 0.0]).max() < 1e-9
+    assert abs(ascendant_degrees_to_armc(90.0, OBLIQUITY, 0.0)) < 1e-9
@@ -0,0 +1,22 @@
+import numpy as np
+
+from vedastro import ConstellationName, KutaMatrix
+
+# the usual Adi / Madhya / Antya nadi lists
+NADI = {
+    "Adi": ["Aswini", "Aridra", "Punarvasu", "Uttara", "Hasta", "Jyesta", "Moola", "Satabhisha", "Poorvabhadra"],
+    "Madhya": ["Bharani", "Mrigasira", "Pushyami", "Pubba", "Chitta", "Anuradha", "Poorvashada", "Dhanishta",
+               "Uttarabhadra"],
+    "Antya": ["Krithika", "Rohini", "Aslesha", "Makha", "Swathi", "Vishhaka", "Uttarashada", "Sravana", "Revathi"],
+}
+
+
+def test_nadi_matches_standard_lists():
+    nadi_of = {ConstellationName[star].value - 1: nadi for nadi, stars in NADI.items() for star in stars}
+    assert sorted(nadi_of) == list(range(27))
+
+    stars = np.arange(27)
+    # sign does not matter for nadi
+    matrix = KutaMatrix(stars, np.zeros(27, dtype=np.int64), stars, np.zeros(27, dtype=np.int64))
+    expected = np.array([[0.0 if nadi_of[male] == nadi_of[female] else 8.0 for female in stars] for male in stars])
+    np.testing.assert_array_equal(matrix.nadi, expected)
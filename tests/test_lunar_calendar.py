@@ -0,0 +1,19 @@
+from vedastro.julian_day import julian_day
+from vedastro.lunar_calendar import LunarCalendar
+
+
+def test_new_and_full_moon_against_published_times():
+    calendar = LunarCalendar(julian_day(2024, 1, 1), julian_day(2024, 6, 1))
+    # 2024-04-08 18:21 UT & 2024-01-25 17:54 UT
+    assert abs(calendar.next_new_moon(julian_day(2024, 4, 1)) - (julian_day(2024, 4, 8) + 18.35 / 24.0)) * 1440.0 < 2.0
+    assert abs(calendar.next_full_moon(julian_day(2024, 1, 20)) - (julian_day(2024, 1, 25) + 17.9 / 24.0)) * 1440.0 < 2.0
+    # that new moon opened Chaitra, Ugadi fell on the 9th
+    assert calendar.lunar_month(julian_day(2024, 4, 10)).name == "Chaitra"
+
+
+def test_adhika_sravana_2023():
+    # 2023 had an extra Sravana from the 2023-07-17 new moon to 2023-08-16
+    calendar = LunarCalendar(julian_day(2023, 6, 1), julian_day(2023, 10, 1))
+    assert calendar.lunar_month(julian_day(2023, 8, 1)).name == "SraavanaAdhika"
+    assert calendar.lunar_month(julian_day(2023, 8, 1), ignore_leap_month=True).name == "Sraavana"
+    assert calendar.lunar_month(julian_day(2023, 8, 20)).name == "Sraavana"
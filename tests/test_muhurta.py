@@ -0,0 +1,24 @@
+import numpy as np
+
+from vedastro import ConstellationName, GeoLocation, Time
+from vedastro.houses import ascendant_longitude
+from vedastro.muhurta import MuhurtaSearch
+
+# just inside the arctic circle, where some signs rise in a few minutes
+LATITUDE, LONGITUDE = 66.0, 25.0
+GEOLOCATION = GeoLocation("Rovaniemi", LONGITUDE, LATITUDE)
+
+
+def test_lagna_timeline_keeps_fast_rising_signs():
+    start = Time("00:00 01/01/2024 +00:00", GEOLOCATION)
+    end = Time("00:00 04/01/2024 +00:00", GEOLOCATION)
+    lagna = MuhurtaSearch(ConstellationName.Rohini, LATITUDE, LONGITUDE, start, end).factor("LagnaSignName")
+
+    # pieces are never empty & every sign follows the one before it
+    assert np.all(np.diff(lagna.edges) > 0.0)
+    assert np.all(np.diff(lagna.codes) % 12 == 1)
+
+    # middles of the pieces are well away from the bisected edges
+    middles = (lagna.edges[:-1] + lagna.edges[1:]) / 2.0
+    expected = np.floor(np.asarray(ascendant_longitude(middles, LATITUDE, LONGITUDE)) / 30.0) % 12
+    assert np.array_equal(lagna.codes, expected)
@@ -0,0 +1,34 @@
+import json
+import os
+
+import numpy as np
+
+from vedastro import birth_number, destiny_number, first_vowel_sound, name_number, name_number_prediction_key
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def load():
+    with open(os.path.join(DATA, "numerology_reference.json")) as file:
+        return json.load(file)
+
+
+def test_name_numbers():
+    reference = load()
+    names, numbers = zip(*reference["name_number"])
+    assert [name_number(name) for name in names] == list(numbers)
+    np.testing.assert_array_equal(name_number(list(names)), numbers)
+    for name, key in reference["name_number_prediction_key"]:
+        assert name_number_prediction_key(name) == key
+
+
+def test_first_vowel_sound():
+    for word, vowel in load()["first_vowel_sound"]:
+        assert first_vowel_sound(word) == vowel
+
+
+def test_birth_and_destiny_numbers():
+    dates, births, destinies = zip(*load()["birth_date"])
+    np.testing.assert_array_equal(birth_number(list(dates)), births)
+    np.testing.assert_array_equal(destiny_number(list(dates)), destinies)
+    assert birth_number(dates[0]) == births[0]
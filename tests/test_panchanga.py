@@ -0,0 +1,24 @@
+from vedastro import Karana
+from vedastro.julian_day import julian_day
+from vedastro.panchanga import panchanga_at_time
+
+# new moon 2024-04-08 18:21 UT, full moon 2024-01-25 17:54 UT
+NEW_MOON = julian_day(2024, 4, 8) + (18 + 21 / 60.0) / 24.0
+FULL_MOON = julian_day(2024, 1, 25) + (17 + 54 / 60.0) / 24.0
+HOUR = 1 / 24.0
+
+
+def test_new_moon():
+    before, after = panchanga_at_time(NEW_MOON - HOUR).row(0), panchanga_at_time(NEW_MOON + HOUR).row(0)
+    assert before["LunarDayName"] == "Amavasya" and before["IsNewMoon"]
+    assert before["Karana"] == Karana.Naga
+    assert after["LunarDay"] == 1 and after["LunarDayName"] == "Shukla Prathama"
+    assert after["Karana"] == Karana.Kimstughna and after["IsWaxingMoon"]
+
+
+def test_full_moon():
+    # Purnima's second half is Bava, its first half Visti
+    before, after = panchanga_at_time(FULL_MOON - HOUR).row(0), panchanga_at_time(FULL_MOON + HOUR).row(0)
+    assert before["LunarDayName"] == "Purnima" and before["Karana"] == Karana.Bava
+    assert after["LunarDayName"] == "Krishna Prathama" and after["Karana"] == Karana.Balava
+    assert panchanga_at_time(FULL_MOON - 18 * HOUR).row(0)["Karana"] == Karana.Visti
@@ -0,0 +1,34 @@
+import numpy as np
+
+from vedastro.rectification import rectify
+
+START = 2460310.5
+END = START + 1.0
+
+
+def peak_at(centre):
+    # two day-long humps, the higher one at centre
+    def score(jd):
+        jd = np.asarray(jd, dtype=np.float64)
+        return np.exp(-((jd - centre) * 24.0) ** 2) + 0.5 * np.exp(-((jd - centre - 0.5) * 24.0) ** 2)
+    return score
+
+
+def first_ranking(score):
+    return next(rectify(score, START, END, coarse_minutes=15.0, levels=0))
+
+
+def test_peak_inside_window_is_found():
+    ranking = first_ranking(peak_at(START + 0.3))
+    assert abs(ranking[0]["Time"] - (START + 0.3)) * 1440.0 <= 7.5
+
+
+def test_falling_slope_at_window_start_is_no_peak():
+    # highest hump an hour before the window, scores only fall from its start
+    ranking = first_ranking(peak_at(START - 1.0 / 24.0))
+    assert all(candidate["Time"] > START for candidate in ranking)
+
+
+def test_maximum_on_the_window_edge_is_kept():
+    ranking = first_ranking(peak_at(START))
+    assert ranking[0]["Time"] == START
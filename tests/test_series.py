@@ -0,0 +1,81 @@
+import numpy as np
+
+from vedastro import Calculate, GeoLocation, Time
+from vedastro import series
+from vedastro.series import clear_series_cache
+
+GEOLOCATION = GeoLocation("Chennai", 80.27, 13.08)
+
+
+class FlakyCalculate(Calculate):
+    @classmethod
+    def IsDayBirth(cls, birthTime):
+        if birthTime.time_string.startswith("03:00"):
+            raise ValueError("request failed")
+        return "True" if birthTime.time_string.startswith("12:00") else "False"
+
+
+def times(*hours):
+    return [Time(f"{hour} 01/01/2024 +05:30", GEOLOCATION) for hour in hours]
+
+
+def test_true_false_column_stays_bool():
+    clear_series_cache()
+    columns = FlakyCalculate.series("IsDayBirth", times("00:00", "12:00"), as_frame=False)
+    assert columns["IsDayBirth"].dtype == bool
+    assert columns["IsDayBirth"].tolist() == [False, True]
+
+
+def test_failed_row_leaves_true_false_column_numeric():
+    clear_series_cache()
+    columns = FlakyCalculate.series("IsDayBirth", times("00:00", "03:00", "12:00"), as_frame=False)
+    flags = columns["IsDayBirth"]
+    assert flags.dtype == np.float64
+    assert flags[0] == 0.0 and np.isnan(flags[1]) and flags[2] == 1.0
+    assert columns["error"][1] == "request failed"
+
+
+calls = []
+
+
+class ErrorTextCalculate(Calculate):
+    @classmethod
+    def SunriseTime(cls, time):
+        calls.append(time.time_string)
+        return "Error: API request failed with status code 500" if time.time_string.startswith("03:00") else "1.5"
+
+
+def test_error_text_is_a_failure_and_not_cached():
+    clear_series_cache()
+    calls.clear()
+    for _ in range(2):
+        columns = ErrorTextCalculate.series("SunriseTime", times("00:00", "03:00"), as_frame=False)
+        assert columns["SunriseTime"].dtype == np.float64
+        assert columns["SunriseTime"][0] == 1.5 and np.isnan(columns["SunriseTime"][1])
+        assert columns["error"][1] == "API request failed with status code 500"
+    # the good row is cached, the failed one asked for again
+    assert len(calls) == 3
+
+
+class FailResponse:
+    status_code = 200
+    text = '{"Status": "Fail", "Payload": "Time not valid"}'
+
+
+def test_fail_response_is_a_failure(monkeypatch):
+    clear_series_cache()
+    monkeypatch.setattr(series.requests, "get", lambda url: FailResponse())
+    columns = Calculate.series("IsDayBirth", times("00:00"), as_frame=False)
+    assert "IsDayBirth" not in columns
+    assert "Time not valid" in columns["error"][0]
+    assert not series._series_cache
+
+
+def test_cache_drops_least_recently_used(monkeypatch):
+    clear_series_cache()
+    monkeypatch.setattr(series, "SERIES_CACHE_SIZE", 2)
+    FlakyCalculate.series("IsDayBirth", times("00:00", "12:00"), as_frame=False)
+    FlakyCalculate.series("IsDayBirth", times("00:00"), as_frame=False)
+    FlakyCalculate.series("IsDayBirth", times("06:00"), as_frame=False)
+    kept = [key[0][:5] for key in series._series_cache]
+    assert kept == ["00:00", "06:00"]
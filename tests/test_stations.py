@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from vedastro import PlanetName
+from vedastro.julian_day import julian_day
+from vedastro.stations import MotionTimeline, planet_stations
+
+# published Mercury stations (UT), the planet hardly moves around a station so
+# its time is only sharp to some minutes
+MERCURY_STATIONS = [
+    ((2024, 3, 20), (2024, 5, 10), [julian_day(2024, 4, 1) + 22 / 24.0 + 14 / 1440.0,
+                                    julian_day(2024, 4, 25) + 12 / 24.0 + 54 / 1440.0]),
+    ((2024, 7, 20), (2024, 9, 10), [julian_day(2024, 8, 5) + 4 / 24.0 + 56 / 1440.0,
+                                    julian_day(2024, 8, 28) + 21 / 24.0 + 14 / 1440.0]),
+]
+
+
+@pytest.mark.parametrize("start, end, published", MERCURY_STATIONS)
+def test_mercury_stations_against_published_times(start, end, published):
+    times, kinds = planet_stations(PlanetName.Mercury, julian_day(*start), julian_day(*end))
+    assert kinds.tolist() == ["StationRetrograde", "StationDirect"]
+    assert np.all(np.abs(times - published) * 1440.0 < 30.0)
+
+
+def test_empty_range_has_no_stations():
+    jd = julian_day(2024, 4, 1)
+    times, kinds = planet_stations(PlanetName.Mercury, jd, jd)
+    assert times.size == 0 and kinds.size == 0
+    timeline = MotionTimeline(PlanetName.Mercury, jd, jd)
+    assert timeline.planet_motion_name(jd) == "Direct"
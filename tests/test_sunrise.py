@@ -0,0 +1,67 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from vedastro.hora import DayTimetable
+from vedastro.julian_day import julian_day
+from vedastro.sunrise import SunriseTable
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+# minutes, the days the Sun only grazes the horizon are the worst (~0.3)
+TOLERANCE = 0.5
+
+
+def load(name):
+    with open(os.path.join(DATA, name)) as file:
+        return json.load(file)
+
+
+def table(latitude, longitude, date):
+    year, month, day = (int(part) for part in date.split("-"))
+    return SunriseTable(julian_day(year, month, day), latitude, longitude)
+
+
+@pytest.mark.parametrize("name, latitude, longitude, date, sunrise, sunset", load("sunrise_reference.json")["rows"])
+def test_against_swiss_ephemeris(name, latitude, longitude, date, sunrise, sunset):
+    days = table(latitude, longitude, date)
+    assert bool(days.rises) == (sunrise is not None)
+    assert bool(days.sets) == (sunset is not None)
+    for local, expected in ((days.sunrise, sunrise), (days.sunset, sunset)):
+        if expected is None:
+            assert np.isnan(local)
+        else:
+            assert abs(float(local) - expected) * 1440.0 < TOLERANCE
+
+
+def test_day_polar_day_starts_keeps_its_sunrise():
+    # Tromso, the Sun rises just after midnight then stays up
+    days = table(69.65, 18.96, "2024-05-21")
+    assert days.rises and not days.sets
+    assert not days.polar_day and not days.polar_night
+    assert not days.is_daytime(days.sunrise - 0.01) and days.is_daytime(days.sunrise + 0.3)
+
+
+def test_day_polar_day_ends_keeps_its_sunset():
+    days = table(69.65, 18.96, "2024-07-21")
+    assert days.sets and not days.rises
+    assert days.is_daytime(days.sunset - 0.3) and not days.is_daytime(days.sunset + 0.01)
+
+
+def test_timetable_needs_sunrise_and_sunset():
+    with pytest.raises(ValueError):
+        DayTimetable(julian_day(2024, 5, 21), 69.65, 18.96)
+    DayTimetable(julian_day(2024, 3, 20), 69.65, 18.96)
+
+
+def test_yamas_are_six_ghatikas_from_sunrise():
+    # Chennai, day & night differ in length but every yama is a tenth of the vedic day
+    days = DayTimetable(julian_day(2024, 6, 21), 13.08, 80.27)
+    length = days.next_sunrise[0, 0] - days.sunrise[0, 0]
+    assert np.allclose(np.diff(days.yama_edges[0, 0]), length / 10.0)
+    assert abs(length / 10.0 * 24.0 - 2.4) < 0.05
+    assert days.birth_yama(days.sunrise[0, 0] + 0.01) == 1
+    assert days.birth_yama(days.sunrise[0, 0] + length * 0.55) == 6
+    assert days.birth_yama(days.next_sunrise[0, 0] - 0.01) == 10
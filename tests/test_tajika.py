@@ -0,0 +1,21 @@
+from vedastro import Ayanamsa, PlanetName
+from vedastro.julian_day import julian_day
+from vedastro.tajika import RAMAN_YEAR_DAYS, solar_return, tajika_date_for_year
+from vedastro.transit import planet_sign_transit
+
+# Mesha sankranti 2024, 21:15 IST in the panchangas
+MESHA_SANKRANTI_2024 = julian_day(2024, 4, 13) + (21 + 15 / 60.0 - 5.5) / 24.0
+
+
+def test_return_of_a_sankranti_birth_is_the_next_sankranti():
+    # born as the Sun entered Aries in 2023, it returns there at the 2024 sankranti
+    birth = planet_sign_transit(PlanetName.Sun, julian_day(2023, 4, 10), julian_day(2023, 4, 20), Ayanamsa.Lahiri)[0][0]
+    returned = solar_return(birth, 2024, Ayanamsa.Lahiri)
+    ingress = planet_sign_transit(PlanetName.Sun, julian_day(2024, 4, 10), julian_day(2024, 4, 20), Ayanamsa.Lahiri)[0][0]
+    assert abs(returned - ingress) * 86400.0 < 2.0
+    assert abs(returned - MESHA_SANKRANTI_2024) * 1440.0 < 20.0
+
+
+def test_raman_years_are_counted_from_birth():
+    birth = julian_day(1990, 6, 1)
+    assert tajika_date_for_year(birth, [1990, 2000]).tolist() == [birth, birth + 10 * RAMAN_YEAR_DAYS]
@@ -0,0 +1,28 @@
+import pytest
+
+from vedastro import Ayanamsa, PlanetName, ZodiacName
+from vedastro.julian_day import julian_day
+from vedastro.transit import ingress_times, planet_sign_transit
+
+# sankranti moments printed in panchangas (IST), their Lahiri differs from the
+# local one by some arcseconds so the Sun may come a quarter hour apart
+SANKRANTIS = [
+    (ZodiacName.Capricorn, julian_day(2024, 1, 15) + (2 + 54 / 60.0 - 5.5) / 24.0),
+    (ZodiacName.Aries, julian_day(2024, 4, 13) + (21 + 15 / 60.0 - 5.5) / 24.0),
+]
+
+
+@pytest.mark.parametrize("sign, published", SANKRANTIS)
+def test_sun_sankranti_against_panchanga(sign, published):
+    entered = planet_sign_transit(PlanetName.Sun, published - 3.0, published + 3.0, Ayanamsa.Lahiri)
+    assert [name for _, name in entered] == [sign]
+    assert abs(entered[0][0] - published) * 1440.0 < 20.0
+
+
+def test_ingress_to_the_second():
+    times, before, after = ingress_times(PlanetName.Moon, julian_day(2024, 1, 1), julian_day(2024, 1, 8),
+                                         ayanamsa=Ayanamsa.Lahiri)
+    assert ((after - before) % 12 == 1).all()
+    finer, _, _ = ingress_times(PlanetName.Moon, julian_day(2024, 1, 1), julian_day(2024, 1, 8),
+                                ayanamsa=Ayanamsa.Lahiri, tolerance_seconds=0.01)
+    assert (abs(times - finer) * 86400.0 < 1.0).all()
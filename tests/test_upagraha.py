@@ -0,0 +1,26 @@
+import numpy as np
+
+from vedastro import PlanetName
+from vedastro.julian_day import julian_day
+from vedastro.upagraha import sun_based_upagrahas, upagraha_part_number
+
+
+def test_sun_based_upagrahas_with_sun_at_zero_aries():
+    # Dhuma 13 20 Leo & Upaketu always 30 degrees behind the Sun
+    upagrahas = sun_based_upagrahas(np.array([0.0, 100.0]))
+    assert np.allclose(upagrahas["Dhuma"], [133.0 + 1 / 3.0, 233.0 + 1 / 3.0])
+    assert np.allclose(upagrahas["Vyatipaata"][0], 226.0 + 2 / 3.0)
+    assert np.allclose(upagrahas["Parivesha"][0], 46.0 + 2 / 3.0)
+    assert np.allclose(upagrahas["Indrachaapa"][0], 313.0 + 1 / 3.0)
+    assert np.allclose(upagrahas["Upaketu"], [330.0, 70.0])
+
+
+def test_gulika_part_through_the_week():
+    # Gulika rises in the 7th part on Sunday by day, one part earlier each
+    # day after, & by night in the 3rd part on Sunday
+    sunday = julian_day(2024, 1, 7)
+    sunrise = sunday + np.arange(7) + 0.25
+    day = upagraha_part_number(sunrise + 0.1, PlanetName.Saturn, sunrise, sunrise + 0.5, sunrise + 1.0, 0.0)
+    night = upagraha_part_number(sunrise + 0.6, PlanetName.Saturn, sunrise, sunrise + 0.5, sunrise + 1.0, 0.0)
+    assert day.tolist() == [7, 6, 5, 4, 3, 2, 1]
+    assert night.tolist() == [3, 2, 1, 7, 6, 5, 4]
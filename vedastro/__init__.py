@@ -9,5 +9,32 @@ check_for_update("vedastro")
 
 from.vedastro import *
 from.calculate import *
+from.julian_day import *
+from.tables import *
+from.ayanamsa import *
+from.ephemeris import *
+from.panchanga import *
+from.dasa import *
+from.ashtakavarga import *
+from.aspects import *
+from.houses import *
+from.upagraha import *
+from.kuta import *
+from.numerology import *
+from.dotnet_backend import *
+from.sunrise import *
+from.shadbala import *
+from.hora import *
+from.tajika import *
+from.transit import *
+from.eclipse import *
+from.lunar_calendar import *
+from.stations import *
+from.series import *
+from.grid import *
+from.gochara import *
+from.rectification import *
+from.chart_graph import *
+from.muhurta import *
 
 
@@ -0,0 +1,141 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .tables import sign_index
+
+__all__ = [
+    "ASHTAKAVARGA_PLANETS",
+    "ASHTAKAVARGA_CONTRIBUTORS",
+    "Ashtakavarga",
+]
+
+# planets that get an ashtakavarga & the 8 contributors, Lagna last
+ASHTAKAVARGA_PLANETS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury,
+    PlanetName.Jupiter, PlanetName.Venus, PlanetName.Saturn,
+]
+ASHTAKAVARGA_CONTRIBUTORS = ASHTAKAVARGA_PLANETS + ["Lagna"]
+
+# houses (counted from the contributor) where each contributor gives a bindu
+# to each planet, as given by Parashara, in the contributor order above
+_BINDU_HOUSES = {
+    PlanetName.Sun: [
+        (1, 2, 4, 7, 8, 9, 10, 11), (3, 6, 10, 11), (1, 2, 4, 7, 8, 9, 10, 11), (3, 5, 6, 9, 10, 11, 12),
+        (5, 6, 9, 11), (6, 7, 12), (1, 2, 4, 7, 8, 9, 10, 11), (3, 4, 6, 10, 11, 12),
+    ],
+    PlanetName.Moon: [
+        (3, 6, 7, 8, 10, 11), (1, 3, 6, 7, 10, 11), (2, 3, 5, 6, 9, 10, 11), (1, 3, 4, 5, 7, 8, 10, 11),
+        (1, 4, 7, 8, 10, 11, 12), (3, 4, 5, 7, 9, 10, 11), (3, 5, 6, 11), (3, 6, 10, 11),
+    ],
+    PlanetName.Mars: [
+        (3, 5, 6, 10, 11), (3, 6, 11), (1, 2, 4, 7, 8, 10, 11), (3, 5, 6, 11),
+        (6, 10, 11, 12), (6, 8, 11, 12), (1, 4, 7, 8, 9, 10, 11), (1, 3, 6, 10, 11),
+    ],
+    PlanetName.Mercury: [
+        (5, 6, 9, 11, 12), (2, 4, 6, 8, 10, 11), (1, 2, 4, 7, 8, 9, 10, 11), (1, 3, 5, 6, 9, 10, 11, 12),
+        (6, 8, 11, 12), (1, 2, 3, 4, 5, 8, 9, 11), (1, 2, 4, 7, 8, 9, 10, 11), (1, 2, 4, 6, 8, 10, 11),
+    ],
+    PlanetName.Jupiter: [
+        (1, 2, 3, 4, 7, 8, 9, 10, 11), (2, 5, 7, 9, 11), (1, 2, 4, 7, 8, 10, 11), (1, 2, 4, 5, 6, 9, 10, 11),
+        (1, 2, 3, 4, 7, 8, 10, 11), (2, 5, 6, 9, 10, 11), (3, 5, 6, 12), (1, 2, 4, 5, 6, 7, 9, 10, 11),
+    ],
+    PlanetName.Venus: [
+        (8, 11, 12), (1, 2, 3, 4, 5, 8, 9, 11, 12), (3, 5, 6, 9, 11, 12), (3, 5, 6, 9, 11),
+        (5, 8, 9, 10, 11), (1, 2, 3, 4, 5, 8, 9, 10, 11), (3, 4, 5, 8, 9, 10, 11), (1, 2, 3, 4, 5, 8, 9, 11),
+    ],
+    PlanetName.Saturn: [
+        (1, 2, 4, 7, 8, 10, 11), (3, 6, 11), (3, 5, 6, 10, 11, 12), (6, 8, 9, 10, 11, 12),
+        (5, 6, 11, 12), (6, 11, 12), (3, 5, 6, 11), (1, 3, 4, 6, 10, 11),
+    ],
+}
+
+# same table as a (planet, contributor, house offset) 0/1 array
+_BINDU_TABLE = np.zeros((7, 8, 12), dtype=np.int8)
+for _planet_index, _planet in enumerate(ASHTAKAVARGA_PLANETS):
+    for _contributor_index, _houses in enumerate(_BINDU_HOUSES[_planet]):
+        _BINDU_TABLE[_planet_index, _contributor_index, [house - 1 for house in _houses]] = 1
+
+# table rotated for every sign a contributor can sit in, so a whole chart is
+# a gather of 8 ready made (7, 12) blocks: (contributor, sign, planet, sign)
+_ROTATED_TABLE = np.stack([
+    np.stack([np.roll(_BINDU_TABLE[:, contributor, :], sign, axis=-1) for sign in range(12)])
+    for contributor in range(8)
+])
+
+
+def _planet_index(planet):
+    return ASHTAKAVARGA_PLANETS.index(planet)
+
+
+class Ashtakavarga:
+    def __init__(self, signs):
+        """
+        Bindu tables for many charts in one vectorised pass.
+
+        Args:
+        signs (array): Sign index 0-11 (Aries = 0) of Sun, Moon, Mars, Mercury,
+            Jupiter, Venus, Saturn & Lagna, shape (8,) for one chart or (N, 8).
+
+        Attributes (N = number of charts, dropped for a single chart):
+        prastara: (N, 7, 8, 12) bindu given by each contributor to each planet in each sign
+        bhinna: (N, 7, 12) bhinnashtakavarga, bindus of each planet in each sign
+        sarva: (N, 12) sarvashtakavarga, total bindus in each sign
+        """
+        signs = np.asarray(signs, dtype=np.int64)
+        self.single_chart = signs.ndim == 1
+        signs = np.atleast_2d(signs) % 12
+        self.signs = signs[0] if self.single_chart else signs
+
+        # one rotated block per contributor: (N, 8, 7, 12) -> (N, 7, 8, 12)
+        self.prastara = _ROTATED_TABLE[np.arange(8), signs].transpose(0, 2, 1, 3)
+
+        self.bhinna = self.prastara.sum(axis=2, dtype=np.int16)
+        self.sarva = self.bhinna.sum(axis=1, dtype=np.int16)
+
+        if self.single_chart:
+            self.prastara, self.bhinna, self.sarva = self.prastara[0], self.bhinna[0], self.sarva[0]
+
+    @classmethod
+    def from_longitudes(cls, longitudes):
+        """
+        Same as above but from nirayana longitudes in degrees, (8,) or (N, 8).
+        """
+        return cls(np.floor(np.asarray(longitudes, dtype=np.float64) % 360.0 / 30.0).astype(np.int64))
+
+    def bhinnashtakavarga_chart(self):
+        """
+        Same content as Calculate.BhinnashtakavargaChart, planet -> 12 bindus.
+        """
+        return {planet.value: self.bhinna[..., index, :] for index, planet in enumerate(ASHTAKAVARGA_PLANETS)}
+
+    def sarvashtakavarga_chart(self):
+        """
+        Same content as Calculate.SarvashtakavargaChart, 12 bindus from Aries.
+        """
+        return self.sarva
+
+    def planet_ashtakvarga_bindu(self, planet, sign):
+        """
+        Bindus of a planet in a sign, like Calculate.PlanetAshtakvargaBindu.
+        """
+        return self.bhinna[..., _planet_index(planet), sign_index(sign)]
+
+    def planet_ashtakvarga_bindu_by_planet(self, main_planet, planet_to_check):
+        """
+        Bindus contributed by one planet to main planet's table, per sign,
+        like Calculate.PlanetAshtakvargaBinduByPlanet.
+
+        planet_to_check can also be "Lagna".
+        """
+        return self.prastara[..., _planet_index(main_planet), ASHTAKAVARGA_CONTRIBUTORS.index(planet_to_check), :]
+
+    def planet_own_ashtakvarga_bindu(self, planet):
+        """
+        Bindus in the planet's own table at the sign it occupies, like
+        Calculate.PlanetOwnAshtakvargaBindu.
+        """
+        index = _planet_index(planet)
+        signs = np.atleast_2d(self.signs)
+        bhinna = self.bhinna.reshape(-1, 7, 12)
+        bindus = bhinna[np.arange(len(signs)), index, signs[:, index]]
+        return bindus[0] if self.single_chart else bindus
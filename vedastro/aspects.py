@@ -0,0 +1,189 @@
+import numpy as np
+
+from .vedastro import HouseName, PlanetName
+from .tables import house_index
+
+__all__ = [
+    "ASPECT_PLANETS",
+    "ASPECTED_HOUSES",
+    "ASPECT_TABLE",
+    "find_drishti_value",
+    "find_visesha_drishti",
+    "drishti_matrix",
+    "AspectMatrix",
+]
+
+# row/column order of every matrix in this module
+ASPECT_PLANETS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury, PlanetName.Jupiter,
+    PlanetName.Venus, PlanetName.Saturn, PlanetName.Rahu, PlanetName.Ketu,
+]
+
+# houses counted from the planet that get its full sign aspect, all planets
+# aspect the 7th, Mars, Jupiter & Saturn have their special aspects on top
+ASPECTED_HOUSES = {planet: (7,) for planet in ASPECT_PLANETS}
+ASPECTED_HOUSES[PlanetName.Mars] = (4, 7, 8)
+ASPECTED_HOUSES[PlanetName.Jupiter] = (5, 7, 9)
+ASPECTED_HOUSES[PlanetName.Saturn] = (3, 7, 10)
+
+# (planet in ASPECT_PLANETS order, sign count - 1) -> aspects or not
+ASPECT_TABLE = np.zeros((9, 12), dtype=bool)
+for _index, _planet in enumerate(ASPECT_PLANETS):
+    ASPECT_TABLE[_index, [house - 1 for house in ASPECTED_HOUSES[_planet]]] = True
+
+# special (visesha) drishti bonus in virupas & the arcs where it applies
+_VISESHA = {
+    PlanetName.Saturn: (45.0, ((60.0, 90.0), (270.0, 300.0))),
+    PlanetName.Jupiter: (30.0, ((120.0, 150.0), (240.0, 270.0))),
+    PlanetName.Mars: (15.0, ((90.0, 120.0), (210.0, 240.0))),
+}
+
+
+def find_drishti_value(dk):
+    """
+    Aspect strength in virupas (0-60) for the distance dk in degrees from the
+    aspecting planet to the aspected point, like Calculate.FindDrishtiValue.
+    Works on arrays of any shape.
+    """
+    dk = np.asarray(dk, dtype=np.float64) % 360.0
+    conditions = [dk < 30, dk < 60, dk < 90, dk < 120, dk < 150, dk < 180, dk < 300]
+    choices = [
+        np.zeros_like(dk),
+        (dk - 30.0) / 2.0,
+        dk - 60.0 + 15.0,
+        (120.0 - dk) / 2.0 + 30.0,
+        150.0 - dk,
+        (dk - 150.0) * 2.0,
+        (300.0 - dk) / 2.0,
+    ]
+    value = np.select(conditions, choices, default=0.0)
+    return value if value.ndim else float(value)
+
+
+def find_visesha_drishti(dk, planet):
+    """
+    Extra strength for the special aspects of Mars, Jupiter & Saturn, like
+    Calculate.FindViseshaDrishti, 0 for every other planet.
+    """
+    dk = np.asarray(dk, dtype=np.float64) % 360.0
+    bonus, arcs = _VISESHA.get(planet, (0.0, ()))
+    hit = np.zeros(dk.shape, dtype=bool)
+    for low, high in arcs:
+        hit |= (dk >= low) & (dk <= high)
+    value = np.where(hit, bonus, 0.0)
+    return value if value.ndim else float(value)
+
+
+def drishti_matrix(transmitter_longitudes, receiver_longitudes):
+    """
+    Drishti (virupas) of every transmitter on every receiver, visesha included.
+
+    Args:
+    transmitter_longitudes (array): (..., 9) longitudes in ASPECT_PLANETS order.
+    receiver_longitudes (array): (..., K) longitudes of the aspected points.
+
+    Returns (..., 9, K) array, batch dimensions are kept.
+    """
+    transmitters = np.asarray(transmitter_longitudes, dtype=np.float64)
+    receivers = np.asarray(receiver_longitudes, dtype=np.float64)
+    dk = (receivers[..., None, :] - transmitters[..., :, None]) % 360.0
+
+    strength = find_drishti_value(dk)
+    for planet in _VISESHA:
+        index = ASPECT_PLANETS.index(planet)
+        strength[..., index, :] += find_visesha_drishti(dk[..., index, :], planet)
+    return strength
+
+
+def _sign(longitudes):
+    return np.floor(np.asarray(longitudes, dtype=np.float64) % 360.0 / 30.0).astype(np.int64)
+
+
+def _planet_index(planet):
+    return ASPECT_PLANETS.index(planet)
+
+
+class AspectMatrix:
+    def __init__(self, planet_longitudes, house_longitudes=None, ascendant_longitude=None):
+        """
+        Full 9x9 planet-planet & 9x12 planet-house aspect matrices for one
+        chart, every aspect question is then a lookup.
+
+        Args:
+        planet_longitudes: Nirayana longitudes in ASPECT_PLANETS order, or a
+            dict of PlanetName -> longitude.
+        house_longitudes (array): Middle longitude of the 12 houses.
+        ascendant_longitude (float): Used for equal houses when house
+            longitudes are not given.
+
+        Matrices are indexed [aspecting planet, aspected planet/house]:
+        planet_aspect, house_aspect: sign based graha drishti (bool)
+        planet_drishti, house_drishti: drishti strength in virupas
+        """
+        if isinstance(planet_longitudes, dict):
+            planet_longitudes = [planet_longitudes[planet] for planet in ASPECT_PLANETS]
+        self.planet_longitudes = np.asarray(planet_longitudes, dtype=np.float64) % 360.0
+        if house_longitudes is None:
+            if ascendant_longitude is None:
+                raise ValueError("Need house longitudes or the ascendant longitude")
+            house_longitudes = float(ascendant_longitude) + 30.0 * np.arange(12)
+        self.house_longitudes = np.asarray(house_longitudes, dtype=np.float64) % 360.0
+
+        planet_signs = _sign(self.planet_longitudes)
+        house_signs = _sign(self.house_longitudes)
+        rows = np.arange(9)[:, None]
+
+        # sign count from aspecting planet to the aspected sign, 0 = same sign
+        planet_count = (planet_signs[None, :] - planet_signs[:, None]) % 12
+        self.planet_aspect = ASPECT_TABLE[rows, planet_count]
+        np.fill_diagonal(self.planet_aspect, False)
+
+        house_count = (house_signs[None, :] - planet_signs[:, None]) % 12
+        self.house_aspect = ASPECT_TABLE[rows, house_count]
+
+        self.planet_drishti = drishti_matrix(self.planet_longitudes, self.planet_longitudes)
+        np.fill_diagonal(self.planet_drishti, 0.0)
+        self.house_drishti = drishti_matrix(self.planet_longitudes, self.house_longitudes)
+
+    def planets_in_aspect(self, planet):
+        """
+        Planets aspected by the given planet, like Calculate.PlanetsInAspect.
+        """
+        row = self.planet_aspect[_planet_index(planet)]
+        return [ASPECT_PLANETS[index] for index in np.flatnonzero(row)]
+
+    def houses_in_aspect(self, planet):
+        """
+        Houses aspected by the given planet, like Calculate.HousesInAspect.
+        """
+        row = self.house_aspect[_planet_index(planet)]
+        return [list(HouseName)[index] for index in np.flatnonzero(row)]
+
+    def planets_aspecting_planet(self, receiving_planet):
+        """
+        Like Calculate.PlanetsAspectingPlanet.
+        """
+        column = self.planet_aspect[:, _planet_index(receiving_planet)]
+        return [ASPECT_PLANETS[index] for index in np.flatnonzero(column)]
+
+    def planets_aspecting_house(self, house):
+        """
+        Like Calculate.PlanetsAspectingHouse.
+        """
+        column = self.house_aspect[:, house_index(house)]
+        return [ASPECT_PLANETS[index] for index in np.flatnonzero(column)]
+
+    def is_planet_aspected_by_planet(self, receiving_planet, transmitting_planet):
+        return bool(self.planet_aspect[_planet_index(transmitting_planet), _planet_index(receiving_planet)])
+
+    def is_house_aspected_by_planet(self, receiving_house, transmitting_planet):
+        return bool(self.house_aspect[_planet_index(transmitting_planet), house_index(receiving_house)])
+
+    def planet_aspect_degree(self, receiver, transmitter):
+        """
+        Drishti strength in virupas, like Calculate.PlanetAspectDegree.
+        """
+        return float(self.planet_drishti[_planet_index(transmitter), _planet_index(receiver)])
+
+    def house_aspect_degree(self, house, transmitter):
+        return float(self.house_drishti[_planet_index(transmitter), house_index(house)])
@@ -0,0 +1,164 @@
+import numpy as np
+
+from .vedastro import Ayanamsa
+from .julian_day import J2000, julian_centuries, to_julian_day
+from .validation import parity_table
+
+__all__ = [
+    "AYANAMSA_REFERENCE",
+    "API_AYANAMSA",
+    "default_ayanamsa",
+    "general_precession",
+    "ayanamsa_degree",
+    "nirayana_longitude",
+    "sayana_longitude",
+    "ayanamsa_parity_table",
+]
+
+# ayanamsa the API answers in, the HTTP client has no way to ask for another
+API_AYANAMSA = Ayanamsa.Lahiri
+
+# B1950 (Besselian) & J1900 epochs, used by the epoch based systems below
+_B1950 = 2433282.42345905
+_J1900 = 2415020.0
+
+# ayanamsa of every system at its reference epoch as (julian day, degrees),
+# values at J2000 are the mean ayanamsa given by Swiss Ephemeris 2.10 which
+# is what the API runs on
+AYANAMSA_REFERENCE = {
+    Ayanamsa.Fagan_Bradley: (J2000, 24.7403000),
+    Ayanamsa.Lahiri: (J2000, 23.8570923),
+    Ayanamsa.Deluce: (J2000, 27.8157528),
+    Ayanamsa.Raman: (J2000, 22.4107910),
+    Ayanamsa.Ushashashi: (J2000, 20.0575410),
+    Ayanamsa.Krishnamurti: (J2000, 23.7602400),
+    Ayanamsa.Djwhal_Khul: (J2000, 28.3596786),
+    Ayanamsa.Yukteshwar: (J2000, 22.4788030),
+    Ayanamsa.Jn_Bhasin: (J2000, 22.7621370),
+    Ayanamsa.Babyl_Kugler1: (J2000, 23.5336399),
+    Ayanamsa.Babyl_Kugler2: (J2000, 24.9336399),
+    Ayanamsa.Babyl_Kugler3: (J2000, 25.7836399),
+    Ayanamsa.Babyl_Huber: (J2000, 24.7336399),
+    Ayanamsa.Babyl_Etpsc: (J2000, 24.5225279),
+    Ayanamsa.Aldebaran_15Tau: (J2000, 24.7589239),
+    Ayanamsa.Hipparchos: (J2000, 20.2477881),
+    Ayanamsa.Sassanian: (J2000, 19.9929594),
+    Ayanamsa.Galcent_0Sag: (J2000, 26.8460458),
+    Ayanamsa.J2000: (J2000, 0.0),
+    Ayanamsa.J1900: (_J1900, 0.0),
+    Ayanamsa.B1950: (_B1950, 0.0),
+    Ayanamsa.Suryasiddhanta: (J2000, 20.8950588),
+    Ayanamsa.Suryasiddhanta_MSun: (J2000, 20.6804249),
+    Ayanamsa.Aryabhata: (J2000, 20.8950597),
+    Ayanamsa.Aryabhata_MSun: (J2000, 20.6574273),
+    Ayanamsa.Ss_Revati: (J2000, 20.1033884),
+    Ayanamsa.Ss_Citra: (J2000, 23.0057633),
+    Ayanamsa.True_Citra: (J2000, 23.8400149),
+    Ayanamsa.True_Revati: (J2000, 20.0451646),
+    Ayanamsa.True_Pushya: (J2000, 22.7270916),
+    Ayanamsa.Galcent_Rgbrand: (J2000, 22.4691048),
+    Ayanamsa.Galequ_Iau1958: (J2000, 30.0231725),
+    Ayanamsa.Galequ_True: (J2000, 30.0760922),
+    Ayanamsa.Galequ_Mula: (J2000, 23.4094255),
+    Ayanamsa.Galalign_Mardyks: (J2000, 30.0177939),
+    Ayanamsa.True_Mula: (J2000, 24.5799729),
+    Ayanamsa.Galcent_Mula_Wilhelm: (J2000, 20.0392331),
+    Ayanamsa.Aryabhata_522: (J2000, 20.5758470),
+    Ayanamsa.Babyl_Britton: (J2000, 24.6157528),
+    Ayanamsa.True_Sheoran: (J2000, 25.2344493),
+    Ayanamsa.Galcent_Cochrane: (J2000, 356.8460458),
+    Ayanamsa.Galequ_Fiorenza: (J2000, 25.0000191),
+    Ayanamsa.Valens_Moon: (J2000, 22.7956093),
+    Ayanamsa.Lahiri_1940: (J2000, 23.8423232),
+    Ayanamsa.Lahiri_VP285: (J2000, 23.8634812),
+    Ayanamsa.Krishnamurti_VP291: (J2000, 23.7803650),
+    Ayanamsa.Lahiri_ICRC: (J2000, 23.8567890),
+}
+
+# star & galactic systems follow a reference point that moves against the
+# ecliptic on its own (proper motion, galactic plane geometry), this extra
+# drift in arc seconds per century keeps them within about 3 arc seconds of
+# Swiss Ephemeris between 1500 and 2200 (Galcent_Mula_Wilhelm ~19 by 1500),
+# others move with precession alone. tests/test_ayanamsa.py checks this
+_REFERENCE_DRIFT = {
+    Ayanamsa.True_Citra: -5.063,
+    Ayanamsa.True_Revati: 11.684,
+    Ayanamsa.True_Pushya: 3.799,
+    Ayanamsa.True_Sheoran: 3.799,
+    Ayanamsa.True_Mula: -1.225,
+    Ayanamsa.Galequ_Iau1958: 26.519,
+    Ayanamsa.Galequ_True: 26.511,
+    Ayanamsa.Galequ_Mula: 26.511,
+    Ayanamsa.Galcent_Mula_Wilhelm: 221.599,
+}
+
+
+def default_ayanamsa():
+    """
+    Ayanamsa used when none is given, follows Calculate.Ayanamsa so the
+    usual `Calculate.Ayanamsa = Ayanamsa.Raman` line also applies locally.
+    """
+    from .calculate import Calculate
+    chosen = getattr(Calculate, "Ayanamsa", None)
+    return chosen if isinstance(chosen, Ayanamsa) else Ayanamsa.Lahiri
+
+
+def general_precession(jd):
+    """
+    Accumulated general precession in longitude since J2000 in degrees
+    (IAU 1976, Lieske et al.), negative before J2000.
+    """
+    t = julian_centuries(jd)
+    return (5029.0966 * t + 1.11113 * t ** 2 - 0.000006 * t ** 3) / 3600.0
+
+
+def ayanamsa_degree(times, ayanamsa=None):
+    """
+    Local equivalent of Calculate.AyanamsaDegree for many times at once.
+
+    Args:
+    times: Julian days, Time objects, datetimes or datetime64 arrays.
+    ayanamsa (Ayanamsa): System to use, defaults to Calculate.Ayanamsa or Lahiri.
+
+    Returns degrees as float for a single time, else a float64 array.
+    """
+    ayanamsa = ayanamsa if ayanamsa is not None else default_ayanamsa()
+    reference_jd, reference_value = AYANAMSA_REFERENCE[ayanamsa]
+    jd = to_julian_day(times)
+    drift = _REFERENCE_DRIFT.get(ayanamsa, 0.0) * (julian_centuries(jd) - julian_centuries(reference_jd)) / 3600.0
+    degrees = (reference_value + general_precession(jd) - general_precession(reference_jd) + drift) % 360.0
+    return degrees if np.ndim(degrees) else float(degrees)
+
+
+def nirayana_longitude(sayana_longitude, times, ayanamsa=None):
+    """
+    Sayana (tropical) to Nirayana (sidereal) longitude without an API call,
+    eg: the TotalDegrees of Calculate.PlanetSayanaLongitude.
+    """
+    longitude = (np.asarray(sayana_longitude, dtype=np.float64) - ayanamsa_degree(times, ayanamsa)) % 360.0
+    return longitude if longitude.ndim else float(longitude)
+
+
+def sayana_longitude(nirayana_longitude, times, ayanamsa=None):
+    """
+    Nirayana (sidereal) back to Sayana (tropical) longitude.
+    """
+    longitude = (np.asarray(nirayana_longitude, dtype=np.float64) + ayanamsa_degree(times, ayanamsa)) % 360.0
+    return longitude if longitude.ndim else float(longitude)
+
+
+def ayanamsa_parity_table(times):
+    """
+    Compare local ayanamsa against Calculate.AyanamsaDegree, one API call
+    per row. The HTTP client sends no ayanamsa, so only the server's own
+    API_AYANAMSA can be checked this way, the other systems are checked
+    against reference values in tests/test_ayanamsa.py.
+
+    Args:
+    times (list): Time objects to check.
+    """
+    from .calculate import Calculate
+
+    cases = [(API_AYANAMSA, time) for time in times]
+    return parity_table(cases, lambda case: ayanamsa_degree(case[1], case[0]),
+                        lambda case: Calculate.AyanamsaDegree(case[1]))
@@ -0,0 +1,226 @@
+import numpy as np
+
+from .vedastro import ConstellationName, ZodiacName
+from .julian_day import to_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .houses import ascendant_longitude
+from .aspects import ASPECT_PLANETS, ASPECT_TABLE
+from .shadbala import Shadbala, SHADBALA_PLANETS
+
+__all__ = [
+    "BALADI_AVASTHAS",
+    "ChartNode",
+    "IncrementalChart",
+]
+
+# baladi avastha by 6 degree part of the sign, odd signs, even signs run backwards
+BALADI_AVASTHAS = ["Bala", "Kumara", "Yuva", "Vriddha", "Mrita"]
+
+# values worked out from the time itself every frame, everything else hangs off these
+_SOURCES = ("jd", "longitudes", "ascendant")
+
+# fastest daily motion (degrees) with some margin, bounds how soon a planet
+# can reach the next boundary, mean nodes for Rahu & Ketu
+_MAX_SPEED = np.array([1.1, 16.0, 0.9, 2.4, 0.3, 1.4, 0.15, 0.06, 0.06])
+
+_SIGNS = list(ZodiacName)
+_CONSTELLATIONS = [name for name in ConstellationName if name.value > 0]
+_NAVAMSA_SPAN = 30.0 / 9.0
+
+
+class ChartNode:
+    def __init__(self, name, inputs, key, compute):
+        """
+        One derived quantity of the chart.
+
+        Args:
+        name (str): Name its value is stored under.
+        inputs (tuple): Sources ("jd", "longitudes", "ascendant") or names of
+            nodes added before this one.
+        key (callable): key(*input values) -> hashable, the value only
+            changes when the key does, eg: the sign index of each planet.
+        compute (callable): compute(*input values) -> value.
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.key = key
+        self.compute = compute
+        self.last_key = None
+        self.computed = 0
+        self.skipped = 0
+
+
+def _indexes(longitudes, span):
+    return tuple(np.floor(np.asarray(longitudes) / span).astype(np.int64).tolist())
+
+
+def _baladi(longitudes):
+    part = np.floor(longitudes % 30.0 / 6.0).astype(np.int64)
+    odd = np.floor(longitudes / 30.0).astype(np.int64) % 2 == 0
+    return [BALADI_AVASTHAS[index] for index in np.where(odd, part, 4 - part)]
+
+
+def _aspects(signs, lagna_sign):
+    # sign count from each aspecting planet to every planet & house, 0 = same sign
+    signs = np.asarray(signs)
+    rows = np.arange(len(ASPECT_PLANETS))[:, None]
+    planet_aspect = ASPECT_TABLE[rows, (signs[None, :] - signs[:, None]) % 12]
+    np.fill_diagonal(planet_aspect, False)
+    house_signs = (lagna_sign + np.arange(12)) % 12
+    house_aspect = ASPECT_TABLE[rows, (house_signs[None, :] - signs[:, None]) % 12]
+    return {"planet_aspect": planet_aspect, "house_aspect": house_aspect}
+
+
+class IncrementalChart:
+    def __init__(self, latitude, longitude, ayanamsa=None, strength_minutes=60.0, position_spans=None):
+        """
+        Chart for scrubbing through time, every derived quantity is a node
+        declaring its inputs & a boundary key, moving the time recomputes
+        only the nodes whose key changed, eg: aspects wait for a sign change.
+
+        Args:
+        latitude, longitude (float): Place of the chart.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+        strength_minutes (float): Shadbala moves with time itself, it is
+            redone when a planet changes navamsa, the lagna changes sign or
+            this many minutes have passed.
+        position_spans (tuple): Widths in degrees of every boundary the nodes
+            read off planet longitudes, defaults to signs, constellations,
+            navamsas & avastha parts. A planet's longitude is only refreshed
+            once it could have reached one of these at its fastest speed, so
+            values["longitudes"] is exact up to those boundaries. () to
+            refresh every planet every frame.
+
+        Built in nodes: signs, constellations, navamsas, lagna_sign, houses
+        (whole sign), aspects (sign based), avasthas (baladi) & strengths
+        (shadbala pinda). add_node adds more. After set_time, values holds
+        every value, last_frame the names computed & skipped that frame.
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.ayanamsa = ayanamsa
+        self.nodes = {}
+        self.values = {}
+        self.frames = 0
+        self.last_frame = {}
+        self.spans = np.array((30.0, 360.0 / 27.0, _NAVAMSA_SPAN, 6.0) if position_spans is None else position_spans)
+        self.positions_refreshed = 0
+        self.positions_reused = 0
+        self._refreshed_at = np.full(len(ASPECT_PLANETS), np.nan)
+        self._horizon = np.zeros(len(ASPECT_PLANETS))
+        self.values["longitudes"] = np.zeros(len(ASPECT_PLANETS))
+
+        self.add_node("signs", ("longitudes",), lambda lon: _indexes(lon, 30.0), lambda lon: _indexes(lon, 30.0))
+        self.add_node("constellations", ("longitudes",), lambda lon: _indexes(lon, 360.0 / 27.0),
+                      lambda lon: _indexes(lon, 360.0 / 27.0))
+        self.add_node("navamsas", ("longitudes",), lambda lon: _indexes(lon, _NAVAMSA_SPAN),
+                      lambda lon: _indexes(lon, _NAVAMSA_SPAN))
+        self.add_node("lagna_sign", ("ascendant",), lambda asc: int(asc // 30.0), lambda asc: int(asc // 30.0))
+        self.add_node("houses", ("signs", "lagna_sign"), lambda signs, lagna: (signs, lagna),
+                      lambda signs, lagna: tuple((sign - lagna) % 12 + 1 for sign in signs))
+        self.add_node("aspects", ("signs", "lagna_sign"), lambda signs, lagna: (signs, lagna), _aspects)
+        self.add_node("avasthas", ("longitudes",), lambda lon: _indexes(lon, 6.0), _baladi)
+
+        interval = strength_minutes / 1440.0
+        self.add_node("strengths", ("jd", "navamsas", "lagna_sign"),
+                      lambda jd, navamsas, lagna: (navamsas[:7], lagna, int(jd // interval)),
+                      lambda jd, navamsas, lagna: Shadbala(jd, latitude, longitude, ayanamsa).pinda)
+
+    def add_node(self, name, inputs, key, compute):
+        """
+        Add a derived quantity, see ChartNode. Inputs must already exist.
+        """
+        for source in inputs:
+            if source not in _SOURCES and source not in self.nodes:
+                raise ValueError(f"Unknown input {source} for {name}, add it first")
+        self.nodes[name] = ChartNode(name, inputs, key, compute)
+
+    def set_time(self, time):
+        """
+        Move the chart to a time (julian day, Time or datetime), the
+        ascendant is always recalculated, planets once they could be near a
+        boundary & nodes only when their key moved. Returns values.
+        """
+        jd = float(to_julian_day(time))
+        self.values["jd"] = jd
+        self.values["ascendant"] = float(ascendant_longitude(jd, self.latitude, self.longitude, self.ayanamsa))
+        changed = {"jd", "ascendant"}
+
+        # nan refresh times compare false, so the first frame refreshes all
+        stale = np.flatnonzero(~(np.abs(jd - self._refreshed_at) < self._horizon))
+        if stale.size:
+            longitudes = self.values["longitudes"].copy()
+            for index in stale:
+                longitudes[index] = planet_nirayana_longitude(ASPECT_PLANETS[index], jd, self.ayanamsa)
+            self.values["longitudes"] = longitudes
+            self._refreshed_at[stale] = jd
+            self._horizon[stale] = self._distance_to_boundary(longitudes[stale]) / _MAX_SPEED[stale]
+            changed.add("longitudes")
+        self.positions_refreshed += stale.size
+        self.positions_reused += len(ASPECT_PLANETS) - stale.size
+
+        computed, skipped = [], []
+        for node in self.nodes.values():
+            # nothing upstream changed, not even the key is worked out
+            if not changed.intersection(node.inputs):
+                node.skipped += 1
+                skipped.append(node.name)
+                continue
+            arguments = [self.values[source] for source in node.inputs]
+            key = node.key(*arguments)
+            if key == node.last_key:
+                node.skipped += 1
+                skipped.append(node.name)
+                continue
+            node.last_key = key
+            self.values[node.name] = node.compute(*arguments)
+            node.computed += 1
+            computed.append(node.name)
+            changed.add(node.name)
+
+        self.frames += 1
+        self.last_frame = {"computed": computed, "skipped": skipped}
+        return self.values
+
+    def _distance_to_boundary(self, longitudes):
+        if not self.spans.size:
+            return np.zeros_like(longitudes)
+        offset = longitudes[:, None] % self.spans
+        return np.min(np.minimum(offset, self.spans - offset), axis=1)
+
+    def counters(self):
+        """
+        Computed & skipped counts per node since the chart was made, plus
+        totals, eg: to show how much work scrubbing saved.
+        """
+        rows = {name: {"computed": node.computed, "skipped": node.skipped} for name, node in self.nodes.items()}
+        rows["total"] = {"computed": sum(node.computed for node in self.nodes.values()),
+                         "skipped": sum(node.skipped for node in self.nodes.values()),
+                         "frames": self.frames}
+        rows["positions"] = {"computed": self.positions_refreshed, "skipped": self.positions_reused}
+        return rows
+
+    def planet_sign(self, planet):
+        return _SIGNS[self.values["signs"][ASPECT_PLANETS.index(planet)]]
+
+    def planet_constellation(self, planet):
+        return _CONSTELLATIONS[self.values["constellations"][ASPECT_PLANETS.index(planet)] % 27]
+
+    def planet_house(self, planet):
+        """
+        Whole sign house 1-12 from the lagna.
+        """
+        return self.values["houses"][ASPECT_PLANETS.index(planet)]
+
+    def planets_in_aspect(self, planet):
+        row = self.values["aspects"]["planet_aspect"][ASPECT_PLANETS.index(planet)]
+        return [ASPECT_PLANETS[index] for index in np.flatnonzero(row)]
+
+    def planet_avastha(self, planet):
+        return self.values["avasthas"][ASPECT_PLANETS.index(planet)]
+
+    def planet_strength(self, planet):
+        """
+        Shadbala pinda in shashtiamsas, last refreshed per strength_minutes.
+        """
+        return float(self.values["strengths"][SHADBALA_PLANETS.index(planet)])
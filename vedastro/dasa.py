@@ -0,0 +1,201 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day, julian_day_to_time
+from .ephemeris import planet_nirayana_longitude
+
+__all__ = [
+    "DASA_LEVEL_NAMES",
+    "VIMSHOTTARI_YEARS",
+    "DasaPeriod",
+    "VimshottariDasa",
+]
+
+# name of each depth, deeper levels are still generated as "Level7" etc.
+DASA_LEVEL_NAMES = ["Dasa", "Bhukti", "Antaram", "Sukshma", "Prana", "Deha"]
+
+# vimshottari lords in order with their years, 120 years in total
+VIMSHOTTARI_YEARS = {
+    PlanetName.Ketu: 7,
+    PlanetName.Venus: 20,
+    PlanetName.Sun: 6,
+    PlanetName.Moon: 10,
+    PlanetName.Mars: 7,
+    PlanetName.Rahu: 18,
+    PlanetName.Jupiter: 16,
+    PlanetName.Saturn: 19,
+    PlanetName.Mercury: 17,
+}
+
+_LORDS = list(VIMSHOTTARI_YEARS)
+_TOTAL_YEARS = 120.0
+_CONSTELLATION_SPAN = 360.0 / 27.0
+
+
+class DasaPeriod:
+    def __init__(self, lords, start, end):
+        """
+        One dasa period, sub periods are only made when asked for.
+
+        Args:
+        lords (tuple): Lords from the maha dasa down to this level, eg: (Venus, Sun).
+        start (float): Exact start as julian day (UT).
+        end (float): Exact end as julian day (UT).
+        """
+        self.lords = lords
+        self.start = start
+        self.end = end
+
+    @property
+    def lord(self):
+        return self.lords[-1]
+
+    @property
+    def level(self):
+        """
+        Depth of this period, 1 for the maha dasa.
+        """
+        return len(self.lords)
+
+    @property
+    def level_name(self):
+        return DASA_LEVEL_NAMES[self.level - 1] if self.level <= len(DASA_LEVEL_NAMES) else f"Level{self.level}"
+
+    @property
+    def duration_days(self):
+        return self.end - self.start
+
+    def sub_periods(self):
+        """
+        Generate the 9 sub periods, starting from this period's own lord and
+        sharing its time in proportion to each lord's vimshottari years.
+        """
+        first = _LORDS.index(self.lord)
+        start = self.start
+        for step in range(9):
+            lord = _LORDS[(first + step) % 9]
+            end = start + self.duration_days * VIMSHOTTARI_YEARS[lord] / _TOTAL_YEARS
+            # last one closes exactly on the parent end, no float drift
+            yield DasaPeriod(self.lords + (lord,), start, self.end if step == 8 else end)
+            start = end
+
+    def __iter__(self):
+        return self.sub_periods()
+
+    def contains(self, jd):
+        return self.start <= jd < self.end
+
+    def to_dict(self, geolocation=None, offset="+00:00"):
+        """
+        JSON friendly form, times as julian days or as Time strings when a
+        geolocation is given.
+        """
+        if geolocation is None:
+            start, end = self.start, self.end
+        else:
+            start = julian_day_to_time(self.start, geolocation, offset).time_string
+            end = julian_day_to_time(self.end, geolocation, offset).time_string
+        return {
+            "Lord": self.lord.value,
+            "Lords": [lord.value for lord in self.lords],
+            "Level": self.level_name,
+            "Start": start,
+            "End": end,
+        }
+
+    def __repr__(self):
+        path = " > ".join(lord.value for lord in self.lords)
+        return f"DasaPeriod({path}, {self.start:.5f} -> {self.end:.5f})"
+
+
+class VimshottariDasa:
+    def __init__(self, birth_time, moon_longitude=None, ayanamsa=None, year_days=365.25):
+        """
+        Local Vimshottari dasa engine, exact period boundaries with no
+        precisionHours trade off, worked out from the birth Moon longitude.
+
+        Args:
+        birth_time: Birth time as Time, datetime or julian day.
+        moon_longitude (float): Nirayana Moon longitude at birth, if not given it
+            comes from the local ephemeris.
+        ayanamsa (Ayanamsa): Used only when the Moon longitude is calculated.
+        year_days (float): Days in one dasa year.
+        """
+        self.birth_jd = to_julian_day(birth_time)
+        if moon_longitude is None:
+            moon_longitude = planet_nirayana_longitude(PlanetName.Moon, self.birth_jd, ayanamsa)
+        self.moon_longitude = float(moon_longitude) % 360.0
+        self.year_days = year_days
+
+        # the birth constellation lord runs the first dasa, part of it has
+        # already gone by in proportion to how far the Moon has crossed it
+        constellation = int(self.moon_longitude // _CONSTELLATION_SPAN)
+        passed = (self.moon_longitude % _CONSTELLATION_SPAN) / _CONSTELLATION_SPAN
+        self.first_lord = _LORDS[constellation % 9]
+        first_length = VIMSHOTTARI_YEARS[self.first_lord] * year_days
+        self.cycle_start = self.birth_jd - passed * first_length
+
+    def maha_dasas(self, cycles=1):
+        """
+        Generate maha dasas from the one running at birth, 120 years per cycle.
+        """
+        first = _LORDS.index(self.first_lord)
+        start = self.cycle_start
+        for step in range(9 * cycles):
+            lord = _LORDS[(first + step) % 9]
+            end = start + VIMSHOTTARI_YEARS[lord] * self.year_days
+            yield DasaPeriod((lord,), start, end)
+            start = end
+
+    def for_life(self, levels=1, scan_years=120):
+        """
+        Local equivalent of Calculate.DasaForLife, periods at the given depth
+        from birth up to scan_years after, generated lazily in time order.
+        """
+        end = self.birth_jd + scan_years * self.year_days
+        return self.at_range(self.birth_jd, end, levels)
+
+    def at_range(self, start_time, end_time, levels=1):
+        """
+        Local equivalent of Calculate.DasaAtRange, generates every period at
+        the given depth that overlaps the range, skipping whole branches that
+        fall outside it so deep levels cost nothing until iterated.
+        """
+        start = to_julian_day(start_time)
+        end = to_julian_day(end_time)
+        cycles = max(1, int(np.ceil((end - self.cycle_start) / (_TOTAL_YEARS * self.year_days))))
+        return self._walk(self.maha_dasas(cycles), start, end, levels)
+
+    def _walk(self, periods, start, end, levels):
+        for period in periods:
+            if period.end <= start:
+                continue
+            if period.start >= end:
+                return
+            if period.level == levels:
+                yield period
+            else:
+                yield from self._walk(period.sub_periods(), start, end, levels)
+
+    def at_time(self, check_time, levels=3):
+        """
+        Local equivalent of Calculate.DasaAtTime, the running period at each
+        depth from the maha dasa down, at most 9 checks per level.
+        """
+        jd = to_julian_day(check_time)
+        cycles = max(1, int(np.ceil((jd - self.cycle_start) / (_TOTAL_YEARS * self.year_days))))
+        running = []
+        periods = self.maha_dasas(cycles)
+        for _ in range(levels):
+            period = next((period for period in periods if period.contains(jd)), None)
+            if period is None:
+                break
+            running.append(period)
+            periods = period.sub_periods()
+        return running
+
+    def for_now(self, levels=3):
+        """
+        Local equivalent of Calculate.DasaForNow.
+        """
+        return self.at_time(np.datetime64("now"), levels)
@@ -0,0 +1,288 @@
+import inspect
+import json
+import os
+import threading
+from enum import Enum
+
+from .calculate import Calculate
+
+__all__ = [
+    "LIBRARY_PATH_VARIABLE",
+    "BACKENDS",
+    "library_path",
+    "load_library",
+    "invoke",
+]
+
+# values for Calculate.SetBackend, http is the default
+BACKENDS = ("http", "dotnet")
+
+# env variable pointing at VedAstro.Library.dll (or the folder holding it),
+# else the dll is looked for next to this file
+LIBRARY_PATH_VARIABLE = "VEDASTRO_LIBRARY_PATH"
+_LIBRARY_FILE = "VedAstro.Library.dll"
+_RUNTIME_CONFIG = os.path.join(os.path.dirname(__file__), "runtimeconfig.json")
+
+_lock = threading.Lock()
+_library = None
+_method_cache = {}
+_converter_cache = {}
+
+
+def library_path():
+    """
+    Full path of VedAstro.Library.dll that the in-process backend will load.
+    """
+    path = os.environ.get(LIBRARY_PATH_VARIABLE) or os.path.dirname(__file__)
+    if os.path.isdir(path):
+        path = os.path.join(path, _LIBRARY_FILE)
+    return path
+
+
+def load_library():
+    """
+    Start the .NET runtime (coreclr, using the packaged runtimeconfig.json)
+    & load the VedAstro calculation library, only done once per process.
+    Returns the .NET Calculate type.
+    """
+    global _library
+    if _library is not None:
+        return _library
+
+    with _lock:
+        if _library is not None:
+            return _library
+
+        path = library_path()
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"VedAstro library not found at {path}, set {LIBRARY_PATH_VARIABLE}")
+
+        try:
+            import pythonnet
+            # runtime can only be picked before clr is first imported
+            if pythonnet.get_runtime_info() is None:
+                pythonnet.load("coreclr", runtime_config=_RUNTIME_CONFIG)
+            import clr
+        except Exception as e:
+            raise RuntimeError(f"Could not start .NET runtime via pythonnet: {e}") from e
+
+        from System.Reflection import Assembly
+        assembly = Assembly.LoadFrom(path)
+        calculate_type = assembly.GetType("VedAstro.Library.Calculate")
+        if calculate_type is None:
+            raise RuntimeError(f"VedAstro.Library.Calculate not found in {path}")
+
+        _library = calculate_type
+        return _library
+
+
+def _find_method(endpoint):
+    """
+    Static .NET method behind an endpoint, cached since reflection is slow.
+    """
+    if endpoint not in _method_cache:
+        from System.Reflection import BindingFlags
+        flags = BindingFlags.Public | BindingFlags.Static
+        methods = [method for method in load_library().GetMethods(flags) if method.Name == endpoint]
+        if not methods:
+            raise ValueError(f"No in-process method for {endpoint}")
+        # overloads are rare, the one with most parameters matches the API
+        _method_cache[endpoint] = max(methods, key=lambda method: len(method.GetParameters()))
+    return _method_cache[endpoint]
+
+
+def _to_dotnet_time(time):
+    """
+    Python Time -> VedAstro.Library.Time, coordinates come straight from the
+    GeoLocation so no geocoding round trip is needed.
+    """
+    from VedAstro.Library import GeoLocation as DotnetGeoLocation, Time as DotnetTime
+    geolocation = time.geolocation
+    location = DotnetGeoLocation(geolocation.location_name, float(geolocation.longitude), float(geolocation.latitude))
+    return DotnetTime(time.time_string, location)
+
+
+def _converter(dotnet_type):
+    """
+    Function turning a python argument into the given .NET parameter type.
+    """
+    name = dotnet_type.FullName
+    if name in _converter_cache:
+        return _converter_cache[name]
+
+    import clr
+    import System
+    from System.Reflection import BindingFlags
+
+    if name == "VedAstro.Library.Time":
+        convert = _to_dotnet_time
+    elif name == "VedAstro.Library.GeoLocation":
+        def convert(value):
+            from VedAstro.Library import GeoLocation as DotnetGeoLocation
+            return DotnetGeoLocation(value.location_name, float(value.longitude), float(value.latitude))
+    elif dotnet_type.IsEnum:
+        def convert(value):
+            return System.Enum.Parse(dotnet_type, str(value), True)
+    else:
+        # named instances like PlanetName.Sun are static fields on the type
+        static_field = BindingFlags.Public | BindingFlags.Static
+
+        def convert(value):
+            field = dotnet_type.GetField(str(value), static_field)
+            if field is not None:
+                return field.GetValue(None)
+            parse = dotnet_type.GetMethod("Parse", [clr.GetClrType(System.String)])
+            if parse is not None and isinstance(value, str):
+                return parse.Invoke(None, [value])
+            return System.Convert.ChangeType(value, dotnet_type)
+
+    _converter_cache[name] = convert
+    return convert
+
+
+def _plain_value(value):
+    """
+    Python side value handed to a converter, enums go by name like in the URL.
+    """
+    return value.name if isinstance(value, Enum) else value
+
+
+def _to_json_like(result):
+    """
+    .NET result -> same python structure the HTTP Payload unwraps to.
+    """
+    if result is None or isinstance(result, (bool, int, float, str)):
+        return result
+
+    import System
+    # library types know how to turn into the API's json, same as the server
+    to_json = result.GetType().GetMethod("ToJson", System.Type.EmptyTypes)
+    if to_json is not None:
+        text = str(to_json.Invoke(result, None))
+    else:
+        from Newtonsoft.Json import JsonConvert
+        text = JsonConvert.SerializeObject(result)
+
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _push_ayanamsa(ayanamsa):
+    """
+    Set the .NET library's ayanamsa, converted to the property's own enum type.
+    The library keeps one ayanamsa per process, so this is only done when it
+    changes (SetBackend & SetAyanamsa) and never per call.
+    """
+    if ayanamsa is None:
+        return
+    import System
+    setting = load_library().GetProperty("Ayanamsa")
+    if setting is None:
+        return
+
+    number = int(ayanamsa.value if isinstance(ayanamsa, Enum) else ayanamsa)
+    kind = setting.PropertyType
+    value = System.Enum.ToObject(kind, number) if kind.IsEnum else System.Convert.ChangeType(number, kind)
+    with _lock:
+        setting.SetValue(None, value)
+
+
+def invoke(endpoint, arguments):
+    """
+    Run an endpoint in-process, same inputs & outputs as Calculate over HTTP.
+
+    Args:
+    endpoint (str): Calculate method name, eg: "PlanetNirayanaLongitude".
+    arguments (dict): Python arguments of the Calculate method by name.
+    """
+    method = _find_method(endpoint)
+
+    values = []
+    for parameter in method.GetParameters():
+        if parameter.Name not in arguments:
+            raise ValueError(f"{endpoint} needs argument '{parameter.Name}'")
+        value = arguments[parameter.Name]
+        values.append(_converter(parameter.ParameterType)(_plain_value(value)) if value is not None else None)
+
+    return _to_json_like(method.Invoke(None, values))
+
+
+def _is_endpoint(name, member):
+    """
+    True for the generated endpoint methods, they all send their own name as
+    the endpoint.
+    """
+    function = getattr(member, "__func__", None)
+    return isinstance(member, classmethod) and name in getattr(function, "__code__", None).co_consts
+
+
+# generated methods as shipped, put back when switching to http
+_HTTP_METHODS = {name: member for name, member in vars(Calculate).items()
+                 if not name.startswith("_") and _is_endpoint(name, member)}
+
+
+def _in_process_method(name, member):
+    """
+    Same method as the generated one, but its arguments bound by name & run
+    through invoke instead of an HTTP request.
+    """
+    function = member.__func__
+    signature = inspect.signature(function)
+    owner = next(iter(signature.parameters))
+
+    def method(cls, *args, **kwargs):
+        arguments = signature.bind(cls, *args, **kwargs).arguments
+        del arguments[owner]
+        return invoke(name, arguments)
+
+    method.__name__ = function.__name__
+    method.__qualname__ = function.__qualname__
+    method.__doc__ = function.__doc__
+    method.in_process = True
+    return classmethod(method)
+
+
+def _set_backend(cls, backend):
+    """
+    Pick where this client's calculations run, "http" (default) sends them to
+    the API, "dotnet" runs VedAstro.Library in-process via pythonnet. Call on
+    a subclass to switch only that client.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, use one of {BACKENDS}")
+    if backend == "dotnet":
+        load_library()
+
+    for name, member in _HTTP_METHODS.items():
+        current = cls.__dict__.get(name)
+        swapped = getattr(getattr(current, "__func__", None), "in_process", False)
+        if backend == "dotnet" and (current is None or current is member or swapped):
+            setattr(cls, name, _in_process_method(name, member))
+        elif backend == "http" and swapped:
+            # Calculate gets its generated method back, subclasses fall back to it
+            if cls is Calculate:
+                setattr(cls, name, member)
+            else:
+                delattr(cls, name)
+
+    cls.backend = backend
+    if backend == "dotnet":
+        _push_ayanamsa(getattr(cls, "Ayanamsa", None))
+
+
+def _set_ayanamsa(cls, ayanamsa):
+    """
+    Ayanamsa used by this client, eg: SetAyanamsa(Ayanamsa.Raman). With the
+    dotnet backend it is also handed to the library, which holds a single
+    ayanamsa for the whole process.
+    """
+    cls.Ayanamsa = ayanamsa
+    if cls.backend == "dotnet":
+        _push_ayanamsa(ayanamsa)
+
+
+Calculate.backend = "http"
+Calculate.SetBackend = classmethod(_set_backend)
+Calculate.SetAyanamsa = classmethod(_set_ayanamsa)
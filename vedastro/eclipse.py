@@ -0,0 +1,206 @@
+import concurrent.futures
+import numpy as np
+
+from .julian_day import to_julian_day, api_julian_day
+from .ephemeris import delta_t_seconds
+from .validation import parity_table
+
+__all__ = [
+    "SYNODIC_MONTH_DAYS",
+    "NEW_MOON_EPOCH",
+    "mean_syzygies",
+    "EclipseTable",
+    "eclipse_table",
+    "eclipse_parity_table",
+]
+
+# mean length of a lunation & the mean new moon of 6 Jan 2000 (JDE) that
+# lunation numbers are counted from
+SYNODIC_MONTH_DAYS = 29.530588861
+NEW_MOON_EPOCH = 2451550.09766
+
+# century chunks handed to the workers
+_CHUNK_DAYS = 36525.0
+_DEG = np.pi / 180.0
+
+
+def mean_syzygies(start, end):
+    """
+    Lunation numbers of every new moon (k) & full moon (k + 0.5) whose mean
+    time falls near [start, end), a lunation either side for the corrections.
+    """
+    first = np.floor((start - NEW_MOON_EPOCH) / SYNODIC_MONTH_DAYS) - 1
+    last = np.ceil((end - NEW_MOON_EPOCH) / SYNODIC_MONTH_DAYS) + 1
+    return np.arange(first, last + 0.25, 0.5)
+
+
+def _search_chunk(start, end):
+    """
+    Every eclipse with its greatest instant in [start, end) as a dict of
+    arrays. Syzygies from the mean lunation, eclipses from the Moon's
+    distance to the node (Meeus, Astronomical Algorithms ch. 54).
+    """
+    k = mean_syzygies(start, end)
+    solar = k == np.floor(k)
+    t = k / 1236.85
+
+    jde = (NEW_MOON_EPOCH + SYNODIC_MONTH_DAYS * k + 0.00015437 * t ** 2
+           - 0.00000015 * t ** 3 + 0.00000000073 * t ** 4)
+    sun_anomaly = (2.5534 + 29.1053567 * k - 0.0000014 * t ** 2 - 0.00000011 * t ** 3) * _DEG
+    moon_anomaly = (201.5643 + 385.81693528 * k + 0.0107582 * t ** 2 + 0.00001238 * t ** 3
+                    - 0.000000058 * t ** 4) * _DEG
+    latitude_argument = (160.7108 + 390.67050284 * k - 0.0016118 * t ** 2 - 0.00000227 * t ** 3
+                         + 0.000000011 * t ** 4) * _DEG
+    node = (124.7746 - 1.56375588 * k + 0.0020672 * t ** 2 + 0.00000215 * t ** 3) * _DEG
+    eccentricity = 1.0 - 0.002516 * t - 0.0000074 * t ** 2
+
+    # too far from the node for any eclipse, drop before the heavy terms
+    near = np.abs(np.sin(latitude_argument)) <= 0.36
+    k, solar, t, jde = k[near], solar[near], t[near], jde[near]
+    m, mp, f, node, e = (sun_anomaly[near], moon_anomaly[near], latitude_argument[near],
+                         node[near], eccentricity[near])
+
+    f1 = f - 0.02665 * _DEG * np.sin(node)
+    a1 = (299.77 + 0.107408 * k - 0.009173 * t ** 2) * _DEG
+    jde = (jde + np.where(solar, -0.4070, -0.4065) * np.sin(mp)
+           + np.where(solar, 0.1721, 0.1727) * e * np.sin(m)
+           + 0.0161 * np.sin(2 * mp) - 0.0097 * np.sin(2 * f1) + 0.0073 * e * np.sin(mp - m)
+           - 0.0050 * e * np.sin(mp + m) - 0.0023 * np.sin(mp - 2 * f1) + 0.0021 * e * np.sin(2 * m)
+           + 0.0012 * np.sin(mp + 2 * f1) + 0.0006 * e * np.sin(2 * mp + m) - 0.0004 * np.sin(3 * mp)
+           - 0.0003 * e * np.sin(m + 2 * f1) + 0.0003 * np.sin(a1) - 0.0002 * e * np.sin(m - 2 * f1)
+           - 0.0002 * e * np.sin(2 * mp - m) - 0.0002 * np.sin(node))
+
+    p = (0.2070 * e * np.sin(m) + 0.0024 * e * np.sin(2 * m) - 0.0392 * np.sin(mp)
+         + 0.0116 * np.sin(2 * mp) - 0.0073 * e * np.sin(mp + m) + 0.0067 * e * np.sin(mp - m)
+         + 0.0118 * np.sin(2 * f1))
+    q = (5.2207 - 0.0048 * e * np.cos(m) + 0.0020 * e * np.cos(2 * m) - 0.3299 * np.cos(mp)
+         - 0.0060 * e * np.cos(mp + m) + 0.0041 * e * np.cos(mp - m))
+    gamma = (p * np.cos(f1) + q * np.sin(f1)) * (1.0 - 0.0048 * np.abs(np.cos(f1)))
+    u = (0.0059 + 0.0046 * e * np.cos(m) - 0.0182 * np.cos(mp) + 0.0004 * np.cos(2 * mp)
+         - 0.0005 * np.cos(m + mp))
+    size = np.abs(gamma)
+
+    # solar: central when the shadow axis meets the earth, u < 0 means the
+    # umbra reaches it (total), otherwise annular or both along the track
+    hybrid_limit = 0.00464 * np.sqrt(np.clip(1.0 - gamma ** 2, 0.0, None))
+    central_type = np.where(u < 0.0, "Total", np.where((u < 0.0047) & (u < hybrid_limit), "Hybrid", "Annular"))
+    solar_type = np.where(size < 0.9972 + np.abs(u), central_type, "Partial")
+    solar_type = np.where(size > 1.5433 + u, "", solar_type)
+    solar_magnitude = np.where(solar_type == "Partial", (1.5433 + u - size) / (0.5461 + 2.0 * u), np.nan)
+
+    # lunar: umbral & penumbral magnitudes
+    umbral = (1.0128 - u - size) / 0.5450
+    penumbral = (1.5573 + u - size) / 0.5450
+    lunar_type = np.where(umbral >= 1.0, "Total", np.where(umbral > 0.0, "Partial",
+                          np.where(penumbral > 0.0, "Penumbral", "")))
+    lunar_magnitude = np.where(umbral > 0.0, umbral, penumbral)
+
+    kind = np.where(solar, "Solar", "Lunar")
+    eclipse_type = np.where(solar, solar_type, lunar_type)
+    magnitude = np.where(solar, solar_magnitude, lunar_magnitude)
+
+    # dynamical time of greatest eclipse to UT, delta T hardly moves in a day
+    time = jde - delta_t_seconds(jde) / 86400.0
+    keep = (eclipse_type != "") & (time >= start) & (time < end)
+    return {"time": time[keep], "kind": kind[keep], "type": eclipse_type[keep],
+            "gamma": gamma[keep], "magnitude": magnitude[keep]}
+
+
+class EclipseTable:
+    def __init__(self, start_time, end_time, workers=None):
+        """
+        Every solar & lunar eclipse with its greatest instant between two
+        times, the range is cut into centuries searched in parallel.
+
+        Args:
+        start_time, end_time: Julian days, Time objects or datetimes.
+        workers (int): Threads for the century chunks, None lets the
+            executor pick, 1 runs in the calling thread.
+
+        Arrays sorted by time: time (julian day UT of greatest eclipse),
+        kind ("Solar" or "Lunar"), type (Total, Annular, Hybrid, Partial or
+        Penumbral), gamma (shadow axis distance from the earth's centre in
+        earth radii) & magnitude (NaN for central solar eclipses).
+        """
+        start = float(to_julian_day(start_time))
+        end = float(to_julian_day(end_time))
+        edges = np.append(np.arange(start, end, _CHUNK_DAYS), end)
+        chunks = list(zip(edges[:-1], edges[1:]))
+
+        if workers == 1 or len(chunks) < 2:
+            parts = [_search_chunk(*chunk) for chunk in chunks]
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                parts = list(executor.map(lambda chunk: _search_chunk(*chunk), chunks))
+
+        for column in ("time", "kind", "type", "gamma", "magnitude"):
+            values = [part[column] for part in parts]
+            setattr(self, column, np.concatenate(values) if values else np.zeros(0))
+        self.kind = self.kind.astype(object)
+        self.type = self.type.astype(object)
+
+    def __len__(self):
+        return len(self.time)
+
+    def _next(self, times, kind):
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        candidates = self.time[self.kind == kind]
+        slot = np.searchsorted(candidates, jd, side="right")
+        if np.any(slot >= len(candidates)):
+            raise ValueError("No eclipse in the table after that time, extend end_time")
+        found = candidates[slot]
+        return found if found.ndim else float(found)
+
+    def next_solar_eclipse(self, times):
+        """
+        Julian day (UT) of the first solar eclipse after each time, like Calculate.NextSolarEclipse.
+        """
+        return self._next(times, "Solar")
+
+    def next_lunar_eclipse(self, times):
+        """
+        Julian day (UT) of the first lunar eclipse after each time, like Calculate.NextLunarEclipse.
+        """
+        return self._next(times, "Lunar")
+
+    def rows(self):
+        """
+        One dict per eclipse, handy for pandas.DataFrame or json.
+        """
+        return [{"Time": float(time), "Kind": kind, "Type": kind_type, "Gamma": float(gamma),
+                 "Magnitude": float(magnitude)}
+                for time, kind, kind_type, gamma, magnitude
+                in zip(self.time, self.kind, self.type, self.gamma, self.magnitude)]
+
+
+def eclipse_table(start_time, end_time, workers=None):
+    """
+    Shortcut for EclipseTable(start_time, end_time, workers).rows().
+    """
+    return EclipseTable(start_time, end_time, workers).rows()
+
+
+def eclipse_parity_table(times, span_days=1200.0):
+    """
+    Compare next solar & lunar eclipse times against the API, one call per
+    row, differences in minutes.
+
+    Args:
+    times (list): Time objects to search from.
+    span_days (float): How far ahead the local table reaches.
+    """
+    from .calculate import Calculate
+
+    def local(case):
+        method, time = case
+        jd = float(to_julian_day(time))
+        table = EclipseTable(jd, jd + span_days, workers=1)
+        return table.next_solar_eclipse(jd) if method == "NextSolarEclipse" else table.next_lunar_eclipse(jd)
+
+    def remote(case):
+        method, time = case
+        return api_julian_day(getattr(Calculate, method)(time), time)
+
+    cases = [(method, time) for time in times for method in ("NextSolarEclipse", "NextLunarEclipse")]
+    return parity_table(cases, local, remote, parse=lambda value: value,
+                        compare=lambda a, b: (a - b) * 1440.0)
@@ -0,0 +1,577 @@
+import functools
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import julian_centuries, to_julian_day
+from .ayanamsa import ayanamsa_degree, general_precession
+from .validation import angle_difference
+
+__all__ = [
+    "delta_t_seconds",
+    "terrestrial_time",
+    "nutation",
+    "mean_obliquity",
+    "true_obliquity",
+    "sun_sayana_longitude",
+    "moon_sayana_longitude",
+    "mean_node_longitude",
+    "true_node_longitude",
+    "mean_equinox_longitude",
+    "mean_heliocentric_longitude",
+    "EPHEMERIS_ERROR_BUDGET",
+    "planet_sayana_longitude",
+    "planet_nirayana_longitude",
+    "ephemeris_error_report",
+]
+
+_DEG = np.pi / 180.0
+
+
+def _scalar_or_array(values):
+    """
+    Plain float for a single time, array otherwise, same as the other engines.
+    """
+    return values if np.ndim(values) else float(values)
+
+
+def _delta_t_polynomial(year):
+    """
+    Difference TT - UT in seconds for decimal years (Espenak & Meeus
+    polynomials, -500 to 2150, long term parabola outside that range).
+    """
+
+    t = year - 2000.0
+    u = (year - 1820.0) / 100.0
+    long_term = -20.0 + 32.0 * u ** 2
+
+    conditions = [
+        year < -500, year < 500, year < 1600, year < 1700, year < 1800, year < 1860,
+        year < 1900, year < 1920, year < 1941, year < 1961, year < 1986, year < 2005,
+        year < 2050, year < 2150,
+    ]
+    y = year / 100.0
+    k = (year - 1000.0) / 100.0
+    t1600, t1700, t1800 = year - 1600.0, year - 1700.0, year - 1800.0
+    t1860, t1900, t1920 = year - 1860.0, year - 1900.0, year - 1920.0
+    t1950, t1975 = year - 1950.0, year - 1975.0
+    choices = [
+        long_term,
+        10583.6 - 1014.41 * y + 33.78311 * y ** 2 - 5.952053 * y ** 3 - 0.1798452 * y ** 4
+        + 0.022174192 * y ** 5 + 0.0090316521 * y ** 6,
+        1574.2 - 556.01 * k + 71.23472 * k ** 2 + 0.319781 * k ** 3 - 0.8503463 * k ** 4
+        - 0.005050998 * k ** 5 + 0.0083572073 * k ** 6,
+        120.0 - 0.9808 * t1600 - 0.01532 * t1600 ** 2 + t1600 ** 3 / 7129.0,
+        8.83 + 0.1603 * t1700 - 0.0059285 * t1700 ** 2 + 0.00013336 * t1700 ** 3 - t1700 ** 4 / 1174000.0,
+        13.72 - 0.332447 * t1800 + 0.0068612 * t1800 ** 2 + 0.0041116 * t1800 ** 3 - 0.00037436 * t1800 ** 4
+        + 0.0000121272 * t1800 ** 5 - 0.0000001699 * t1800 ** 6 + 0.000000000875 * t1800 ** 7,
+        7.62 + 0.5737 * t1860 - 0.251754 * t1860 ** 2 + 0.01680668 * t1860 ** 3
+        - 0.0004473624 * t1860 ** 4 + t1860 ** 5 / 233174.0,
+        -2.79 + 1.494119 * t1900 - 0.0598939 * t1900 ** 2 + 0.0061966 * t1900 ** 3 - 0.000197 * t1900 ** 4,
+        21.20 + 0.84493 * t1920 - 0.076100 * t1920 ** 2 + 0.0020936 * t1920 ** 3,
+        29.07 + 0.407 * t1950 - t1950 ** 2 / 233.0 + t1950 ** 3 / 2547.0,
+        45.45 + 1.067 * t1975 - t1975 ** 2 / 260.0 - t1975 ** 3 / 718.0,
+        63.86 + 0.3345 * t - 0.060374 * t ** 2 + 0.0017275 * t ** 3 + 0.000651814 * t ** 4
+        + 0.00002373599 * t ** 5,
+        62.92 + 0.32217 * t + 0.005589 * t ** 2,
+        long_term - 0.5628 * (2150.0 - year),
+    ]
+    return np.select(conditions, choices, default=long_term)
+
+
+# the polynomials above sampled every year, every branch of np.select gets
+# evaluated for every time so big arrays interpolate this instead (< 0.25s off)
+_DELTA_T_YEARS = np.arange(-500.0, 2151.0)
+_DELTA_T_TABLE = _delta_t_polynomial(_DELTA_T_YEARS)
+
+
+def delta_t_seconds(jd):
+    """
+    Difference TT - UT in seconds (Espenak & Meeus polynomials, -500 to 2150,
+    long term parabola outside that range).
+    """
+    year = 2000.0 + (np.asarray(jd, dtype=np.float64) - 2451544.5) / 365.2425
+    inside = np.interp(year, _DELTA_T_YEARS, _DELTA_T_TABLE)
+    outside = (year < _DELTA_T_YEARS[0]) | (year > _DELTA_T_YEARS[-1])
+    if np.any(outside):
+        inside = np.where(outside, _delta_t_polynomial(year), inside)
+    return inside
+
+
+def terrestrial_time(jd):
+    """
+    Julian day UT -> julian day TT, all series below run on TT.
+    """
+    return jd + delta_t_seconds(jd) / 86400.0
+
+
+def nutation(jd):
+    """
+    Nutation in longitude & obliquity in degrees, main terms only (~0.5").
+    """
+    t = julian_centuries(jd)
+    node = (125.04452 - 1934.136261 * t) * _DEG
+    sun = (280.4665 + 36000.7698 * t) * _DEG
+    moon = (218.3165 + 481267.8813 * t) * _DEG
+
+    longitude = (-17.20 * np.sin(node) - 1.32 * np.sin(2 * sun) - 0.23 * np.sin(2 * moon)
+                 + 0.21 * np.sin(2 * node)) / 3600.0
+    obliquity = (9.20 * np.cos(node) + 0.57 * np.cos(2 * sun) + 0.10 * np.cos(2 * moon)
+                 - 0.09 * np.cos(2 * node)) / 3600.0
+    return longitude, obliquity
+
+
+def mean_obliquity(jd):
+    """
+    Mean obliquity of the ecliptic in degrees (IAU 1980).
+    """
+    t = julian_centuries(jd)
+    return 23.4392911111 - (46.8150 * t + 0.00059 * t ** 2 - 0.001813 * t ** 3) / 3600.0
+
+
+def true_obliquity(jd):
+    """
+    Mean obliquity corrected for nutation, in degrees.
+    """
+    return mean_obliquity(jd) + nutation(jd)[1]
+
+
+def _sun_true_longitude(jd_tt):
+    """
+    Geometric longitude of the Sun, mean equinox of date (Meeus ch. 25, ~0.01 deg).
+    """
+    t = julian_centuries(jd_tt)
+    mean_longitude = 280.46646 + 36000.76983 * t + 0.0003032 * t ** 2
+    anomaly = (357.52911 + 35999.05029 * t - 0.0001537 * t ** 2) * _DEG
+    centre = ((1.914602 - 0.004817 * t - 0.000014 * t ** 2) * np.sin(anomaly)
+              + (0.019993 - 0.000101 * t) * np.sin(2 * anomaly)
+              + 0.000289 * np.sin(3 * anomaly))
+    return mean_longitude + centre
+
+
+def _sun_mean_equinox_longitude(jd_tt):
+    """
+    Sun with the 20.5" annual aberration, mean equinox of date.
+    """
+    return _sun_true_longitude(jd_tt) - 0.00569
+
+
+def sun_sayana_longitude(times):
+    """
+    Apparent tropical longitude of the Sun in degrees for any time input.
+    """
+    return _apparent_longitude(PlanetName.Sun, times)
+
+
+# principal periodic terms of the Moon's longitude from ELP-2000/82 as
+# truncated by Meeus (ch. 47), multipliers of D, M, M', F & coefficient in
+# 1e-6 degrees, terms with M get scaled by E for the shrinking eccentricity
+_MOON_LONGITUDE_TERMS = np.array([
+    (0, 0, 1, 0, 6288774), (2, 0, -1, 0, 1274027), (2, 0, 0, 0, 658314), (0, 0, 2, 0, 213618),
+    (0, 1, 0, 0, -185116), (0, 0, 0, 2, -114332), (2, 0, -2, 0, 58793), (2, -1, -1, 0, 57066),
+    (2, 0, 1, 0, 53322), (2, -1, 0, 0, 45758), (0, 1, -1, 0, -40923), (1, 0, 0, 0, -34720),
+    (0, 1, 1, 0, -30383), (2, 0, 0, -2, 15327), (0, 0, 1, 2, -12528), (0, 0, 1, -2, 10980),
+    (4, 0, -1, 0, 10675), (0, 0, 3, 0, 10034), (4, 0, -2, 0, 8548), (2, 1, -1, 0, -7888),
+    (2, 1, 0, 0, -6766), (1, 0, -1, 0, -5163), (1, 1, 0, 0, 4987), (2, -1, 1, 0, 4036),
+    (2, 0, 2, 0, 3994), (4, 0, 0, 0, 3861), (2, 0, -3, 0, 3665), (0, 1, -2, 0, -2689),
+    (2, 0, -1, 2, -2602), (2, -1, -2, 0, 2390), (1, 0, 1, 0, -2348), (2, -2, 0, 0, 2236),
+    (0, 1, 2, 0, -2120), (0, 2, 0, 0, -2069), (2, -2, -1, 0, 2048), (2, 0, 1, -2, -1773),
+    (2, 0, 0, 2, -1595), (4, -1, -1, 0, 1215), (0, 0, 2, 2, -1110), (3, 0, -1, 0, -892),
+    (2, 1, 1, 0, -810), (4, -1, -2, 0, 759), (0, 2, -1, 0, -713), (2, 2, -1, 0, -700),
+    (2, 1, -2, 0, 691), (2, -1, 0, -2, 596), (4, 0, 1, 0, 549), (0, 0, 4, 0, 537),
+    (4, -1, 0, 0, 520), (1, 0, -2, 0, -487), (2, 1, 0, -2, -399), (0, 0, 2, -2, -381),
+    (1, 1, 1, 0, 351), (3, 0, -2, 0, -340), (4, 0, -3, 0, 330), (2, -1, 2, 0, 327),
+    (0, 2, 1, 0, -323), (1, 1, -1, 0, 299), (2, 0, 3, 0, 294),
+], dtype=np.float64)
+
+
+def _moon_arguments(jd_tt):
+    """
+    Fundamental lunar arguments L', D, M, M', F in degrees & eccentricity factor E.
+    """
+    t = julian_centuries(jd_tt)
+    mean_longitude = (218.3164477 + 481267.88123421 * t - 0.0015786 * t ** 2
+                      + t ** 3 / 538841.0 - t ** 4 / 65194000.0)
+    elongation = (297.8501921 + 445267.1114034 * t - 0.0018819 * t ** 2
+                  + t ** 3 / 545868.0 - t ** 4 / 113065000.0)
+    sun_anomaly = 357.5291092 + 35999.0502909 * t - 0.0001536 * t ** 2 + t ** 3 / 24490000.0
+    moon_anomaly = (134.9633964 + 477198.8675055 * t + 0.0087414 * t ** 2
+                    + t ** 3 / 69699.0 - t ** 4 / 14712000.0)
+    latitude_argument = (93.2720950 + 483202.0175233 * t - 0.0036539 * t ** 2
+                         - t ** 3 / 3526000.0 + t ** 4 / 863310000.0)
+    eccentricity = 1.0 - 0.002516 * t - 0.0000074 * t ** 2
+    return mean_longitude, elongation, sun_anomaly, moon_anomaly, latitude_argument, eccentricity
+
+
+def _moon_true_longitude(jd_tt):
+    """
+    Geometric longitude of the Moon, mean equinox of date (~10").
+    """
+    t = julian_centuries(jd_tt)
+    mean_longitude, d, m, mp, f, e = _moon_arguments(jd_tt)
+
+    multipliers = _MOON_LONGITUDE_TERMS[:, :4]
+    coefficients = _MOON_LONGITUDE_TERMS[:, 4]
+    angle = (np.stack([d, m, mp, f], axis=-1) * _DEG) @ multipliers.T
+
+    # E for terms with M, E^2 for terms with 2M, summed per power of E
+    m_power = np.abs(multipliers[:, 1])
+    sines = np.sin(angle)
+    e = np.asarray(e)
+    total = sum(e ** power * (sines[..., m_power == power] @ coefficients[m_power == power])
+                for power in (0, 1, 2))
+
+    # additive terms for Venus, Jupiter & the Earth's flattening
+    a1 = (119.75 + 131.849 * t) * _DEG
+    total = total + 3958 * np.sin(a1) + 1962 * np.sin((mean_longitude - f) * _DEG)
+    a2 = (53.09 + 479264.290 * t) * _DEG
+    total = total + 318 * np.sin(a2)
+
+    return mean_longitude + total / 1e6
+
+
+def moon_sayana_longitude(times):
+    """
+    Apparent tropical longitude of the Moon in degrees for any time input.
+    """
+    return _apparent_longitude(PlanetName.Moon, times)
+
+
+# keplerian elements of the planets & the earth-moon barycentre (JPL, Standish),
+# J2000 ecliptic: a (au), e, I, L, long. perihelion, node in degrees, each as
+# (value at J2000, rate per julian century), this set is fitted to 1800-2050
+# & used for 1800-2100, it still beats the long range set up to 2100
+_KEPLER_ELEMENTS = {
+    PlanetName.Mercury: ((0.38709927, 0.00000037), (0.20563593, 0.00001906), (7.00497902, -0.00594749),
+                         (252.25032350, 149472.67411175), (77.45779628, 0.16047689), (48.33076593, -0.12534081)),
+    PlanetName.Venus: ((0.72333566, 0.00000390), (0.00677672, -0.00004107), (3.39467605, -0.00078890),
+                       (181.97909950, 58517.81538729), (131.60246718, 0.00268329), (76.67984255, -0.27769418)),
+    "EarthMoon": ((1.00000261, 0.00000562), (0.01671123, -0.00004392), (-0.00001531, -0.01294668),
+                  (100.46457166, 35999.37244981), (102.93768193, 0.32327364), (0.0, 0.0)),
+    PlanetName.Mars: ((1.52371034, 0.00001847), (0.09339410, 0.00007882), (1.84969142, -0.00813131),
+                      (-4.55343205, 19140.30268499), (-23.94362959, 0.44441088), (49.55953891, -0.29257343)),
+    PlanetName.Jupiter: ((5.20288700, -0.00011607), (0.04838624, -0.00013253), (1.30439695, -0.00183714),
+                         (34.39644051, 3034.74612775), (14.72847983, 0.21252668), (100.47390909, 0.20469106)),
+    PlanetName.Saturn: ((9.53667594, -0.00125060), (0.05386179, -0.00050991), (2.48599187, 0.00193609),
+                        (49.95424423, 1222.49362201), (92.59887831, -0.41897216), (113.66242448, -0.28867794)),
+    "Uranus": ((19.18916464, -0.00196176), (0.04725744, -0.00004397), (0.77263783, -0.00242939),
+               (313.23810451, 428.48202785), (170.95427630, 0.40805281), (74.01692503, 0.04240589)),
+    "Neptune": ((30.06992276, 0.00026291), (0.00859048, 0.00005105), (1.77004347, 0.00035372),
+                (-55.12002969, 218.45945325), (44.96476227, -0.32241464), (131.78422574, -0.00508664)),
+    "Pluto": ((39.48211675, -0.00031596), (0.24882730, 0.00005170), (17.14001206, 0.00004818),
+              (238.92903833, 145.20780515), (224.06891629, -0.04062942), (110.30393684, -0.01183482)),
+}
+
+# same elements fitted to 3000 BC - 3000 AD, used outside 1800-2100
+_KEPLER_ELEMENTS_LONG = {
+    PlanetName.Mercury: ((0.38709843, 0.0), (0.20563661, 0.00002123), (7.00559432, -0.00590158),
+                         (252.25166724, 149472.67486623), (77.45771895, 0.15940013), (48.33961819, -0.12214182)),
+    PlanetName.Venus: ((0.72332102, -0.00000026), (0.00676399, -0.00005107), (3.39777545, 0.00043494),
+                       (181.97970850, 58517.81560260), (131.76755713, 0.05679648), (76.67261496, -0.27274174)),
+    "EarthMoon": ((1.00000018, -0.00000003), (0.01673163, -0.00003661), (-0.00054346, -0.01337178),
+                  (100.46691572, 35999.37306329), (102.93005885, 0.31795260), (-5.11260389, -0.24123856)),
+    PlanetName.Mars: ((1.52371243, 0.00000097), (0.09336511, 0.00009149), (1.85181869, -0.00724757),
+                      (-4.56813164, 19140.29934243), (-23.91744784, 0.45223625), (49.71320984, -0.26852431)),
+    PlanetName.Jupiter: ((5.20248019, -0.00002864), (0.04853590, 0.00018026), (1.29861416, -0.00322699),
+                         (34.33479152, 3034.90371757), (14.27495244, 0.18199196), (100.29282654, 0.13024619)),
+    PlanetName.Saturn: ((9.54149883, -0.00003065), (0.05550825, -0.00032044), (2.49424102, 0.00451969),
+                        (50.07571329, 1222.11494724), (92.86136063, 0.54179478), (113.63998702, -0.25015002)),
+    "Uranus": ((19.18797948, -0.00020455), (0.04685740, -0.00001550), (0.77298127, -0.00180155),
+               (314.20276625, 428.49512595), (172.43404441, 0.09266985), (73.96250215, 0.05739699)),
+    "Neptune": ((30.06952752, 0.00006447), (0.00895439, 0.00000818), (1.77005520, 0.00022400),
+                (304.22289287, 218.46515314), (46.68158724, 0.01009938), (131.78635853, -0.00606302)),
+    "Pluto": ((39.48686035, 0.00449751), (0.24885238, 0.00006016), (17.14104260, 0.00000501),
+              (238.96535011, 145.18042903), (224.09702598, -0.00968827), (110.30167986, -0.00809981)),
+}
+
+# extra mean anomaly terms b T^2 + c cos(fT) + s sin(fT) of the long range set
+_KEPLER_EXTRA = {
+    PlanetName.Jupiter: (-0.00012452, 0.06064060, -0.35635438, 38.35125000),
+    PlanetName.Saturn: (0.00025899, -0.13434469, 0.87320147, 38.35125000),
+    "Uranus": (0.00058331, -0.97731848, 0.17689245, 7.67025000),
+    "Neptune": (-0.00041348, 0.68346318, -0.10162547, 7.67025000),
+    "Pluto": (-0.01262724, 0.0, 0.0, 0.0),
+}
+
+# range of the short set in julian centuries from J2000 (1800-2100)
+_SHORT_RANGE = (-2.0, 1.0)
+
+# jupiter & saturn pull on each other far more than mean elements can hold,
+# so in the short range their heliocentric longitude gets these periodic
+# terms, least squares fitted to Swiss Ephemeris over 1800-2100 (the
+# 2J - 5S one is the great inequality). Rows are multipliers of the jupiter &
+# saturn mean anomalies then sin & cos coefficients in degrees, plus a
+# constant & rate per century
+_JUPITER_SATURN_TERMS = {
+    PlanetName.Jupiter: (-0.02749, 0.12042, np.array([
+        (2, -5, -0.09353, 0.21398), (1, -1, -0.00451, 0.01933), (1, -2, -0.03592, -0.00090),
+        (2, -2, -0.05130, -0.02064), (2, -3, 0.01380, 0.01969), (2, -4, -0.00129, 0.00293),
+        (3, -5, -0.00346, 0.00414), (3, -6, -0.00096, 0.00023), (1, -3, -0.00287, -0.00080),
+        (2, -6, -0.00111, 0.00094), (3, -4, -0.00365, 0.00188), (1, -4, -0.00151, -0.00057),
+        (3, -3, -0.00170, 0.00466), (4, -8, 0.00105, -0.00161),
+    ])),
+    PlanetName.Saturn: (0.08658, -0.28201, np.array([
+        (2, -5, 0.23227, -0.53163), (1, -1, 0.01469, 0.00704), (1, -2, 0.11434, 0.01068),
+        (2, -2, 0.00919, 0.00345), (2, -3, 0.00845, 0.01586), (2, -4, -0.02198, 0.00453),
+        (3, -5, -0.00181, 0.00058), (3, -6, 0.00669, -0.01076), (1, -3, 0.02495, 0.00167),
+        (2, -6, 0.00698, -0.02591), (3, -4, 0.00159, -0.00065), (1, -4, 0.00226, -0.00255),
+        (3, -3, 0.00117, -0.00216), (4, -8, 0.00784, -0.00643),
+    ])),
+}
+
+# days light takes to travel 1 au
+_LIGHT_TIME_DAYS = 0.0057755183
+
+
+def _mean_anomaly(body, t):
+    """
+    Mean anomaly in degrees from the short range elements.
+    """
+    (longitude, longitude_rate), (perihelion, perihelion_rate) = _KEPLER_ELEMENTS[body][3:5]
+    return longitude - perihelion + (longitude_rate - perihelion_rate) * t
+
+
+def _jupiter_saturn_correction(body, t):
+    """
+    Periodic correction to the heliocentric longitude in degrees, short range only.
+    """
+    constant, rate, terms = _JUPITER_SATURN_TERMS[body]
+    anomalies = np.stack([_mean_anomaly(PlanetName.Jupiter, t), _mean_anomaly(PlanetName.Saturn, t)], axis=-1)
+    angle = (anomalies * _DEG) @ terms[:, :2].T
+    periodic = np.sin(angle) @ terms[:, 2] + np.cos(angle) @ terms[:, 3]
+    return constant + rate * t + periodic
+
+
+def _heliocentric_position(body, jd_tt):
+    """
+    Heliocentric ecliptic x, y, z (au, J2000 ecliptic & equinox) from the
+    keplerian elements, stacked on the last axis.
+    """
+    t = np.asarray(julian_centuries(jd_tt))
+    short = (t >= _SHORT_RANGE[0]) & (t <= _SHORT_RANGE[1])
+    a, e, inclination, mean_longitude, perihelion, node = (
+        np.where(short, start + rate * t, long_start + long_rate * t)
+        for (start, rate), (long_start, long_rate) in zip(_KEPLER_ELEMENTS[body], _KEPLER_ELEMENTS_LONG[body]))
+
+    anomaly = mean_longitude - perihelion
+    if body in _KEPLER_EXTRA:
+        b, c, s, f = _KEPLER_EXTRA[body]
+        extra = b * t ** 2 + c * np.cos(f * t * _DEG) + s * np.sin(f * t * _DEG)
+        anomaly = np.where(short, anomaly, anomaly + extra)
+    anomaly = ((anomaly + 180.0) % 360.0 - 180.0) * _DEG
+
+    # kepler's equation by newton steps, converges in a few for e < 0.25
+    eccentric = anomaly + e * np.sin(anomaly)
+    for _ in range(5):
+        eccentric = eccentric - (eccentric - e * np.sin(eccentric) - anomaly) / (1.0 - e * np.cos(eccentric))
+
+    x_orbit = a * (np.cos(eccentric) - e)
+    y_orbit = a * np.sqrt(1.0 - e ** 2) * np.sin(eccentric)
+
+    argument = (perihelion - node) * _DEG
+    node, inclination = node * _DEG, inclination * _DEG
+    cos_w, sin_w = np.cos(argument), np.sin(argument)
+    cos_n, sin_n = np.cos(node), np.sin(node)
+    cos_i, sin_i = np.cos(inclination), np.sin(inclination)
+    x = (cos_w * cos_n - sin_w * sin_n * cos_i) * x_orbit + (-sin_w * cos_n - cos_w * sin_n * cos_i) * y_orbit
+    y = (cos_w * sin_n + sin_w * cos_n * cos_i) * x_orbit + (-sin_w * sin_n + cos_w * cos_n * cos_i) * y_orbit
+    z = sin_w * sin_i * x_orbit + cos_w * sin_i * y_orbit
+
+    if body in _JUPITER_SATURN_TERMS:
+        # small turn about the ecliptic pole
+        turn = np.where(short, _jupiter_saturn_correction(body, t), 0.0) * _DEG
+        x, y = x * np.cos(turn) - y * np.sin(turn), x * np.sin(turn) + y * np.cos(turn)
+    return np.stack([x, y, z], axis=-1)
+
+
+def _precess_from_j2000(longitude, latitude, jd_tt):
+    """
+    Ecliptic longitude/latitude (degrees) from the J2000 ecliptic & equinox to
+    the mean ecliptic & equinox of date (Meeus ch. 21).
+    """
+    t = julian_centuries(jd_tt)
+    eta = (47.0029 * t - 0.03302 * t ** 2 + 0.000060 * t ** 3) / 3600.0 * _DEG
+    pi = (174.876384 - (869.8089 * t - 0.03536 * t ** 2) / 3600.0) * _DEG
+    p = (5029.0966 * t + 1.11113 * t ** 2 - 0.000006 * t ** 3) / 3600.0
+
+    longitude, latitude = longitude * _DEG, latitude * _DEG
+    a = np.cos(eta) * np.cos(latitude) * np.sin(pi - longitude) - np.sin(eta) * np.sin(latitude)
+    b = np.cos(latitude) * np.cos(pi - longitude)
+    c = np.cos(eta) * np.sin(latitude) + np.sin(eta) * np.cos(latitude) * np.sin(pi - longitude)
+    return p + (pi - np.arctan2(a, b)) / _DEG, np.arcsin(np.clip(c, -1.0, 1.0)) / _DEG
+
+
+def _planet_mean_equinox_longitude(body, jd_tt):
+    """
+    Geocentric longitude of a planet in degrees, mean equinox of date, with
+    light time, precession from J2000 & annual aberration.
+    """
+    earth = _heliocentric_position("EarthMoon", jd_tt)
+
+    # one light time pass is plenty at this precision
+    geocentric = _heliocentric_position(body, jd_tt) - earth
+    distance = np.linalg.norm(geocentric, axis=-1)
+    geocentric = _heliocentric_position(body, jd_tt - distance * _LIGHT_TIME_DAYS) - earth
+
+    x, y, z = geocentric[..., 0], geocentric[..., 1], geocentric[..., 2]
+    longitude = np.degrees(np.arctan2(y, x))
+    latitude = np.degrees(np.arctan2(z, np.hypot(x, y)))
+    longitude, latitude = _precess_from_j2000(longitude, latitude, jd_tt)
+
+    # annual aberration, 20.49552" towards the apex of the earth's motion
+    sun = _sun_true_longitude(jd_tt)
+    return longitude - 20.49552 / 3600.0 * np.cos((sun - longitude) * _DEG) / np.cos(latitude * _DEG)
+
+
+def _mean_node(jd_tt):
+    """
+    Mean ascending node of the Moon, mean equinox of date (Meeus ch. 47).
+    """
+    t = julian_centuries(jd_tt)
+    return (125.0445479 - 1934.1362891 * t + 0.0020754 * t ** 2
+            + t ** 3 / 467441.0 - t ** 4 / 60616000.0)
+
+
+# periodic terms of the true node about the mean one, multipliers of D, M,
+# M', F & coefficient in degrees, the first 5 are Meeus' (ch. 47), the rest
+# least squares fitted to Swiss Ephemeris over 1800-2200
+_TRUE_NODE_TERMS = np.array([
+    (2, 0, 0, -2, -1.4979), (0, 1, 0, 0, -0.1500), (2, 0, 0, 0, -0.1226), (0, 0, 0, 2, 0.1176),
+    (0, 0, 2, -2, -0.0801), (2, -1, 0, -2, -0.0612), (2, 0, -1, 0, 0.0490), (0, 0, 1, -2, 0.0410),
+    (0, 0, 1, 0, 0.0327), (2, 1, 0, -2, 0.0322), (4, 0, 0, -4, 0.0198), (2, 0, -1, -2, 0.0180),
+    (2, 0, 1, -2, -0.0150), (2, 0, -2, 0, 0.0150),
+])
+
+
+def _true_node(jd_tt):
+    """
+    True (osculating) ascending node, the mean one plus its periodic terms.
+    """
+    _, d, m, mp, f, _ = _moon_arguments(jd_tt)
+    angle = (np.stack([d, m, mp, f], axis=-1) * _DEG) @ _TRUE_NODE_TERMS[:, :4].T
+    return _mean_node(jd_tt) + np.sin(angle) @ _TRUE_NODE_TERMS[:, 4]
+
+
+# longitude from the mean equinox of date for every body as a function of
+# julian day TT, Rahu & Ketu follow the mean node like the API, true node
+# ones are kept under their own keys for anyone who wants them
+_MEAN_EQUINOX_LONGITUDE = {
+    PlanetName.Sun: _sun_mean_equinox_longitude,
+    PlanetName.Moon: _moon_true_longitude,
+    PlanetName.Rahu: _mean_node,
+    PlanetName.Ketu: lambda jd_tt: _mean_node(jd_tt) + 180.0,
+    "TrueRahu": _true_node,
+    "TrueKetu": lambda jd_tt: _true_node(jd_tt) + 180.0,
+}
+for _body in _KEPLER_ELEMENTS:
+    if _body != "EarthMoon":
+        _MEAN_EQUINOX_LONGITUDE[_body] = functools.partial(_planet_mean_equinox_longitude, _body)
+
+# error of the local nirayana (Lahiri) longitudes against Swiss Ephemeris
+# (Moshier) at 10000 random times over 1800-2100, arcseconds as (rms, max).
+# Outside 1800-2100 the inner planets stay about the same, Jupiter to Pluto
+# drop to the long range elements & are good to a few up to ~10 arcminutes rms
+EPHEMERIS_ERROR_BUDGET = {
+    PlanetName.Sun: (12.4, 38.8),
+    PlanetName.Moon: (15.9, 72.0),
+    PlanetName.Mercury: (10.5, 53.4),
+    PlanetName.Venus: (14.4, 90.4),
+    PlanetName.Mars: (34.3, 223.6),
+    PlanetName.Jupiter: (24.2, 78.5),
+    PlanetName.Saturn: (86.7, 238.9),
+    PlanetName.Rahu: (0.2, 0.5),
+    PlanetName.Ketu: (0.2, 0.5),
+    "TrueRahu": (78.3, 238.7),
+    "TrueKetu": (78.3, 238.7),
+    "Uranus": (71.5, 210.9),
+    "Neptune": (31.8, 95.6),
+    "Pluto": (23.2, 60.9),
+}
+
+
+def mean_equinox_longitude(planet, jd):
+    """
+    Tropical longitude from the mean equinox of date (no nutation) in degrees,
+    for julian days (UT).
+    """
+    if planet not in _MEAN_EQUINOX_LONGITUDE:
+        raise ValueError(f"No local ephemeris for {planet}")
+    return _MEAN_EQUINOX_LONGITUDE[planet](terrestrial_time(jd))
+
+
+def mean_heliocentric_longitude(planet, jd):
+    """
+    Mean heliocentric longitude of Mercury to Saturn in degrees, mean equinox
+    of date, straight from the keplerian elements (no perturbations).
+    """
+    if planet not in _KEPLER_ELEMENTS:
+        raise ValueError(f"No keplerian elements for {planet}")
+    (longitude, rate) = _KEPLER_ELEMENTS[planet][3]
+    return longitude + rate * julian_centuries(jd) + general_precession(jd)
+
+
+def _apparent_longitude(planet, times):
+    """
+    Longitude from the true equinox of date (nutation added), in degrees.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    longitude = mean_equinox_longitude(planet, jd) + nutation(terrestrial_time(jd))[0]
+    return _scalar_or_array(longitude % 360.0)
+
+
+def mean_node_longitude(times):
+    """
+    Apparent tropical longitude of the Moon's mean ascending node (mean Rahu)
+    in degrees.
+    """
+    return _apparent_longitude(PlanetName.Rahu, times)
+
+
+def true_node_longitude(times):
+    """
+    Apparent tropical longitude of the Moon's true ascending node in degrees.
+    """
+    return _apparent_longitude("TrueRahu", times)
+
+
+def planet_sayana_longitude(planet, times):
+    """
+    Local equivalent of Calculate.PlanetSayanaLongitude, degrees only.
+
+    Args:
+    planet (PlanetName): Planet to calculate, also "Uranus", "Neptune",
+        "Pluto", "TrueRahu" & "TrueKetu".
+    times: Julian days, Time objects, datetimes or datetime64 arrays.
+    """
+    return _apparent_longitude(planet, times)
+
+
+def planet_nirayana_longitude(planet, times, ayanamsa=None):
+    """
+    Local equivalent of Calculate.PlanetNirayanaLongitude, degrees only.
+
+    Nirayana positions are measured from the mean equinox like the API does,
+    so nutation is left out & only the ayanamsa is taken off.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    longitude = mean_equinox_longitude(planet, jd) - ayanamsa_degree(jd, ayanamsa)
+    return _scalar_or_array(longitude % 360.0)
+
+
+def ephemeris_error_report(recorded, ayanamsa=None):
+    """
+    Check the local ephemeris against recorded reference longitudes, eg:
+    saved Calculate.PlanetNirayanaLongitude or SwissEphemeris outputs.
+
+    Args:
+    recorded (dict): planet -> (julian days UT, nirayana longitudes in degrees).
+    ayanamsa (Ayanamsa): The ayanamsa the recorded values were made with.
+
+    Returns planet -> dict of rms & max error in arcseconds plus the count,
+    same layout as EPHEMERIS_ERROR_BUDGET for easy comparison.
+    """
+    report = {}
+    for planet, (jd, reference) in recorded.items():
+        local = np.atleast_1d(planet_nirayana_longitude(planet, np.asarray(jd, dtype=np.float64), ayanamsa))
+        error = np.abs(angle_difference(local, np.asarray(reference, dtype=np.float64))) * 3600.0
+        report[planet] = {"rms": float(np.sqrt(np.mean(error ** 2))), "max": float(error.max()), "count": error.size}
+    return report
@@ -0,0 +1,234 @@
+import numpy as np
+
+from .vedastro import HouseName, PlanetName
+from .julian_day import to_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .transit import ingress_times
+from .dasa import VimshottariDasa
+from .validation import parity_table
+
+__all__ = [
+    "GOCHARA_PLANETS",
+    "GOCHARA_VEDHA",
+    "EventPredicate",
+    "gochara_predicates",
+    "dasa_gochara_predicates",
+    "GocharaTimeline",
+    "gochara_parity_table",
+]
+
+GOCHARA_PLANETS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury, PlanetName.Jupiter,
+    PlanetName.Venus, PlanetName.Saturn, PlanetName.Rahu, PlanetName.Ketu,
+]
+
+# good gochara houses (from the birth Moon sign) -> their vedha house, a
+# planet in the vedha house obstructs the good result. Rahu & Ketu go by Saturn
+GOCHARA_VEDHA = {
+    PlanetName.Sun: {3: 9, 6: 12, 10: 4, 11: 5},
+    PlanetName.Moon: {1: 5, 3: 9, 6: 12, 7: 2, 10: 4, 11: 8},
+    PlanetName.Mars: {3: 12, 6: 9, 11: 5},
+    PlanetName.Mercury: {2: 5, 4: 3, 6: 9, 8: 1, 10: 8, 11: 12},
+    PlanetName.Jupiter: {2: 12, 5: 4, 7: 3, 9: 10, 11: 8},
+    PlanetName.Venus: {1: 8, 2: 7, 3: 1, 4: 10, 5: 9, 8: 5, 9: 11, 11: 3, 12: 6},
+    PlanetName.Saturn: {3: 12, 6: 9, 11: 5},
+    PlanetName.Rahu: {3: 12, 6: 9, 11: 5},
+    PlanetName.Ketu: {3: 12, 6: 9, 11: 5},
+}
+
+# father & son never obstruct each other
+_NO_VEDHA_PAIRS = {frozenset((PlanetName.Sun, PlanetName.Saturn)), frozenset((PlanetName.Moon, PlanetName.Mercury))}
+
+# state key of the running dasa lords
+_DASA = "Dasa"
+
+
+class EventPredicate:
+    def __init__(self, name, inputs, test, tag="Gochara", nature="Neutral"):
+        """
+        One event the timeline tracks.
+
+        Args:
+        name (str): Event name, eg: "SunGocharaInHouse3".
+        inputs (tuple): State keys the test reads, planets (their gochara
+            house) & "Dasa" (tuple of running lords). The test only runs
+            again when one of these changes.
+        test (callable): test(state) -> bool, state maps each key to its value.
+        tag, nature (str): Carried into the event rows.
+        """
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.test = test
+        self.tag = tag
+        self.nature = nature
+
+
+def _obstructed(planet, house, state):
+    vedha = GOCHARA_VEDHA[planet].get(house)
+    if vedha is None:
+        return False
+    return any(state[other] == vedha for other in GOCHARA_PLANETS
+               if other != planet and frozenset((planet, other)) not in _NO_VEDHA_PAIRS)
+
+
+def _gochara_occurring(planet, house):
+    return lambda state: state[planet] == house and not _obstructed(planet, house, state)
+
+
+def gochara_predicates(planets=None):
+    """
+    "<Planet>GocharaInHouse<n>" for every planet & house 1-12, counted from
+    the birth Moon sign. Good houses need no planet in their vedha house,
+    like Calculate.IsGocharaOccurring.
+    """
+    predicates = []
+    for planet in planets or GOCHARA_PLANETS:
+        for house in range(1, 13):
+            good = house in GOCHARA_VEDHA[planet]
+            # good results can be obstructed by any other planet
+            inputs = tuple(GOCHARA_PLANETS) if good else (planet,)
+            predicates.append(EventPredicate(f"{planet.name}GocharaInHouse{house}", inputs,
+                                             _gochara_occurring(planet, house),
+                                             nature="Good" if good else "Bad"))
+    return predicates
+
+
+def dasa_gochara_predicates():
+    """
+    "DasaLordGocharaGood" & "DasaLordGocharaBad", whether the lord of the
+    deepest running dasa transits a good (unobstructed) house or not.
+    """
+    def good(state):
+        lord = state[_DASA][-1]
+        house = state[lord]
+        return house in GOCHARA_VEDHA[lord] and not _obstructed(lord, house, state)
+
+    inputs = (_DASA,) + tuple(GOCHARA_PLANETS)
+    return [
+        EventPredicate("DasaLordGocharaGood", inputs, good, tag="DasaGochara", nature="Good"),
+        EventPredicate("DasaLordGocharaBad", inputs, lambda state: not good(state), tag="DasaGochara", nature="Bad"),
+    ]
+
+
+class GocharaTimeline:
+    def __init__(self, birth_time, start_time, end_time, predicates=None, dasa_levels=0, ayanamsa=None):
+        """
+        Exact start & end of gochara events between two times. Inputs only
+        change at a sign ingress or a dasa change, so predicates are tested
+        at those instants & only the ones reading the changed input, instead
+        of scanning at a fixed precisionHours like Calculate.EventsAtRange.
+
+        Args:
+        birth_time: Birth time, Time, datetime or julian day.
+        start_time, end_time: Range to scan.
+        predicates (list): EventPredicate list, defaults to gochara_predicates().
+        dasa_levels (int): Vimshottari depth tracked as "Dasa", 0 for none,
+            needs at least 1 with dasa_gochara_predicates.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+
+        events holds (name, tag, nature, start, end) rows in julian days UT,
+        evaluations counts the predicate tests done.
+        """
+        start = float(to_julian_day(start_time))
+        end = float(to_julian_day(end_time))
+        self.predicates = predicates if predicates is not None else gochara_predicates()
+        if not dasa_levels and any(_DASA in predicate.inputs for predicate in self.predicates):
+            raise ValueError(f"Predicates read \"{_DASA}\", set dasa_levels to 1 or more")
+        moon_sign = int(planet_nirayana_longitude(PlanetName.Moon, to_julian_day(birth_time), ayanamsa) // 30.0)
+
+        def house(sign):
+            return (int(sign) - moon_sign) % 12 + 1
+
+        # state at the start & every change after it, from the ingress timeline
+        state = {planet: house(planet_nirayana_longitude(planet, start, ayanamsa) // 30.0) for planet in GOCHARA_PLANETS}
+        changes = []
+        for planet in GOCHARA_PLANETS:
+            times, _, signs = ingress_times(planet, start, end, 30.0, ayanamsa)
+            changes += [(time, planet, house(sign)) for time, sign in zip(times.tolist(), signs.tolist())]
+        if dasa_levels:
+            periods = list(VimshottariDasa(birth_time, ayanamsa=ayanamsa).at_range(start, end, dasa_levels))
+            state[_DASA] = periods[0].lords
+            changes += [(period.start, _DASA, period.lords) for period in periods[1:]]
+        changes.sort(key=lambda change: change[0])
+
+        dependents = {}
+        for predicate in self.predicates:
+            for key in predicate.inputs:
+                dependents.setdefault(key, []).append(predicate)
+
+        active = {predicate.name: start for predicate in self.predicates if predicate.test(state)}
+        self.evaluations = len(self.predicates)
+        events = []
+        for time, key, value in changes:
+            if state[key] == value:
+                continue
+            state[key] = value
+            for predicate in dependents.get(key, ()):
+                self.evaluations += 1
+                occurring = predicate.test(state)
+                if occurring and predicate.name not in active:
+                    active[predicate.name] = time
+                elif not occurring and predicate.name in active:
+                    events.append((predicate, active.pop(predicate.name), time))
+        by_name = {predicate.name: predicate for predicate in self.predicates}
+        events += [(by_name[name], began, end) for name, began in active.items()]
+
+        events.sort(key=lambda event: (event[1], event[0].name))
+        self.events = [(predicate.name, predicate.tag, predicate.nature, began, ended)
+                       for predicate, began, ended in events if ended > began]
+        self.starts = np.array([event[3] for event in self.events])
+        self.ends = np.array([event[4] for event in self.events])
+
+    def events_at_time(self, check_time):
+        """
+        Names of the events running at one time, like Calculate.EventsAtTime.
+        """
+        jd = float(to_julian_day(check_time))
+        # events are sorted by start, only those begun by then can be running
+        count = np.searchsorted(self.starts, jd, side="right")
+        return [self.events[index][0] for index in np.flatnonzero(self.ends[:count] > jd)]
+
+    def rows(self):
+        """
+        One dict per event, start & end julian days UT.
+        """
+        return [{"Name": name, "Tag": tag, "Nature": nature, "Start": began, "End": ended}
+                for name, tag, nature, began, ended in self.events]
+
+
+def gochara_parity_table(birth_time, times, planets=None):
+    """
+    Compare the gochara house & whether it is occurring against the API,
+    one call per row, 0 when they agree.
+
+    Args:
+    birth_time (Time): Birth time.
+    times (list): Time objects to check.
+    planets (list): Defaults to GOCHARA_PLANETS.
+    """
+    from .calculate import Calculate
+
+    planets = planets or GOCHARA_PLANETS
+    moon_sign = int(planet_nirayana_longitude(PlanetName.Moon, to_julian_day(birth_time)) // 30.0)
+
+    def state_at(time):
+        return {planet: (int(planet_nirayana_longitude(planet, to_julian_day(time)) // 30.0) - moon_sign) % 12 + 1
+                for planet in GOCHARA_PLANETS}
+
+    def local(case):
+        method, planet, time = case
+        state = state_at(time)
+        if method == "GocharaZodiacSignCountFromMoon":
+            return state[planet]
+        return _gochara_occurring(planet, state[planet])(state)
+
+    def remote(case):
+        method, planet, time = case
+        if method == "GocharaZodiacSignCountFromMoon":
+            return int(str(Calculate.GocharaZodiacSignCountFromMoon(birth_time, time, planet)).strip())
+        house = HouseName(f"House{state_at(time)[planet]}")
+        return str(Calculate.IsGocharaOccurring(birth_time, time, planet, house)).strip().lower() == "true"
+
+    cases = [(method, planet, time) for time in times for planet in planets
+             for method in ("GocharaZodiacSignCountFromMoon", "IsGocharaOccurring")]
+    return parity_table(cases, local, remote, parse=lambda value: value, compare=lambda a, b: int(a != b))
@@ -0,0 +1,180 @@
+from enum import Enum
+
+import numpy as np
+
+from .vedastro import DayOfWeek, GeoLocation, Time, ZodiacName
+from .calculate import Calculate
+from .julian_day import to_julian_day, julian_day_to_time, local_dates, api_julian_day
+from .tables import house_index
+from .houses import ascendant_longitude, HouseCusps
+from .sunrise import SunriseTable, vedic_day_bounds, is_day_birth, is_night_birth, is_before_sunrise
+from .upagraha import WEEKDAY_LORDS, weekday_index
+from .hora import panchaka, hora_lord_index
+from .shadbala import Shadbala, SHADBALA_PLANETS
+from .series import series_time_parameter, series_request_key, fetch_cached_payloads
+from .validation import parse_degrees
+
+__all__ = [
+    "LOCAL_GRID_ENDPOINTS",
+    "grid_axes",
+    "calculate_grid",
+]
+
+_SIGN_NAMES = np.array([sign.name for sign in ZodiacName], dtype=object)
+_DAY_NAMES = np.array([day.name for day in DayOfWeek], dtype=object)
+_LORD_NAMES = np.array([planet.name for planet in WEEKDAY_LORDS], dtype=object)
+
+
+def _lagna_sign(jd, date, latitude, longitude, args):
+    return np.floor(ascendant_longitude(jd, latitude, longitude) / 30.0).astype(np.int64) % 12
+
+
+def _house_sign(jd, date, latitude, longitude, args):
+    # sign of the house middle, as the API does, not whole sign houses
+    middle = HouseCusps(jd, latitude, longitude).middle[..., house_index(args["houseNumber"])]
+    return np.floor(middle / 30.0).astype(np.int64) % 12
+
+
+def _sunrise_table(date, latitude, longitude):
+    return SunriseTable(date, latitude, longitude, grid=False)
+
+
+def _lord_of_hora(jd, date, latitude, longitude, args):
+    sunrise, _, next_sunrise = vedic_day_bounds(jd, latitude, longitude)
+    hora = np.floor((jd - sunrise) / (next_sunrise - sunrise) * 24.0).astype(np.int64)
+    return _LORD_NAMES[hora_lord_index(hora, weekday_index(sunrise, longitude))]
+
+
+# endpoint -> engine(jd, civil date, latitude grid, longitude grid, args),
+# times come back as julian days (UT) & names as strings
+LOCAL_GRID_ENDPOINTS = {
+    "LagnaSignName": lambda *a: _SIGN_NAMES[_lagna_sign(*a)],
+    "HouseSignName": lambda jd, date, lat, lon, args:
+        _SIGN_NAMES[_house_sign(jd, date, lat, lon, args)],
+    "HouseLongitude": lambda jd, date, lat, lon, args:
+        HouseCusps(jd, lat, lon).middle[..., house_index(args["houseNumber"])],
+    "SunriseTime": lambda jd, date, lat, lon, args: _sunrise_table(date, lat, lon).sunrise,
+    "SunsetTime": lambda jd, date, lat, lon, args: _sunrise_table(date, lat, lon).sunset,
+    "NoonTime": lambda jd, date, lat, lon, args: _sunrise_table(date, lat, lon).noon,
+    "DayDurationHours": lambda jd, date, lat, lon, args: _sunrise_table(date, lat, lon).day_duration_hours,
+    "IsDayBirth": lambda jd, date, lat, lon, args: is_day_birth(jd, lat, lon),
+    "IsNightBirth": lambda jd, date, lat, lon, args: is_night_birth(jd, lat, lon),
+    "IsBeforeSunrise": lambda jd, date, lat, lon, args: is_before_sunrise(jd, lat, lon),
+    "VedicDayStartTime": lambda jd, date, lat, lon, args: vedic_day_bounds(jd, lat, lon)[0],
+    "DayOfWeek": lambda jd, date, lat, lon, args:
+        _DAY_NAMES[weekday_index(vedic_day_bounds(jd, lat, lon)[0], lon)],
+    "LordOfHoraFromTime": _lord_of_hora,
+    "Panchaka": lambda jd, date, lat, lon, args: panchaka(jd, lat, lon),
+    "PlanetShadbalaPinda": lambda jd, date, lat, lon, args:
+        Shadbala(jd, lat, lon).pinda[..., SHADBALA_PLANETS.index(args["planetName"])],
+}
+
+
+def grid_axes(lat_range, lon_range, step):
+    """
+    Latitudes & longitudes of the grid, both ends included.
+
+    Args:
+    lat_range, lon_range (tuple): (first, last) in degrees.
+    step (float or tuple): Spacing in degrees, or (lat_step, lon_step).
+    """
+    lat_step, lon_step = step if isinstance(step, (tuple, list)) else (step, step)
+    latitudes = np.arange(lat_range[0], lat_range[1] + lat_step / 2.0, lat_step)
+    longitudes = np.arange(lon_range[0], lon_range[1] + lon_step / 2.0, lon_step)
+    return latitudes, longitudes
+
+
+def _cell_value(payload, time):
+    """
+    One plottable value out of an API payload, degrees & numbers as float,
+    times as julian days (UT), anything else as text.
+    """
+    if isinstance(payload, Exception) or (isinstance(payload, str) and payload.startswith("Error:")):
+        return None
+    if isinstance(payload, Enum):
+        return payload.name
+    if isinstance(payload, dict):
+        try:
+            return parse_degrees(payload)
+        except ValueError:
+            return str(payload.get("Name", payload))
+    if isinstance(payload, (bool, int, float)):
+        return payload
+    text = str(payload).strip()
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        return api_julian_day(text, time)
+    except (AttributeError, ValueError):
+        return text
+
+
+def _remote_grid(calculate, endpoint, time, latitudes, longitudes, max_workers, args):
+    """
+    One request per cell on a thread pool, cached like Calculate.series.
+    The location name is "latitude,longitude" as the API has no other way
+    to take coordinates.
+    """
+    time_parameter = series_time_parameter(getattr(calculate, endpoint), args)
+    shared = series_request_key(calculate, endpoint, args)
+
+    cells = [Time(time.time_string, GeoLocation(f"{latitude:.4f},{longitude:.4f}", longitude, latitude))
+             for latitude in latitudes for longitude in longitudes]
+    keys = [(cell.time_string, cell.geolocation.location_name) + shared for cell in cells]
+
+    payloads = fetch_cached_payloads(calculate, endpoint, time_parameter, dict(zip(keys, cells)), max_workers, args)
+    values = [_cell_value(payloads[key], cell) for key, cell in zip(keys, cells)]
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        result = np.array([np.nan if value is None else value for value in values], dtype=np.float64)
+    else:
+        result = np.array(values, dtype=object)
+    return result.reshape(len(latitudes), len(longitudes))
+
+
+def calculate_grid(calculate, endpoint, time, lat_range, lon_range, step, offset="+00:00",
+                   max_workers=16, local=True, **args):
+    """
+    Evaluate one endpoint over a latitude x longitude grid at a single
+    instant, see Calculate.grid.
+    """
+    latitudes, longitudes = grid_axes(lat_range, lon_range, step)
+    if not isinstance(time, Time):
+        time = julian_day_to_time(to_julian_day(time), GeoLocation("", 0.0, 0.0), offset)
+
+    if local and endpoint in LOCAL_GRID_ENDPOINTS:
+        latitude, longitude = np.meshgrid(latitudes, longitudes, indexing="ij")
+        jd = float(to_julian_day(time))
+        result = LOCAL_GRID_ENDPOINTS[endpoint](jd, local_dates(time), latitude, longitude, args)
+        return np.broadcast_to(result, latitude.shape).copy()
+    return _remote_grid(calculate, endpoint, time, latitudes, longitudes, max_workers, args)
+
+
+def _grid(cls, endpoint, time, lat_range, lon_range, step, offset="+00:00", max_workers=16, local=True, **args):
+    """
+    One endpoint over a latitude x longitude grid at one instant, eg:
+    Calculate.grid("LagnaSignName", time, (-60, 60), (-180, 180), 2).
+
+    Args:
+    endpoint (str): Calculate method name.
+    time: Time, datetime or julian day, same instant for every cell.
+    lat_range, lon_range (tuple): (first, last) in degrees, both included.
+    step (float or tuple): Spacing in degrees, or (lat_step, lon_step).
+    offset (str): Timezone offset when time is not a Time object.
+    max_workers (int): Requests in flight at once.
+    local (bool): False to send LOCAL_GRID_ENDPOINTS to the API too.
+    args: Other arguments of the endpoint, by name.
+
+    Returns a (latitudes, longitudes) numpy array, rows from lat_range[0],
+    ready for imshow/pcolormesh. Endpoints in LOCAL_GRID_ENDPOINTS are
+    computed locally in one pass, the rest are concurrent cached requests,
+    times come back as julian days & names as text.
+    """
+    return calculate_grid(cls, endpoint, time, lat_range, lon_range, step, offset, max_workers, local, **args)
+
+
+Calculate.grid = classmethod(_grid)
@@ -0,0 +1,237 @@
+import numpy as np
+
+from .vedastro import DayOfWeek, PlanetName
+from .julian_day import to_julian_day, local_dates, api_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .houses import ascendant_longitude
+from .sunrise import HINDU_RISING_ALTITUDE, SunriseTable, vedic_day_bounds
+from .upagraha import WEEKDAY_LORDS, weekday_index
+from .validation import parity_table
+
+__all__ = [
+    "HORA_LORD_ORDER",
+    "PANCHAKA_NAMES",
+    "NO_PANCHAKA",
+    "hora_lord_index",
+    "lord_of_hora_from_weekday",
+    "DayTimetable",
+    "panchaka",
+    "hora_parity_table",
+]
+
+# hora lords follow the planets in order of decreasing orbital period, the
+# first hora of a day belongs to the weekday lord
+HORA_LORD_ORDER = [
+    PlanetName.Saturn, PlanetName.Jupiter, PlanetName.Mars, PlanetName.Sun,
+    PlanetName.Venus, PlanetName.Mercury, PlanetName.Moon,
+]
+
+# remainder of (lunar day + weekday + constellation + lagna) / 9 -> panchaka,
+# every other remainder is free of panchaka
+PANCHAKA_NAMES = {1: "Mrityu", 2: "Agni", 4: "Raja", 6: "Chora", 8: "Roga"}
+NO_PANCHAKA = "Shubha"
+
+# same order as weekday lord indexes (Sun 0 ... Saturn 6)
+_HORA_ORDER = np.array([WEEKDAY_LORDS.index(planet) for planet in HORA_LORD_ORDER])
+_HORA_POSITION = np.argsort(_HORA_ORDER)
+
+_WEEKDAY_LORDS = np.array(WEEKDAY_LORDS, dtype=object)
+_DAYS_OF_WEEK = np.array(list(DayOfWeek), dtype=object)
+
+
+def hora_lord_index(hora_index, weekday):
+    """
+    Weekday lord index (Sun 0 ... Saturn 6) ruling the 0 based hora of a day.
+    """
+    return _HORA_ORDER[(_HORA_POSITION[weekday] + hora_index) % 7]
+
+
+def _single(values):
+    values = np.asarray(values)
+    return values.item() if values.ndim == 0 else values
+
+
+def lord_of_hora_from_weekday(hora, day):
+    """
+    Lord of hora 1-24 of a weekday, like Calculate.LordOfHoraFromWeekday.
+
+    Args:
+    hora (int or array): Hora number counted from sunrise, 1-24.
+    day (DayOfWeek or int): Weekday, DayOfWeek or 0 (Sunday) to 6.
+    """
+    weekday = day.value - 1 if isinstance(day, DayOfWeek) else np.asarray(day, dtype=np.int64)
+    return _single(_WEEKDAY_LORDS[hora_lord_index(np.asarray(hora, dtype=np.int64) - 1, weekday)])
+
+
+class DayTimetable:
+    def __init__(self, dates, latitude, longitude, altitude=HINDU_RISING_ALTITUDE):
+        """
+        Hora & yama timetable of every vedic day (sunrise to next sunrise) for
+        every location, queried by binary search instead of one call per time.
+
+        Args:
+        dates: Calendar days whose sunrise starts a vedic day, as Time objects,
+            dates, datetime64 or julian days. Sorted & deduplicated.
+        latitude, longitude (float or array): Degrees, one entry per location.
+        altitude (float): Sun centre altitude at rise, see sunrise.py.
+
+        Arrays are (days, locations, ...), julian days (UT):
+        sunrise, sunset, next_sunrise, weekday (0 Sunday ... 6),
+        hora_edges (.., 25) & hora_lords (.., 24) index into WEEKDAY_LORDS,
+        yama_edges (.., 11), the day split into 10 yamas of 6 ghatikas each.
+        Times are looked up for one location at a time, 0 by default.
+        """
+        days = np.unique(np.atleast_1d(local_dates(dates)))
+        self.latitude = np.atleast_1d(np.asarray(latitude, dtype=np.float64))
+        self.longitude = np.atleast_1d(np.asarray(longitude, dtype=np.float64))
+
+        # next sunrise from the same table so consecutive days share an edge
+        table = SunriseTable(np.concatenate([days, days + 1.0]), self.latitude, self.longitude, altitude)
+        count = len(days)
+        self.dates = days
+        self.sunrise = table.sunrise[:count]
+        self.sunset = table.sunset[:count]
+        self.next_sunrise = table.sunrise[count:]
+        if np.any(~table.rises | ~table.sets):
+            raise ValueError("The Sun does not rise & set on every date at this latitude, "
+                             "horas & yamas need both")
+        self.weekday = weekday_index(self.sunrise, self.longitude)
+
+        length = (self.next_sunrise - self.sunrise)[..., None]
+        self.hora_edges = self.sunrise[..., None] + length * (np.arange(25) / 24.0)
+        self.hora_lords = hora_lord_index(np.arange(24), self.weekday[..., None])
+
+        # a yama is 6 ghatikas (2h24m), 10 of them from sunrise, not 5 per day & night
+        self.yama_edges = self.sunrise[..., None] + length * (np.arange(11) / 10.0)
+
+    def _locate(self, times, location):
+        """
+        Day index & 0 based hora of each time, binary search over the flat
+        list of hora starts of that location.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        starts = self.hora_edges[:, location, :24].ravel()
+        ends = self.hora_edges[:, location, 1:].ravel()
+        slot = np.searchsorted(starts, jd, side="right") - 1
+        inside = (slot >= 0) & (jd < ends[np.clip(slot, 0, None)])
+        if not np.all(inside):
+            raise ValueError("Time outside the timetable, include its date (or the day before) in dates")
+        day, hora = np.divmod(slot, 24)
+        return jd, day, hora
+
+    def vedic_day_start_time(self, times, location=0):
+        """
+        Sunrise that started the vedic day of each time, like Calculate.VedicDayStartTime.
+        """
+        _, day, _ = self._locate(times, location)
+        return _single(self.sunrise[day, location])
+
+    def day_of_week(self, times, location=0):
+        """
+        Vedic weekday (changes at sunrise) as DayOfWeek, like Calculate.DayOfWeek.
+        """
+        _, day, _ = self._locate(times, location)
+        return _single(_DAYS_OF_WEEK[self.weekday[day, location]])
+
+    def lord_of_weekday(self, times, location=0):
+        """
+        Like Calculate.LordOfWeekday.
+        """
+        _, day, _ = self._locate(times, location)
+        return _single(_WEEKDAY_LORDS[self.weekday[day, location]])
+
+    def hora_at_birth(self, times, location=0):
+        """
+        Hora number 1-24 counted from sunrise, like Calculate.HoraAtBirth.
+        """
+        _, _, hora = self._locate(times, location)
+        return _single(hora + 1)
+
+    def lord_of_hora_from_time(self, times, location=0):
+        """
+        Like Calculate.LordOfHoraFromTime.
+        """
+        _, day, hora = self._locate(times, location)
+        return _single(_WEEKDAY_LORDS[self.hora_lords[day, location, hora]])
+
+    def birth_yama(self, times, location=0):
+        """
+        Yama 1-10 the time falls in counted from sunrise, like Calculate.BirthYama.
+        """
+        jd, day, _ = self._locate(times, location)
+        edges = self.yama_edges[day, location]
+        return _single(np.sum(edges[..., 1:-1] <= np.asarray(jd)[..., None], axis=-1) + 1)
+
+    def hora_table(self, day_index, location=0):
+        """
+        The 24 horas of one day as rows of hora number, start, end & lord.
+        """
+        edges = self.hora_edges[day_index, location]
+        lords = self.hora_lords[day_index, location]
+        return [{"Hora": hora + 1, "Start": float(edges[hora]), "End": float(edges[hora + 1]),
+                 "Lord": WEEKDAY_LORDS[lords[hora]]} for hora in range(24)]
+
+
+def panchaka(times, latitude, longitude, ayanamsa=None):
+    """
+    Panchaka name (see PANCHAKA_NAMES, else "Shubha") for each time, like
+    Calculate.Panchaka. Lunar day, vedic weekday (Sunday 1), Moon
+    constellation & lagna sign are added & divided by 9.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    sun = planet_nirayana_longitude(PlanetName.Sun, jd, ayanamsa)
+    moon = planet_nirayana_longitude(PlanetName.Moon, jd, ayanamsa)
+    lagna = ascendant_longitude(jd, latitude, longitude, ayanamsa)
+    sunrise, _, _ = vedic_day_bounds(jd, latitude, longitude)
+
+    lunar_day = np.floor(((moon - sun) % 360.0) / 12.0) + 1
+    weekday = weekday_index(sunrise, longitude) + 1
+    constellation = np.floor(moon / (360.0 / 27.0)) + 1
+    sign = np.floor(lagna / 30.0) + 1
+    remainder = (lunar_day + weekday + constellation + sign).astype(np.int64) % 9
+
+    names = np.array([PANCHAKA_NAMES.get(number, NO_PANCHAKA) for number in range(9)], dtype=object)
+    return _single(names[remainder])
+
+
+def hora_parity_table(times):
+    """
+    Compare the timetable & panchaka against the API, one call per row.
+    Values that agree give 0, VedicDayStartTime differs in minutes.
+
+    Args:
+    times (list): Time objects, the place comes from their geolocation.
+    """
+    from .calculate import Calculate
+
+    def timetable(time):
+        geolocation = time.geolocation
+        # the day before too, for times ahead of that day's sunrise
+        return DayTimetable(to_julian_day(time) + np.array([-1.0, 0.0]), geolocation.latitude, geolocation.longitude)
+
+    local = {
+        "VedicDayStartTime": lambda time: float(timetable(time).vedic_day_start_time(time)),
+        "DayOfWeek": lambda time: timetable(time).day_of_week(time).name,
+        "LordOfWeekday": lambda time: timetable(time).lord_of_weekday(time).name,
+        "HoraAtBirth": lambda time: int(timetable(time).hora_at_birth(time)),
+        "LordOfHoraFromTime": lambda time: timetable(time).lord_of_hora_from_time(time).name,
+        "BirthYama": lambda time: int(timetable(time).birth_yama(time)),
+        "Panchaka": lambda time: panchaka(time, time.geolocation.latitude, time.geolocation.longitude),
+    }
+
+    def remote(case):
+        method, time = case
+        value = getattr(Calculate, method)(time)
+        if method == "VedicDayStartTime":
+            return api_julian_day(value, time)
+        text = str(value).strip()
+        return int(text) if text.isdigit() else text
+
+    def compare(a, b):
+        if isinstance(a, float):
+            return (a - b) * 1440.0
+        return int(str(a).lower() != str(b).lower())
+
+    cases = [(method, time) for time in times for method in local]
+    return parity_table(cases, lambda case: local[case[0]](case[1]), remote,
+                        parse=lambda value: value, compare=compare)
@@ -0,0 +1,193 @@
+import numpy as np
+
+from .julian_day import J2000, julian_centuries, to_julian_day
+from .tables import house_index
+from .ayanamsa import ayanamsa_degree
+from .ephemeris import nutation, true_obliquity, delta_t_seconds
+
+__all__ = [
+    "local_sidereal_time",
+    "ascendant_longitude",
+    "midheaven_longitude",
+    "ascendant_degrees_to_armc",
+    "HouseCusps",
+]
+
+_DEG = np.pi / 180.0
+
+
+def local_sidereal_time(times, longitude):
+    """
+    Local apparent sidereal time in degrees (the ARMC), broadcasts times
+    against longitudes so a (T, 1) x (L,) call gives a (T, L) grid.
+
+    Args:
+    times: Julian days, Time objects, datetimes or datetime64 arrays.
+    longitude (float or array): East longitude in degrees.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    t = julian_centuries(jd)
+    mean = (280.46061837 + 360.98564736629 * (jd - J2000)
+            + 0.000387933 * t ** 2 - t ** 3 / 38710000.0)
+
+    # equation of the equinoxes, nutation runs on TT
+    jd_tt = jd + delta_t_seconds(jd) / 86400.0
+    apparent = mean + nutation(jd_tt)[0] * np.cos(true_obliquity(jd_tt) * _DEG)
+    return (apparent + np.asarray(longitude, dtype=np.float64)) % 360.0
+
+
+def _ascendant_from_armc(armc, obliquity, latitude):
+    """
+    Tropical ascendant (true equinox) from ARMC, obliquity & latitude, degrees.
+    """
+    armc = np.asarray(armc) * _DEG
+    obliquity = np.asarray(obliquity) * _DEG
+    latitude = np.asarray(latitude) * _DEG
+    y = np.cos(armc)
+    x = -(np.sin(armc) * np.cos(obliquity) + np.tan(latitude) * np.sin(obliquity))
+    return np.degrees(np.arctan2(y, x)) % 360.0
+
+
+def _midheaven_from_armc(armc, obliquity):
+    """
+    Tropical midheaven (true equinox) from ARMC & obliquity, degrees.
+    """
+    armc = np.asarray(armc) * _DEG
+    obliquity = np.asarray(obliquity) * _DEG
+    return np.degrees(np.arctan2(np.sin(armc), np.cos(armc) * np.cos(obliquity))) % 360.0
+
+
+def ascendant_degrees_to_armc(ascendant, obliquity, latitude):
+    """
+    ARMC that puts the given tropical ascendant on the horizon, inverse of
+    the ascendant formula, like Calculate.AscendantDegreesToARMC.
+
+    Args:
+    ascendant (float or array): Tropical ascendant in degrees.
+    obliquity (float or array): Obliquity of the ecliptic in degrees.
+    latitude (float or array): Geographic latitude in degrees.
+    """
+    ascendant = np.asarray(ascendant, dtype=np.float64) * _DEG
+    obliquity = np.asarray(obliquity, dtype=np.float64) * _DEG
+    latitude = np.asarray(latitude, dtype=np.float64) * _DEG
+
+    # right ascension & declination of the rising point, then its oblique
+    # ascension, the meridian is 90 degrees behind that
+    right_ascension = np.arctan2(np.sin(ascendant) * np.cos(obliquity), np.cos(ascendant))
+    declination = np.arcsin(np.sin(obliquity) * np.sin(ascendant))
+    oblique_ascension = right_ascension - np.arcsin(np.clip(np.tan(declination) * np.tan(latitude), -1.0, 1.0))
+    armc = (np.degrees(oblique_ascension) - 90.0) % 360.0
+    return armc if np.ndim(armc) else float(armc)
+
+
+def ascendant_longitude(times, latitude, longitude, ayanamsa=None, sayana=False):
+    """
+    Longitude of the rising point, nirayana unless sayana is set.
+
+    Args:
+    times: Julian days, Time objects, datetimes or datetime64 arrays.
+    latitude (float or array): Geographic latitude in degrees, north positive.
+    longitude (float or array): East longitude in degrees.
+    ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+    sayana (bool): Return the tropical ascendant instead.
+
+    Inputs broadcast against each other like numpy arrays.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    jd_tt = jd + delta_t_seconds(jd) / 86400.0
+    armc = local_sidereal_time(jd, longitude)
+    ascendant = _ascendant_from_armc(armc, true_obliquity(jd_tt), latitude)
+    if not sayana:
+        # same as planets: back to the mean equinox, then the ayanamsa
+        ascendant = (ascendant - nutation(jd_tt)[0] - ayanamsa_degree(jd, ayanamsa)) % 360.0
+    return ascendant if np.ndim(ascendant) else float(ascendant)
+
+
+def midheaven_longitude(times, longitude, ayanamsa=None, sayana=False):
+    """
+    Longitude of the MC (tenth house middle), nirayana unless sayana is set.
+    Latitude does not move the MC so only the east longitude is needed.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    jd_tt = jd + delta_t_seconds(jd) / 86400.0
+    midheaven = _midheaven_from_armc(local_sidereal_time(jd, longitude), true_obliquity(jd_tt))
+    if not sayana:
+        midheaven = (midheaven - nutation(jd_tt)[0] - ayanamsa_degree(jd, ayanamsa)) % 360.0
+    return midheaven if np.ndim(midheaven) else float(midheaven)
+
+
+class HouseCusps:
+    def __init__(self, times, latitude, longitude, ayanamsa=None, sayana=False):
+        """
+        Sripati bhavas for every (time, latitude, longitude) at once, same as
+        Calculate.AllHouseLongitudes. Ascendant & MC are the middles of house
+        1 & 10, the arcs between the four angles are split in three & the
+        junction (sandhi) of two houses is halfway between their middles.
+
+        Args:
+        times: Julian days, Time objects, datetimes or datetime64 arrays.
+        latitude, longitude (float or array): Degrees, north & east positive.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+        sayana (bool): Tropical cusps instead of nirayana.
+
+        Inputs broadcast against each other, begin, middle & end then have
+        that shape plus a last axis of 12 (House1 first). armc, ascendant &
+        midheaven keep the broadcast shape.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        jd_tt = jd + delta_t_seconds(jd) / 86400.0
+        obliquity = true_obliquity(jd_tt)
+
+        armc = local_sidereal_time(jd, longitude)
+        ascendant = _ascendant_from_armc(armc, obliquity, latitude)
+        midheaven = _midheaven_from_armc(armc, obliquity)
+        ascendant, midheaven = np.broadcast_arrays(ascendant, midheaven)
+
+        # one shift takes everything from true equinox to nirayana
+        shift = 0.0 if sayana else nutation(jd_tt)[0] + ayanamsa_degree(jd, ayanamsa)
+
+        # angles in house order: 1 (asc), 4 (IC), 7 (desc), 10 (MC), each arc
+        # up to the next angle holds 3 houses
+        angles = np.stack([ascendant, midheaven + 180.0, ascendant + 180.0, midheaven], axis=-1)
+        arcs = (np.roll(angles, -1, axis=-1) - angles) % 360.0
+        thirds = np.array([0.0, 1.0, 2.0]) / 3.0
+        middle = angles[..., :, None] + arcs[..., :, None] * thirds
+        middle = middle.reshape(middle.shape[:-2] + (12,))
+        middle = (middle - np.asarray(shift)[..., None]) % 360.0
+
+        previous = np.roll(middle, 1, axis=-1)
+        begin = (previous + ((middle - previous) % 360.0) / 2.0) % 360.0
+
+        self.armc = armc
+        self.ascendant = middle[..., 0]
+        self.midheaven = middle[..., 9]
+        self.middle = middle
+        self.begin = begin
+        self.end = np.roll(begin, -1, axis=-1)
+
+    def house_longitude(self, house, index=()):
+        """
+        Begin, middle & end of one house (HouseName or 1-12) like Calculate.HouseLongitude,
+        index (int or tuple) picks the chart when many were computed.
+        """
+        position = (index if isinstance(index, tuple) else (index,)) + (house_index(house),)
+        return {
+            "Begin": float(self.begin[position]),
+            "Middle": float(self.middle[position]),
+            "End": float(self.end[position]),
+        }
+
+    def junction_point(self, previous_house):
+        """
+        Sandhi between a house & the next one, like Calculate.HouseJunctionPoint.
+        """
+        return self.end[..., house_index(previous_house)]
+
+    def angles(self):
+        """
+        AC, MC, DC & IC longitudes, the four middles of the kendra houses.
+        """
+        return {
+            "AC": self.middle[..., 0], "MC": self.middle[..., 9],
+            "DC": self.middle[..., 6], "IC": self.middle[..., 3],
+        }
@@ -0,0 +1,178 @@
+import datetime
+import re
+import numpy as np
+
+from .vedastro import Time
+
+__all__ = [
+    "J2000",
+    "julian_day",
+    "julian_centuries",
+    "time_to_julian_day",
+    "to_julian_day",
+    "julian_day_to_datetime64",
+    "julian_day_to_time",
+    "local_dates",
+    "api_julian_day",
+]
+
+# julian day of 1 Jan 2000 12:00 UT, reference epoch for all local engines
+J2000 = 2451545.0
+
+# julian day of the numpy datetime64 epoch (1 Jan 1970 00:00 UT)
+_UNIX_EPOCH_JD = 2440587.5
+
+
+def julian_day(year, month, day, hours=0.0):
+    """
+    Julian day for a Gregorian calendar date, works on scalars and arrays.
+
+    Args:
+    year (int or array): Calendar year (astronomical numbering).
+    month (int or array): Month number 1-12.
+    day (int or array): Day of month.
+    hours (float or array): Hours past midnight UT.
+    """
+    year = np.asarray(year, dtype=np.int64)
+    month = np.asarray(month, dtype=np.int64)
+    day = np.asarray(day, dtype=np.float64)
+    hours = np.asarray(hours, dtype=np.float64)
+
+    # january and february count as months 13 & 14 of the previous year
+    early = month <= 2
+    year = np.where(early, year - 1, year)
+    month = np.where(early, month + 12, month)
+
+    century = np.floor_divide(year, 100)
+    correction = 2 - century + np.floor_divide(century, 4)
+
+    jd = (np.floor(365.25 * (year + 4716)) + np.floor(30.6001 * (month + 1))
+          + day + correction - 1524.5 + hours / 24.0)
+    return jd if jd.ndim else float(jd)
+
+
+def julian_centuries(jd):
+    """
+    Julian centuries since J2000, the time argument of most series used here.
+    """
+    return (np.asarray(jd, dtype=np.float64) - J2000) / 36525.0
+
+
+def _parse_offset_hours(offset):
+    """
+    Convert a "+HH:MM" / "-HH:MM" offset string to hours.
+    """
+    sign = -1.0 if offset.startswith("-") else 1.0
+    hh, mm = offset.lstrip("+-").split(":")
+    return sign * (int(hh) + int(mm) / 60.0)
+
+
+def time_to_julian_day(time):
+    """
+    Julian day (UT) of a vedastro Time object.
+
+    Args:
+    time (Time): Time in the format "HH:MM DD/MM/YYYY +HH:MM" (seconds optional).
+    """
+    clock, date, offset = time.time_string.split()
+    clock_parts = [float(part) for part in clock.split(":")]
+    hours = clock_parts[0] + clock_parts[1] / 60.0
+    if len(clock_parts) > 2:
+        hours += clock_parts[2] / 3600.0
+    day, month, year = (int(part) for part in date.split("/"))
+    return julian_day(year, month, day, hours - _parse_offset_hours(offset))
+
+
+def _datetime_to_julian_day(value):
+    """
+    Julian day of a python datetime, naive values are taken as UTC.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    hours = value.hour + value.minute / 60.0 + (value.second + value.microsecond / 1e6) / 3600.0
+    return julian_day(value.year, value.month, value.day, hours)
+
+
+def to_julian_day(times):
+    """
+    Normalise any supported time input to julian day (UT) floats.
+
+    Accepts julian day numbers, vedastro Time objects, python datetimes,
+    numpy datetime64 arrays, pandas DatetimeIndex or lists of any of these.
+    Scalars come back as float, everything else as a float64 array.
+    """
+    if isinstance(times, Time):
+        return time_to_julian_day(times)
+    if isinstance(times, datetime.datetime):
+        return _datetime_to_julian_day(times)
+
+    # pandas DatetimeIndex/Series, tz aware values are moved to UTC first
+    if getattr(times, "tz", None) is not None:
+        times = times.tz_convert("UTC").tz_localize(None)
+    elif getattr(getattr(times, "dt", None), "tz", None) is not None:
+        times = times.dt.tz_convert("UTC").dt.tz_localize(None)
+
+    if isinstance(times, (list, tuple)) and times and isinstance(times[0], (Time, datetime.datetime)):
+        return np.array([to_julian_day(value) for value in times], dtype=np.float64)
+
+    values = np.asarray(times)
+    if np.issubdtype(values.dtype, np.datetime64):
+        nanoseconds = values.astype("datetime64[ns]").astype(np.int64)
+        jd = _UNIX_EPOCH_JD + nanoseconds / 86400e9
+        return jd if jd.ndim else float(jd)
+
+    values = values.astype(np.float64)
+    return values if values.ndim else float(values)
+
+
+def julian_day_to_datetime64(jd):
+    """
+    Convert julian day (UT) numbers to numpy datetime64[ms] values.
+    """
+    milliseconds = np.round((np.asarray(jd, dtype=np.float64) - _UNIX_EPOCH_JD) * 86400e3)
+    return milliseconds.astype(np.int64).astype("datetime64[ms]")
+
+
+def julian_day_to_time(jd, geolocation, offset="+00:00"):
+    """
+    Convert a julian day (UT) back into a vedastro Time at the given offset,
+    so local results can be passed straight into Calculate methods.
+
+    Args:
+    jd (float): Julian day in UT.
+    geolocation (GeoLocation): Location attached to the returned Time.
+    offset (str): Timezone offset in the format "+HH:MM".
+    """
+    # half a minute added so the minute resolution of Time rounds instead of truncating
+    local_jd = jd + (_parse_offset_hours(offset) + 0.5 / 60.0) / 24.0
+    local = julian_day_to_datetime64(local_jd).item()
+    return Time(f"{local.strftime('%H:%M %d/%m/%Y')} {offset}", geolocation)
+
+
+def local_dates(dates):
+    """
+    Julian day at 0h of each calendar date, Time objects use their civil date
+    as written, other time inputs the UT date they fall on.
+    """
+    if isinstance(dates, Time):
+        day, month, year = (int(part) for part in dates.time_string.split()[1].split("/"))
+        return julian_day(year, month, day)
+    if isinstance(dates, datetime.date) and not isinstance(dates, datetime.datetime):
+        return julian_day(dates.year, dates.month, dates.day)
+    if isinstance(dates, (list, tuple)) and dates and isinstance(dates[0], (Time, datetime.date)):
+        return np.array([local_dates(value) for value in dates], dtype=np.float64)
+    return np.floor(np.asarray(to_julian_day(dates), dtype=np.float64) + 0.5) - 0.5
+
+
+def api_julian_day(value, time):
+    """
+    Julian day (UT) out of an API Time or DateTime, DateTime has no offset
+    so it is read in the offset of the time that was asked about.
+    """
+    text = str(value)
+    match = re.search(r"\d{1,2}:\d{2}(?::\d{2})? \d{1,2}/\d{1,2}/\d{4} [+-]\d{2}:\d{2}", text)
+    if match:
+        return time_to_julian_day(Time(match.group(0), time.geolocation))
+    stamp = datetime.datetime.fromisoformat(re.search(r"\d{4}-\d{2}-\d{2}T[\d:.]+", text).group(0))
+    offset = time.time_string.split()[2]
+    return time_to_julian_day(Time(f"{stamp.strftime('%H:%M:%S %d/%m/%Y')} {offset}", time.geolocation))
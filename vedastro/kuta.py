@@ -0,0 +1,180 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .ephemeris import planet_nirayana_longitude
+from .tables import (SIGN_LORDS, NATURAL_RELATIONS, YONI_ANIMALS, YONI_OF_CONSTELLATION,
+                     sign_index, constellation_index)
+
+__all__ = [
+    "KUTA_MAXIMUM",
+    "yoni_kuta_animal_from_constellation",
+    "KutaMatrix",
+]
+
+# maximum points per kuta, 36 in total
+KUTA_MAXIMUM = {
+    "Varna": 1, "Vashya": 2, "Tara": 3, "Yoni": 4,
+    "GrahaMaitri": 5, "Gana": 6, "Bhakoot": 7, "Nadi": 8,
+}
+
+# yoni points between animals, same order as YONI_ANIMALS, 0 for sworn enemies
+_YONI_POINTS = np.array([
+    [4, 2, 2, 3, 2, 2, 2, 1, 0, 1, 3, 3, 2, 1],
+    [2, 4, 3, 3, 2, 2, 2, 2, 3, 1, 2, 3, 2, 0],
+    [2, 3, 4, 2, 1, 2, 1, 3, 3, 1, 2, 0, 3, 1],
+    [3, 3, 2, 4, 2, 1, 1, 1, 1, 2, 2, 2, 0, 2],
+    [2, 2, 1, 2, 4, 2, 1, 2, 2, 1, 0, 2, 1, 1],
+    [2, 2, 2, 1, 2, 4, 0, 2, 2, 1, 3, 3, 2, 1],
+    [2, 2, 1, 1, 1, 0, 4, 2, 2, 2, 2, 2, 1, 2],
+    [1, 2, 3, 1, 2, 2, 2, 4, 3, 0, 3, 2, 2, 1],
+    [0, 3, 3, 1, 2, 2, 2, 3, 4, 1, 2, 2, 2, 1],
+    [1, 1, 1, 2, 1, 1, 2, 0, 1, 4, 1, 1, 2, 1],
+    [3, 2, 2, 2, 0, 3, 2, 3, 2, 1, 4, 2, 2, 1],
+    [3, 3, 0, 2, 2, 3, 2, 2, 2, 1, 2, 4, 3, 2],
+    [2, 2, 3, 0, 1, 2, 1, 2, 2, 2, 2, 3, 4, 2],
+    [1, 0, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 4],
+], dtype=np.float32)
+
+# varna rank by sign: Kshatriya, Vaishya, Shudra, Brahmin repeating from Aries
+_VARNA_RANK = np.array([3, 2, 1, 4] * 3)
+
+# vashya group: 0 Chatushpada, 1 Manava, 2 Jalachara, 3 Vanachara, 4 Keeta,
+# Sagittarius & Capricorn change group at 15 degrees
+_VASHYA_FIRST_HALF = np.array([0, 0, 1, 2, 3, 1, 1, 4, 1, 0, 1, 2])
+_VASHYA_SECOND_HALF = np.array([0, 0, 1, 2, 3, 1, 1, 4, 0, 2, 1, 2])
+_VASHYA_POINTS = np.array([
+    [2, 1, 1, 0.5, 1],
+    [1, 2, 0.5, 0, 1],
+    [1, 0.5, 2, 1, 1],
+    [0.5, 0, 1, 2, 0],
+    [1, 1, 1, 0, 2],
+], dtype=np.float32)
+
+# points from both relationships, indexed [relation + 1, relation + 1]
+_MAITRI_POINTS = np.array([
+    [0, 0.5, 1],
+    [0.5, 3, 4],
+    [1, 4, 5],
+], dtype=np.float32)
+
+# gana by constellation: 0 Deva, 1 Manushya, 2 Rakshasa
+_GANA = np.array([0, 1, 2, 1, 0, 1, 0, 0, 2, 2, 1, 1, 0, 2, 0, 2, 0, 2, 2, 1, 1, 0, 2, 2, 1, 1, 0])
+
+# gana points indexed [female gana, male gana]
+_GANA_POINTS = np.array([
+    [6, 5, 1],
+    [6, 6, 0],
+    [0, 0, 6],
+], dtype=np.float32)
+
+# nadi (Adi, Madhya, Antya) runs 0 1 2 2 1 0 over every 6 constellations
+_NADI = np.resize([0, 1, 2, 2, 1, 0], 27)
+
+
+def yoni_kuta_animal_from_constellation(constellation):
+    """
+    Yoni animal name of a constellation, like Calculate.YoniKutaAnimalFromConstellation.
+    """
+    return YONI_ANIMALS[YONI_OF_CONSTELLATION[constellation_index(constellation)]]
+
+
+class KutaMatrix:
+    def __init__(self, male_constellation, male_sign, female_constellation, female_sign,
+                 male_vashya=None, female_vashya=None):
+        """
+        Ashtakoota points for every male (N) against every female (M) at once.
+
+        Args:
+        male_constellation, female_constellation: Moon constellation per person,
+            0 based (Aswini = 0) or ConstellationName members.
+        male_sign, female_sign: Moon sign per person, 0 based (Aries = 0) or ZodiacName.
+        male_vashya, female_vashya: Vashya group per person if known (see
+            from_moon_longitudes), else taken from the sign.
+
+        Each kuta is an (N, M) float32 attribute (varna, vashya, tara, yoni,
+        graha_maitri, gana, bhakoot, nadi) & total holds the sum out of 36.
+        """
+        male_star = np.atleast_1d(constellation_index(male_constellation))
+        female_star = np.atleast_1d(constellation_index(female_constellation))
+        male_sign = np.atleast_1d(sign_index(male_sign))
+        female_sign = np.atleast_1d(sign_index(female_sign))
+        male_vashya = _VASHYA_FIRST_HALF[male_sign] if male_vashya is None else np.atleast_1d(male_vashya)
+        female_vashya = _VASHYA_FIRST_HALF[female_sign] if female_vashya is None else np.atleast_1d(female_vashya)
+
+        # males down the rows, females across the columns
+        m_star, f_star = male_star[:, None], female_star[None, :]
+        m_sign, f_sign = male_sign[:, None], female_sign[None, :]
+
+        self.varna = (_VARNA_RANK[m_sign] >= _VARNA_RANK[f_sign]).astype(np.float32)
+        self.vashya = _VASHYA_POINTS[male_vashya[:, None], female_vashya[None, :]]
+
+        # tara: count both ways, remainders 3, 5 & 7 (of 9) are inauspicious
+        bad_tara = np.array([False, False, False, True, False, True, False, True, False])
+        female_to_male = ((m_star - f_star) % 27 + 1) % 9
+        male_to_female = ((f_star - m_star) % 27 + 1) % 9
+        self.tara = (1.5 * ~bad_tara[female_to_male] + 1.5 * ~bad_tara[male_to_female]).astype(np.float32)
+
+        self.yoni = _YONI_POINTS[YONI_OF_CONSTELLATION[m_star], YONI_OF_CONSTELLATION[f_star]]
+
+        m_lord, f_lord = SIGN_LORDS[m_sign], SIGN_LORDS[f_sign]
+        maitri = _MAITRI_POINTS[NATURAL_RELATIONS[m_lord, f_lord] + 1, NATURAL_RELATIONS[f_lord, m_lord] + 1]
+        self.graha_maitri = np.where(m_lord == f_lord, np.float32(5), maitri)
+
+        self.gana = _GANA_POINTS[_GANA[f_star], _GANA[m_star]]
+
+        # bhakoot: 2/12, 5/9 & 6/8 sign placements from each other score 0
+        sign_count = (m_sign - f_sign) % 12 + 1
+        self.bhakoot = np.where(np.isin(sign_count, (2, 12, 5, 9, 6, 8)), np.float32(0), np.float32(7))
+
+        self.nadi = np.where(_NADI[m_star] == _NADI[f_star], np.float32(0), np.float32(8))
+
+        self.total = (self.varna + self.vashya + self.tara + self.yoni
+                      + self.graha_maitri + self.gana + self.bhakoot + self.nadi)
+
+    @classmethod
+    def from_moon_longitudes(cls, male_moon_longitude, female_moon_longitude):
+        """
+        Same as above straight from nirayana Moon longitudes, vashya then
+        also follows the 15 degree split of Sagittarius & Capricorn.
+        """
+        def split(longitude):
+            longitude = np.atleast_1d(np.asarray(longitude, dtype=np.float64) % 360.0)
+            star = np.floor(longitude / (360.0 / 27.0)).astype(np.int64)
+            sign = np.floor(longitude / 30.0).astype(np.int64)
+            second_half = (longitude % 30.0) >= 15.0
+            vashya = np.where(second_half, _VASHYA_SECOND_HALF[sign], _VASHYA_FIRST_HALF[sign])
+            return star, sign, vashya
+
+        male_star, male_sign, male_vashya = split(male_moon_longitude)
+        female_star, female_sign, female_vashya = split(female_moon_longitude)
+        return cls(male_star, male_sign, female_star, female_sign, male_vashya, female_vashya)
+
+    @classmethod
+    def from_birth_times(cls, male_birth_times, female_birth_times, ayanamsa=None):
+        """
+        Same as Calculate.MatchReport for every pair, Moon from the local ephemeris.
+        """
+        male_moon = planet_nirayana_longitude(PlanetName.Moon, male_birth_times, ayanamsa)
+        female_moon = planet_nirayana_longitude(PlanetName.Moon, female_birth_times, ayanamsa)
+        return cls.from_moon_longitudes(male_moon, female_moon)
+
+    def breakdown(self, male_index, female_index):
+        """
+        Points of every kuta for one pair, keyed like KUTA_MAXIMUM.
+        """
+        kutas = {
+            "Varna": self.varna, "Vashya": self.vashya, "Tara": self.tara, "Yoni": self.yoni,
+            "GrahaMaitri": self.graha_maitri, "Gana": self.gana, "Bhakoot": self.bhakoot, "Nadi": self.nadi,
+        }
+        scores = {name: float(values[male_index, female_index]) for name, values in kutas.items()}
+        scores["Total"] = float(self.total[male_index, female_index])
+        return scores
+
+    def best_matches(self, male_index, count=10):
+        """
+        Female indexes with the highest total for one male, best first.
+        """
+        totals = self.total[male_index]
+        count = min(count, totals.size)
+        top = np.argpartition(-totals, count - 1)[:count]
+        return top[np.argsort(-totals[top], kind="stable")]
@@ -0,0 +1,208 @@
+import numpy as np
+
+from .vedastro import LunarMonth, PlanetName
+from .julian_day import to_julian_day, api_julian_day
+from .ephemeris import planet_sayana_longitude, planet_nirayana_longitude
+from .eclipse import SYNODIC_MONTH_DAYS, NEW_MOON_EPOCH, mean_syzygies
+from .validation import angle_difference, parity_table
+
+__all__ = [
+    "syzygy_table",
+    "LunarCalendar",
+    "lunar_calendar_parity_table",
+]
+
+# newton steps on the Moon - Sun elongation from the mean lunation, the
+# mean phase is never more than ~14 hours (7 degrees) out
+_NEWTON_STEPS = 4
+_MOTION_STEP = 0.05
+
+# month named by the Sun's sign at the new moon that starts it, Sun in
+# Pisces gives Chaitra, Aries Vaisaakha ... Aquarius Phaalguna
+_REGULAR_MONTHS = np.array([LunarMonth((sign + 1) % 12 + 1) for sign in range(12)], dtype=object)
+_ADHIKA_MONTHS = np.array([LunarMonth((sign + 1) % 12 + 13) for sign in range(12)], dtype=object)
+
+
+def _phase_time(k):
+    """
+    Exact instant of the syzygies with lunation numbers k (whole for new
+    moon, .5 for full moon), julian days UT.
+    """
+    target = np.where(k == np.floor(k), 0.0, 180.0)
+    guess = NEW_MOON_EPOCH + SYNODIC_MONTH_DAYS * k
+
+    def elongation(jd):
+        # the ayanamsa cancels out of a difference, so tropical is fine
+        return planet_sayana_longitude(PlanetName.Moon, jd) - planet_sayana_longitude(PlanetName.Sun, jd)
+
+    for _ in range(_NEWTON_STEPS):
+        motion = angle_difference(elongation(guess + _MOTION_STEP), elongation(guess - _MOTION_STEP)) / (2.0 * _MOTION_STEP)
+        guess = guess - angle_difference(elongation(guess), target) / motion
+    return guess
+
+
+def syzygy_table(start_time, end_time):
+    """
+    Every new & full moon between two times in one pass, like repeated
+    Calculate.NextNewMoon / PreviousNewMoon calls.
+
+    Returns (times, is_full_moon) arrays sorted by time, julian days UT.
+    """
+    start = float(to_julian_day(start_time))
+    end = float(to_julian_day(end_time))
+    k = mean_syzygies(start, end)
+    times = np.asarray(_phase_time(k))
+    keep = (times >= start) & (times < end)
+    return times[keep], (k != np.floor(k))[keep]
+
+
+class LunarCalendar:
+    def __init__(self, start_time, end_time, ayanamsa=None):
+        """
+        Amanta & purnimanta lunar months for every date between two times,
+        built from one syzygy table & queried by binary search, like
+        Calculate.LunarMonth.
+
+        Args:
+        start_time, end_time: Julian days, Time objects or datetimes.
+        ayanamsa (Ayanamsa): For the Sun's sign, defaults to Calculate.Ayanamsa.
+
+        An amanta month runs new moon to new moon & is named from the sign
+        the conjunction falls in. A month with no sankranti (Sun stays in one
+        sign) is adhika & takes the name of the month after it. A month with
+        2 sankrantis swallows the next name, that name is kshaya.
+        Purnimanta months run full moon to full moon & carry the name of the
+        amanta month that starts inside them.
+
+        Arrays, julian days UT: new_moons, full_moons, month (LunarMonth of
+        each amanta month starting at new_moons[i]), regular_month (same
+        without adhika), adhika, kshaya (the month skipped right after month
+        i, or None), purnimanta_month (one per full_moons[i] start).
+        """
+        start = float(to_julian_day(start_time))
+        end = float(to_julian_day(end_time))
+        # 2 lunations of margin so months overlapping the ends are complete
+        times, full = syzygy_table(start - 2 * SYNODIC_MONTH_DAYS, end + 2 * SYNODIC_MONTH_DAYS)
+        self.new_moons = times[~full]
+        self.full_moons = times[full]
+
+        sign = np.floor(planet_nirayana_longitude(PlanetName.Sun, self.new_moons, ayanamsa) / 30.0).astype(np.int64) % 12
+        steps = (sign[1:] - sign[:-1]) % 12
+        # last new moon only closes the month before it
+        self.adhika = steps == 0
+        self.regular_month = _REGULAR_MONTHS[sign[:-1]]
+        self.month = np.where(self.adhika, _ADHIKA_MONTHS[sign[:-1]], self.regular_month)
+        self.kshaya = np.where(steps >= 2, _REGULAR_MONTHS[(sign[:-1] + 1) % 12], None)
+        self.month_start = self.new_moons[:-1]
+        self.month_end = self.new_moons[1:]
+
+        # each purnimanta month holds exactly 1 new moon, the one after its full moon
+        holding = np.searchsorted(self.month_start, self.full_moons[:-1], side="right")
+        named = holding < len(self.month)
+        self.purnimanta_start = self.full_moons[:-1][named]
+        self.purnimanta_end = self.full_moons[1:][named]
+        self.purnimanta_holding = holding[named]
+        self.purnimanta_month = self.month[self.purnimanta_holding]
+
+    def _slot(self, jd, starts, ends):
+        slot = np.searchsorted(starts, jd, side="right") - 1
+        inside = (slot >= 0) & (jd < ends[np.clip(slot, 0, None)])
+        if not np.all(inside):
+            raise ValueError("Time outside the calendar, widen start_time/end_time")
+        return slot
+
+    def lunar_month(self, times, ignore_leap_month=False, purnimanta=False):
+        """
+        LunarMonth each time falls in, like Calculate.LunarMonth.
+
+        Args:
+        times: Julian days, Time objects or datetimes.
+        ignore_leap_month (bool): Give adhika months their regular name.
+        purnimanta (bool): Months ending at full moon (north india) instead
+            of new moon (amanta).
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        if purnimanta:
+            slot = self.purnimanta_holding[self._slot(jd, self.purnimanta_start, self.purnimanta_end)]
+        else:
+            slot = self._slot(jd, self.month_start, self.month_end)
+        # object array indexed by a scalar gives the LunarMonth itself
+        return (self.regular_month if ignore_leap_month else self.month)[slot]
+
+    def _neighbour(self, times, events, after):
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        # start time counts as found, like the API scans
+        slot = np.searchsorted(events, jd, side="left" if after else "right") - (0 if after else 1)
+        if np.any(slot < 0) or np.any(slot >= len(events)):
+            raise ValueError("No syzygy in the calendar on that side of the time, widen the range")
+        found = events[slot]
+        return found if found.ndim else float(found)
+
+    def next_new_moon(self, times):
+        """
+        Like Calculate.NextNewMoon, julian days UT.
+        """
+        return self._neighbour(times, self.new_moons, True)
+
+    def previous_new_moon(self, times):
+        """
+        Like Calculate.PreviousNewMoon, julian days UT.
+        """
+        return self._neighbour(times, self.new_moons, False)
+
+    def next_full_moon(self, times):
+        """
+        First full moon at or after each time, julian days UT.
+        """
+        return self._neighbour(times, self.full_moons, True)
+
+    def previous_full_moon(self, times):
+        """
+        Last full moon at or before each time, julian days UT.
+        """
+        return self._neighbour(times, self.full_moons, False)
+
+    def rows(self):
+        """
+        One dict per amanta month, start & end julian days.
+        """
+        return [{"Start": float(start), "End": float(end), "Month": month.name,
+                 "Adhika": bool(adhika), "KshayaAfter": kshaya.name if kshaya is not None else None}
+                for start, end, month, adhika, kshaya
+                in zip(self.month_start, self.month_end, self.month, self.adhika, self.kshaya)]
+
+
+def lunar_calendar_parity_table(times, ignore_leap_month=False):
+    """
+    Compare lunar months & new moon times against the API, one call per row.
+    Months give 0 when they agree, new moons differ in minutes.
+
+    Args:
+    times (list): Time objects to check.
+    """
+    from .calculate import Calculate
+
+    def calendar(time):
+        jd = float(to_julian_day(time))
+        return LunarCalendar(jd - 1.0, jd + 1.0)
+
+    local = {
+        "LunarMonth": lambda time: calendar(time).lunar_month(time, ignore_leap_month).name,
+        "NextNewMoon": lambda time: calendar(time).next_new_moon(time),
+        "PreviousNewMoon": lambda time: calendar(time).previous_new_moon(time),
+    }
+
+    def remote(case):
+        method, time = case
+        if method == "LunarMonth":
+            return str(Calculate.LunarMonth(time, ignore_leap_month)).strip()
+        return api_julian_day(getattr(Calculate, method)(time), time)
+
+    def compare(a, b):
+        if isinstance(a, str):
+            return int(a.lower() != str(b).lower())
+        return (a - b) * 1440.0
+
+    cases = [(method, time) for time in times for method in local]
+    return parity_table(cases, lambda case: local[case[0]](case[1]), remote,
+                        parse=lambda value: value, compare=compare)
@@ -0,0 +1,368 @@
+import numpy as np
+
+from .vedastro import ConstellationName, DayOfWeek, Karana, PlanetName, ZodiacName
+from .julian_day import to_julian_day, local_dates
+from .ephemeris import planet_nirayana_longitude, planet_sayana_longitude
+from .houses import ascendant_longitude
+from .transit import ingress_times
+from .hora import DayTimetable, PANCHAKA_NAMES, NO_PANCHAKA
+from .panchanga import NITHYA_YOGA_NAMES, KARANA_OF_HALF_LUNAR_DAY
+from .upagraha import WEEKDAY_LORDS
+from .tables import sign_index, constellation_index
+from .validation import angle_difference
+
+__all__ = [
+    "TARA_NAMES",
+    "MUHURTA_RULES",
+    "IntervalSet",
+    "intersect_intervals",
+    "union_intervals",
+    "FactorTimeline",
+    "MuhurtaSearch",
+]
+
+# tara of the day star counted from the birth star, in groups of 9
+TARA_NAMES = ["Janma", "Sampat", "Vipat", "Kshema", "Pratyak", "Sadhana", "Naidhana", "Mitra", "ParamaMitra"]
+
+# factor -> values that pass, the usual general purpose muhurta:
+# good taras, Moon in 1, 3, 6, 7, 10 or 11 from the birth Moon sign, no rikta
+# lunar day or Amavasya, no Visti karana, no bad yoga & no panchaka
+MUHURTA_RULES = {
+    "Tarabala": {"Sampat", "Kshema", "Sadhana", "Mitra", "ParamaMitra"},
+    "Chandrabala": {1, 3, 6, 7, 10, 11},
+    "LunarDay": set(range(1, 31)) - {4, 9, 14, 19, 24, 29, 30},
+    "Karana": set(Karana) - {Karana.Visti},
+    "NithyaYoga": set(NITHYA_YOGA_NAMES) - {"Vishkambha", "Atiganda", "Shula", "Ganda", "Vyaghata", "Vajra",
+                                            "Vyatipata", "Parigha", "Vaidhriti"},
+    "Panchaka": {NO_PANCHAKA},
+}
+
+# sampling steps in days, short enough that no boundary is skipped
+_LUNAR_STEP_DAYS = 0.25
+_LAGNA_STEP_DAYS = 1.0 / 96.0
+
+_CONSTELLATION_SPAN = 360.0 / 27.0
+_CONSTELLATIONS = [name for name in ConstellationName if name.value > 0]
+
+
+class IntervalSet:
+    def __init__(self, starts=(), ends=()):
+        """
+        Sorted, non overlapping [start, end) intervals in julian days UT,
+        combined with & (intersection), | (union) & - (difference).
+
+        Args:
+        starts, ends (array): Interval bounds, already sorted & disjoint.
+        """
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+
+    def __len__(self):
+        return self.starts.size
+
+    def __and__(self, other):
+        return intersect_intervals(self, other)
+
+    def __or__(self, other):
+        return union_intervals(self, other)
+
+    def __sub__(self, other):
+        return self & other.complement(min(self.starts.min(initial=np.inf), other.starts.min(initial=np.inf)),
+                                       max(self.ends.max(initial=-np.inf), other.ends.max(initial=-np.inf)))
+
+    def complement(self, start, end):
+        """
+        Gaps between the intervals within [start, end).
+        """
+        edges = np.concatenate([[start], np.ravel(np.column_stack([self.starts, self.ends])), [end]])
+        starts, ends = np.clip(edges[0::2], start, end), np.clip(edges[1::2], start, end)
+        keep = ends > starts
+        return IntervalSet(starts[keep], ends[keep])
+
+    def longer_than(self, minutes):
+        """
+        Only the intervals lasting at least this many minutes.
+        """
+        keep = (self.ends - self.starts) * 1440.0 >= minutes
+        return IntervalSet(self.starts[keep], self.ends[keep])
+
+    def contains(self, times):
+        """
+        Whether each time falls inside one of the intervals.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        if not self.starts.size:
+            return np.zeros(np.shape(jd), dtype=bool) if np.ndim(jd) else False
+        slot = np.searchsorted(self.starts, jd, side="right") - 1
+        inside = (slot >= 0) & (jd < self.ends[np.clip(slot, 0, None)])
+        return inside if np.ndim(inside) else bool(inside)
+
+    def total_minutes(self):
+        return float(np.sum(self.ends - self.starts) * 1440.0)
+
+    def rows(self):
+        """
+        One dict per interval, julian days UT & length in minutes.
+        """
+        return [{"Start": start, "End": end, "DurationMinutes": (end - start) * 1440.0}
+                for start, end in zip(self.starts.tolist(), self.ends.tolist())]
+
+
+def _sweep(sets, needed):
+    """
+    Intervals covered by at least needed of the sets, one sort over every
+    bound. Starts go before ends at the same instant so touching intervals
+    join in a union.
+    """
+    starts = np.concatenate([interval.starts for interval in sets])
+    ends = np.concatenate([interval.ends for interval in sets])
+    times = np.concatenate([starts, ends])
+    delta = np.concatenate([np.ones(starts.size, dtype=np.int64), -np.ones(ends.size, dtype=np.int64)])
+    order = np.lexsort((-delta, times))
+    times = times[order]
+    inside = np.cumsum(delta[order]) >= needed
+    before = np.concatenate([[False], inside[:-1]])
+    begins, finishes = times[inside & ~before], times[~inside & before]
+    keep = finishes > begins
+    return IntervalSet(begins[keep], finishes[keep])
+
+
+def intersect_intervals(*sets):
+    """
+    Times inside every one of the interval sets.
+    """
+    return _sweep(sets, len(sets))
+
+
+def union_intervals(*sets):
+    """
+    Times inside any of the interval sets, touching intervals are joined.
+    """
+    return _sweep(sets, 1)
+
+
+class FactorTimeline:
+    def __init__(self, name, edges, codes, labels):
+        """
+        One muhurta factor as a piecewise constant timeline.
+
+        Args:
+        name (str): Factor name, like the Calculate method, eg: "Karana".
+        edges (array): n + 1 sorted julian days UT, first & last are the range.
+        codes (array): n integer codes, the value between two edges.
+        labels (list): Value shown for each code, eg: Karana members.
+        """
+        edges = np.asarray(edges, dtype=np.float64)
+        codes = np.asarray(codes, dtype=np.int64)
+        # drop edges where nothing actually changes
+        change = np.concatenate([[True], codes[1:] != codes[:-1]])
+        self.name = name
+        self.edges = np.append(edges[:-1][change], edges[-1])
+        self.codes = codes[change]
+        self.labels = np.empty(len(labels), dtype=object)
+        self.labels[:] = list(labels)
+
+    def code_at(self, times):
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        return self.codes[np.clip(np.searchsorted(self.edges, jd, side="right") - 1, 0, self.codes.size - 1)]
+
+    def value_at(self, times):
+        """
+        Value at each time, like calling the Calculate method at that time.
+        """
+        return self.labels[self.code_at(times)]
+
+    def where(self, allowed):
+        """
+        Interval set of the times the value passes.
+
+        Args:
+        allowed: Values that pass (any iterable of labels) or a callable
+            allowed(label) -> bool.
+        """
+        test = allowed if callable(allowed) else set(allowed).__contains__
+        passing = np.array([bool(test(label)) for label in self.labels])
+        inside = passing[self.codes]
+        return _runs(self.edges, inside)
+
+    def rows(self):
+        """
+        One dict per stretch of the same value, julian days UT.
+        """
+        return [{"Name": self.name, "Value": self.labels[code], "Start": start, "End": end}
+                for code, start, end in zip(self.codes.tolist(), self.edges[:-1].tolist(), self.edges[1:].tolist())]
+
+
+def _runs(edges, inside):
+    """
+    Neighbouring passing pieces merged into intervals.
+    """
+    before = np.concatenate([[False], inside[:-1]])
+    after = np.concatenate([inside[1:], [False]])
+    return IntervalSet(edges[:-1][inside & ~before], edges[1:][inside & ~after])
+
+
+def _combined(name, factors, combine, labels):
+    """
+    Factor worked out from other factors, evaluated once per piece of the
+    union of their edges. combine(*code arrays) -> code array.
+    """
+    edges = np.unique(np.concatenate([factor.edges for factor in factors]))
+    middles = (edges[:-1] + edges[1:]) / 2.0
+    return FactorTimeline(name, edges, combine(*(factor.code_at(middles) for factor in factors)), labels)
+
+
+def _division_edges(angle, start, end, step, division, tolerance_seconds=1.0):
+    """
+    Edges & division index of each piece for an angle that only moves
+    forward (elongation, yoga sum, ascendant), bisected like ingress_times.
+    Steps that jump more than one division are split first so no piece is
+    missed.
+    """
+    def division_of(jd):
+        return np.floor(np.asarray(angle(jd), dtype=np.float64) % 360.0 / division).astype(np.int64)
+
+    samples = np.append(np.arange(start, end, step), end)
+    segment = division_of(samples)
+    count = int(round(360.0 / division))
+
+    # fast rising signs at high latitude can pass whole between two samples,
+    # halve those steps until each crosses one boundary at most
+    while True:
+        skipped = np.flatnonzero(((segment[1:] - segment[:-1]) % count > 1)
+                                 & ((samples[1:] - samples[:-1]) * 86400.0 > tolerance_seconds))
+        if not len(skipped):
+            break
+        middles = (samples[skipped] + samples[skipped + 1]) / 2.0
+        samples = np.insert(samples, skipped + 1, middles)
+        segment = np.insert(segment, skipped + 1, division_of(middles))
+
+    changed = np.flatnonzero(segment[1:] != segment[:-1])
+    boundary = segment[changed + 1] * division
+    low, high = samples[changed], samples[changed + 1]
+    rounds = int(np.ceil(np.log2(max(step * 86400.0 / tolerance_seconds, 2.0))))
+    for _ in range(rounds):
+        middle = (low + high) / 2.0
+        before = angle_difference(np.asarray(angle(middle), dtype=np.float64), boundary) < 0.0
+        low = np.where(before, middle, low)
+        high = np.where(before, high, middle)
+
+    edges = np.concatenate([[start], (low + high) / 2.0, [end]])
+    codes = np.concatenate([segment[:1], segment[changed + 1]]) % count
+    return edges, codes
+
+
+def _ingress_edges(planet, start, end, division, ayanamsa):
+    times, _, after = ingress_times(planet, start, end, division, ayanamsa)
+    first = int(planet_nirayana_longitude(planet, start, ayanamsa) // division)
+    return np.concatenate([[start], times, [end]]), np.concatenate([[first], after])
+
+
+class MuhurtaSearch:
+    def __init__(self, birth_star, latitude, longitude, start_time, end_time, birth_sign=None, ayanamsa=None):
+        """
+        Every muhurta factor between two times as a timeline built once from
+        its exact change instants, windows are then found by intersecting
+        interval sets instead of one Calculate call per factor per time.
+
+        Args:
+        birth_star (ConstellationName or int): Birth constellation, 0 based
+            when an int.
+        latitude, longitude (float): Place of the event.
+        start_time, end_time: Range to search, julian days, Time or datetime.
+        birth_sign (ZodiacName or int): Birth Moon sign for Chandrabala,
+            defaults to the sign holding the first quarter of the birth star.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+
+        factors maps each name (Tarabala, Chandrabala, LunarDay, Karana,
+        NithyaYoga, MoonConstellation, LagnaSignName, DayOfWeek,
+        LordOfHoraFromTime, Panchaka) to its FactorTimeline.
+        """
+        self.start = float(to_julian_day(start_time))
+        self.end = float(to_julian_day(end_time))
+        self.latitude = latitude
+        self.longitude = longitude
+        star = int(constellation_index(birth_star))
+        sign = int(star * _CONSTELLATION_SPAN // 30.0) if birth_sign is None else int(sign_index(birth_sign))
+        start, end = self.start, self.end
+
+        def elongation(jd):
+            # the ayanamsa cancels out of a difference, so tropical is fine
+            return planet_sayana_longitude(PlanetName.Moon, jd) - planet_sayana_longitude(PlanetName.Sun, jd)
+
+        def yoga_sum(jd):
+            return planet_nirayana_longitude(PlanetName.Sun, jd, ayanamsa) + planet_nirayana_longitude(PlanetName.Moon, jd, ayanamsa)
+
+        def lagna(jd):
+            return ascendant_longitude(jd, latitude, longitude, ayanamsa)
+
+        factors = {}
+        edges, half_days = _division_edges(elongation, start, end, _LUNAR_STEP_DAYS, 6.0)
+        factors["Karana"] = FactorTimeline("Karana", edges, half_days, KARANA_OF_HALF_LUNAR_DAY)
+        factors["LunarDay"] = FactorTimeline("LunarDay", edges, half_days // 2, range(1, 31))
+        factors["NithyaYoga"] = FactorTimeline(
+            "NithyaYoga", *_division_edges(yoga_sum, start, end, _LUNAR_STEP_DAYS, _CONSTELLATION_SPAN), NITHYA_YOGA_NAMES)
+        factors["LagnaSignName"] = FactorTimeline(
+            "LagnaSignName", *_division_edges(lagna, start, end, _LAGNA_STEP_DAYS, 30.0), list(ZodiacName))
+
+        edges, stars = _ingress_edges(PlanetName.Moon, start, end, _CONSTELLATION_SPAN, ayanamsa)
+        factors["MoonConstellation"] = FactorTimeline("MoonConstellation", edges, stars, _CONSTELLATIONS)
+        factors["Tarabala"] = FactorTimeline("Tarabala", edges, (stars - star) % 27 % 9, TARA_NAMES)
+        edges, signs = _ingress_edges(PlanetName.Moon, start, end, 30.0, ayanamsa)
+        factors["Chandrabala"] = FactorTimeline("Chandrabala", edges, (signs - sign) % 12, range(1, 13))
+
+        # vedic days from the one already running at the start
+        first_day = float(local_dates(start)) - 1.0
+        table = DayTimetable(np.arange(first_day, end + 1.0), latitude, longitude)
+        hora_starts = table.hora_edges[:, 0, :24].ravel()
+        hora_lords = table.hora_lords[:, 0, :].ravel()
+        inside = np.flatnonzero((hora_starts > start) & (hora_starts < end))
+        running = max(np.searchsorted(hora_starts, start, side="right") - 1, 0)
+        factors["LordOfHoraFromTime"] = FactorTimeline(
+            "LordOfHoraFromTime", np.concatenate([[start], hora_starts[inside], [end]]),
+            np.concatenate([[hora_lords[running]], hora_lords[inside]]), WEEKDAY_LORDS)
+        sunrises = table.sunrise[:, 0]
+        weekdays = table.weekday[:, 0]
+        inside = np.flatnonzero((sunrises > start) & (sunrises < end))
+        running = max(np.searchsorted(sunrises, start, side="right") - 1, 0)
+        factors["DayOfWeek"] = FactorTimeline(
+            "DayOfWeek", np.concatenate([[start], sunrises[inside], [end]]),
+            np.concatenate([[weekdays[running]], weekdays[inside]]), list(DayOfWeek))
+
+        # same sum as hora.panchaka, all counted from 1
+        factors["Panchaka"] = _combined(
+            "Panchaka", [factors["LunarDay"], factors["DayOfWeek"], factors["MoonConstellation"], factors["LagnaSignName"]],
+            lambda day, weekday, moon_star, lagna_sign: (day + weekday + moon_star + lagna_sign + 4) % 9,
+            [PANCHAKA_NAMES.get(number, NO_PANCHAKA) for number in range(9)])
+        self.factors = factors
+
+    def factor(self, name):
+        return self.factors[name]
+
+    def windows(self, rules=None, min_minutes=0.0, **extra_rules):
+        """
+        Every window where all the rules pass at once.
+
+        Args:
+        rules (dict): Factor name -> allowed values or callable, defaults to
+            MUHURTA_RULES, eg: {"Tarabala": {"Sampat"}}.
+        min_minutes (float): Drop windows shorter than this.
+        extra_rules: Added on top, eg: LordOfHoraFromTime={PlanetName.Jupiter}.
+
+        Returns an IntervalSet, .rows() for dicts.
+        """
+        rules = dict(MUHURTA_RULES if rules is None else rules, **extra_rules)
+        sets = [self.factors[name].where(allowed) for name, allowed in rules.items()]
+        found = intersect_intervals(*sets) if sets else IntervalSet([self.start], [self.end])
+        return found.longer_than(min_minutes) if min_minutes else found
+
+    def rows(self, rules=None, min_minutes=0.0, **extra_rules):
+        """
+        Windows as dicts with the value of every factor at their start.
+        """
+        rows = self.windows(rules, min_minutes, **extra_rules).rows()
+        for row in rows:
+            # value at the start, a hair inside so an edge right there counts
+            for name, factor in self.factors.items():
+                row[name] = factor.value_at(row["Start"] + 1e-9)
+        return rows
@@ -0,0 +1,192 @@
+import datetime
+import numpy as np
+
+from .vedastro import Time
+from .validation import parity_table
+
+__all__ = [
+    "CHALDEAN_VALUES",
+    "digital_root",
+    "birth_date_parts",
+    "birth_number",
+    "destiny_number",
+    "name_number",
+    "name_number_prediction_key",
+    "first_vowel_sound",
+    "numerology_parity_table",
+]
+
+# chaldean letter values, 9 is never given to a letter
+CHALDEAN_VALUES = {
+    "A": 1, "I": 1, "J": 1, "Q": 1, "Y": 1,
+    "B": 2, "K": 2, "R": 2,
+    "C": 3, "G": 3, "L": 3, "S": 3,
+    "D": 4, "M": 4, "T": 4,
+    "E": 5, "H": 5, "N": 5, "X": 5,
+    "U": 6, "V": 6, "W": 6,
+    "O": 7, "Z": 7,
+    "F": 8, "P": 8,
+}
+
+# same values as a byte lookup, anything not a latin letter counts 0
+_CHALDEAN_BYTES = np.zeros(256, dtype=np.int64)
+for _letter, _value in CHALDEAN_VALUES.items():
+    _CHALDEAN_BYTES[ord(_letter)] = _value
+    _CHALDEAN_BYTES[ord(_letter.lower())] = _value
+
+# compound name numbers above this are reduced by their digit sum until they
+# fall inside the prediction table
+_PREDICTION_TABLE_SIZE = 52
+
+_VOWELS = "AEIOU"
+
+
+def digital_root(numbers):
+    """
+    Repeated digit sum down to a single digit (1-9), 0 stays 0.
+    """
+    numbers = np.asarray(numbers, dtype=np.int64)
+    root = np.where(numbers > 0, 1 + (numbers - 1) % 9, 0)
+    return root if root.ndim else int(root)
+
+
+def _date_parts(value):
+    """
+    (day, month, year) of one Time, date, datetime or "DD/MM/YYYY" string,
+    Time uses the civil date as written, not converted to UTC.
+    """
+    if isinstance(value, Time):
+        value = value.time_string.split()[1]
+    if isinstance(value, str):
+        day, month, year = (int(part) for part in value.split("/"))
+        return day, month, year
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.day, value.month, value.year
+    raise TypeError(f"Can't read a birth date from {value!r}")
+
+
+def birth_date_parts(dates):
+    """
+    Day, month & year arrays from Time objects, dates, "DD/MM/YYYY" strings
+    or a numpy datetime64 array.
+    """
+    if isinstance(dates, (Time, str, datetime.date)):
+        return tuple(np.array(part) for part in _date_parts(dates))
+
+    values = np.asarray(dates)
+    if np.issubdtype(values.dtype, np.datetime64):
+        days = values.astype("datetime64[D]")
+        months = values.astype("datetime64[M]")
+        years = values.astype("datetime64[Y]")
+        day = (days - months.astype("datetime64[D]")).astype(np.int64) + 1
+        month = (months - years.astype("datetime64[M]")).astype(np.int64) + 1
+        year = years.astype(np.int64) + 1970
+        return day, month, year
+
+    parts = np.array([_date_parts(value) for value in dates], dtype=np.int64).reshape(-1, 3)
+    return parts[:, 0], parts[:, 1], parts[:, 2]
+
+
+def birth_number(birth_dates):
+    """
+    Digital root of the day of birth, like Calculate.BirthNumber.
+    """
+    day, _, _ = birth_date_parts(birth_dates)
+    return digital_root(day)
+
+
+def destiny_number(birth_dates):
+    """
+    Digital root of every digit in the birth date, like Calculate.DestinyNumber.
+    Same as the root of day + month + year, so no digit splitting is needed.
+    """
+    day, month, year = birth_date_parts(birth_dates)
+    return digital_root(day + month + year)
+
+
+def name_number(names):
+    """
+    Chaldean compound number of a name (sum of letter values, not reduced),
+    like Calculate.NameNumber. Takes one name or a list/array of names.
+    """
+    if isinstance(names, str):
+        return int(_CHALDEAN_BYTES[np.frombuffer(names.encode("latin-1", "ignore"), dtype=np.uint8)].sum())
+
+    # all names in one byte buffer, then one lookup & a segmented sum
+    encoded = [str(name).encode("latin-1", "ignore") for name in names]
+    lengths = np.array([len(name) for name in encoded], dtype=np.int64)
+    totals = np.zeros(len(encoded), dtype=np.int64)
+    if lengths.sum() == 0:
+        return totals
+    values = _CHALDEAN_BYTES[np.frombuffer(b"".join(encoded), dtype=np.uint8)]
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    filled = lengths > 0
+    totals[filled] = np.add.reduceat(values, starts[filled])
+    return totals
+
+
+def name_number_prediction_key(names):
+    """
+    Compound number used to look up the NumerologyPrediction of
+    Calculate.NameNumberPrediction, reduced into the 1-52 table.
+    The prediction texts themselves stay on the API side.
+    """
+    numbers = np.asarray(name_number(names), dtype=np.int64)
+    while np.any(numbers > _PREDICTION_TABLE_SIZE):
+        too_big = numbers > _PREDICTION_TABLE_SIZE
+        numbers = np.where(too_big, _digit_sum(numbers), numbers)
+    return numbers if numbers.ndim else int(numbers)
+
+
+def _digit_sum(numbers):
+    total = np.zeros_like(numbers)
+    while np.any(numbers):
+        total += numbers % 10
+        numbers = numbers // 10
+    return total
+
+
+def first_vowel_sound(words):
+    """
+    First vowel (A E I O U) in the word, upper case, like Calculate.FirstVowelSound.
+    Empty string when the word has none. Takes one word or a list of words.
+    """
+    if isinstance(words, str):
+        for letter in words.upper():
+            if letter in _VOWELS:
+                return letter
+        return ""
+    return np.array([first_vowel_sound(str(word)) for word in words], dtype=object)
+
+
+def numerology_parity_table(names=None, birth_times=None):
+    """
+    Compare the local numbers against the API, one call per row, cases are
+    (method name, input) so every row says what was checked. Differences
+    should all be 0.
+
+    Args:
+    names (list): Names for NameNumber & FirstVowelSound.
+    birth_times (list): Time objects for BirthNumber & DestinyNumber.
+    """
+    from .calculate import Calculate
+
+    local = {
+        "NameNumber": name_number,
+        "FirstVowelSound": first_vowel_sound,
+        "BirthNumber": lambda time: int(birth_number(time)),
+        "DestinyNumber": lambda time: int(destiny_number(time)),
+    }
+    cases = [(method, name) for name in names or [] for method in ("NameNumber", "FirstVowelSound")]
+    cases += [(method, time) for time in birth_times or [] for method in ("BirthNumber", "DestinyNumber")]
+
+    def parse(value):
+        # numbers come back as text, vowel sounds are compared upper case
+        text = str(value).strip()
+        return int(text) if text.lstrip("-").isdigit() else text.upper()
+
+    def compare(a, b):
+        return a - b if isinstance(a, int) and isinstance(b, int) else int(a != b)
+
+    return parity_table(cases, lambda case: local[case[0]](case[1]),
+                        lambda case: getattr(Calculate, case[0])(case[1]), parse=parse, compare=compare)
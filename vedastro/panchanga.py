@@ -0,0 +1,125 @@
+import numpy as np
+
+from .vedastro import Karana, LunarDayGroup, PlanetName
+from .ephemeris import planet_nirayana_longitude
+
+__all__ = [
+    "LUNAR_DAY_NAMES",
+    "NITHYA_YOGA_NAMES",
+    "KARANA_OF_HALF_LUNAR_DAY",
+    "Panchanga",
+    "panchanga_from_longitudes",
+    "panchanga_at_time",
+]
+
+# 30 lunar days (tithi), bright half first
+LUNAR_DAY_NAMES = [f"Shukla {name}" for name in (
+    "Prathama", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti", "Saptami",
+    "Ashtami", "Navami", "Dasami", "Ekadasi", "Dwadasi", "Trayodasi", "Chaturdasi")] + ["Purnima"] + [
+    f"Krishna {name}" for name in (
+        "Prathama", "Dwitiya", "Tritiya", "Chaturthi", "Panchami", "Shashti", "Saptami",
+        "Ashtami", "Navami", "Dasami", "Ekadasi", "Dwadasi", "Trayodasi", "Chaturdasi")] + ["Amavasya"]
+
+# 27 nithya yogas, each 13°20' of the Sun + Moon longitude
+NITHYA_YOGA_NAMES = [
+    "Vishkambha", "Priti", "Ayushman", "Saubhagya", "Shobhana", "Atiganda", "Sukarma",
+    "Dhriti", "Shula", "Ganda", "Vriddhi", "Dhruva", "Vyaghata", "Harshana", "Vajra",
+    "Siddhi", "Vyatipata", "Variyan", "Parigha", "Shiva", "Siddha", "Sadhya", "Shubha",
+    "Shukla", "Brahma", "Indra", "Vaidhriti",
+]
+
+# karana for each of the 60 half lunar days, the 7 movable karanas repeat
+# 8 times between the fixed Kimstughna at the start & the last 3 at the end
+KARANA_OF_HALF_LUNAR_DAY = np.array(
+    [Karana.Kimstughna]
+    + [list(Karana)[index % 7] for index in range(56)]
+    + [Karana.Sakuna, Karana.Chatushpada, Karana.Naga],
+    dtype=object,
+)
+
+# lunar day number 1-15 -> group, Nanda for 1, 6, 11 ... Purna for 5, 10, 15
+_LUNAR_DAY_GROUP_LOOKUP = np.array(list(LunarDayGroup), dtype=object)
+
+
+class Panchanga:
+    def __init__(self, sun_longitude, moon_longitude):
+        """
+        Every Sun/Moon based panchanga value for a batch of longitudes at once.
+
+        Args:
+        sun_longitude (float or array): Nirayana longitude of the Sun in degrees.
+        moon_longitude (float or array): Nirayana longitude of the Moon in degrees.
+
+        All attributes are arrays with the shape of the inputs, enum valued
+        ones (karana, lunar_day_group) are numpy object arrays, a single
+        pair of longitudes gives single values.
+        """
+        sun = np.asarray(sun_longitude, dtype=np.float64)
+        moon = np.asarray(moon_longitude, dtype=np.float64)
+
+        # same angle as Calculate.SunMoonConjunctionAngle, 0 at new moon
+        self.sun_moon_conjunction_angle = (moon - sun) % 360.0
+
+        # 12 degrees per lunar day, numbered 1-30
+        lunar_day_index = np.floor(self.sun_moon_conjunction_angle / 12.0).astype(np.int64) % 30
+        self.lunar_day = lunar_day_index + 1
+        self.lunar_day_name = np.array(LUNAR_DAY_NAMES, dtype=object)[lunar_day_index]
+        self.lunar_day_group = _LUNAR_DAY_GROUP_LOOKUP[lunar_day_index % 5]
+
+        # half lunar days
+        karana_index = np.floor(self.sun_moon_conjunction_angle / 6.0).astype(np.int64) % 60
+        self.karana = KARANA_OF_HALF_LUNAR_DAY[karana_index]
+
+        yoga_index = np.floor(((sun + moon) % 360.0) / (360.0 / 27.0)).astype(np.int64) % 27
+        self.nithya_yoga = yoga_index + 1
+        self.nithya_yoga_name = np.array(NITHYA_YOGA_NAMES, dtype=object)[yoga_index]
+
+        self.is_waxing_moon = self.sun_moon_conjunction_angle < 180.0
+        self.is_waning_moon = ~self.is_waxing_moon
+        self.is_full_moon = self.lunar_day == 15
+        self.is_new_moon = self.lunar_day == 30
+
+    def __len__(self):
+        return self.lunar_day.size
+
+    def row(self, index):
+        """
+        Values at one position as a dict, named like the Calculate methods.
+        """
+        def pick(values):
+            values = np.asarray(values)
+            value = values[index] if values.ndim else values.item()
+            return value.item() if isinstance(value, np.generic) else value
+
+        return {
+            "LunarDay": pick(self.lunar_day),
+            "LunarDayName": pick(self.lunar_day_name),
+            "LunarDayGroup": pick(self.lunar_day_group),
+            "NithyaYoga": pick(self.nithya_yoga_name),
+            "Karana": pick(self.karana),
+            "IsWaxingMoon": pick(self.is_waxing_moon),
+            "IsWaningMoon": pick(self.is_waning_moon),
+            "IsFullMoon": pick(self.is_full_moon),
+            "IsNewMoon": pick(self.is_new_moon),
+            "SunMoonConjunctionAngle": pick(self.sun_moon_conjunction_angle),
+        }
+
+
+def panchanga_from_longitudes(sun_longitude, moon_longitude):
+    """
+    Panchanga from longitudes already at hand, eg: from PlanetNirayanaLongitude.
+    """
+    return Panchanga(sun_longitude, moon_longitude)
+
+
+def panchanga_at_time(times, ayanamsa=None):
+    """
+    Panchanga straight from times using the local Sun & Moon ephemeris.
+
+    Args:
+    times: Julian days, Time objects, datetimes or datetime64 arrays.
+    ayanamsa (Ayanamsa): Only affects the nithya yoga, defaults to Calculate.Ayanamsa.
+    """
+    sun = planet_nirayana_longitude(PlanetName.Sun, times, ayanamsa)
+    moon = planet_nirayana_longitude(PlanetName.Moon, times, ayanamsa)
+    return Panchanga(sun, moon)
@@ -0,0 +1,146 @@
+import concurrent.futures
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .houses import ascendant_longitude
+from .tables import SIGN_LORDS, YONI_ANIMALS, YONI_OF_CONSTELLATION, sign_index
+from .shadbala import Shadbala
+from .validation import angle_difference
+
+__all__ = [
+    "rising_sign_score",
+    "animal_score",
+    "house_strength_score",
+    "rectify",
+]
+
+_CONSTELLATION_SPAN = 360.0 / 27.0
+# candidates per task handed to a worker in the coarse pass
+_CHUNK = 256
+
+
+def rising_sign_score(sign, latitude, longitude, degree=None, ayanamsa=None):
+    """
+    Score for rectify, best when the ascendant sits at degree (middle by
+    default) of the expected sign, like Calculate.FindBirthTimeByRisingSign.
+    Minus the arc in degrees, above -15 the sign itself rises.
+
+    Args:
+    sign (ZodiacName or int): Expected rising sign, 0 for Aries.
+    latitude, longitude (float): Birth place.
+    degree (float): Degree within the sign to aim for, 15 if not given.
+    """
+    target = sign_index(sign) * 30.0 + (15.0 if degree is None else degree)
+
+    def score(jd):
+        return -np.abs(angle_difference(ascendant_longitude(jd, latitude, longitude, ayanamsa), target))
+    return score
+
+
+def animal_score(animal, ayanamsa=None):
+    """
+    Score for rectify, best when the Moon sits in the middle of a
+    constellation with the given yoni animal, like Calculate.FindBirthTimeByAnimal.
+    Minus the arc in degrees to the nearest such middle.
+
+    Args:
+    animal (str): One of YONI_ANIMALS, eg: "Horse".
+    """
+    middles = (np.flatnonzero(YONI_OF_CONSTELLATION == YONI_ANIMALS.index(animal)) + 0.5) * _CONSTELLATION_SPAN
+
+    def score(jd):
+        moon = np.asarray(planet_nirayana_longitude(PlanetName.Moon, jd, ayanamsa))
+        return -np.min(np.abs(angle_difference(moon[..., None], middles)), axis=-1)
+    return score
+
+
+def house_strength_score(house, latitude, longitude, ayanamsa=None):
+    """
+    Score for rectify, shadbala pinda of the lord of a house (counted from
+    the lagna sign), stands in for Calculate.FindBirthTimeHouseStrengthPerson.
+
+    Args:
+    house (int): House number 1-12.
+    latitude, longitude (float): Birth place.
+    """
+    def score(jd):
+        jd = np.asarray(jd, dtype=np.float64)
+        lagna = np.floor(ascendant_longitude(jd, latitude, longitude, ayanamsa) / 30.0).astype(np.int64)
+        lord = SIGN_LORDS[(lagna + house - 1) % 12]
+        pinda = Shadbala(jd, latitude, longitude, ayanamsa).pinda
+        return np.take_along_axis(pinda, lord[..., None], axis=-1)[..., 0]
+    return score
+
+
+def _peaks(times, scores, count):
+    """
+    Best local maxima, flat tops give their first time only. The first & last
+    entries are the neighbours just outside the window & never peaks, so the
+    edges of the window only count when they are real maxima.
+    """
+    known = np.where(np.isnan(scores), -np.inf, scores)
+    peak = (known[1:-1] >= known[:-2]) & (known[1:-1] > known[2:])
+    index = np.flatnonzero(peak & np.isfinite(scores[1:-1])) + 1
+    index = index[np.argsort(-scores[index], kind="stable")][:count]
+    return [(float(times[i]), float(scores[i])) for i in index]
+
+
+def _refine(score, centre, half_width, step, start, end):
+    # finer grid around the window, never outside the search range
+    times = np.arange(max(centre - half_width, start), min(centre + half_width, end) + step / 2.0, step)
+    scores = np.asarray(score(times), dtype=np.float64)
+    best = int(np.nanargmax(scores))
+    return float(times[best]), float(scores[best])
+
+
+def rectify(score, start_time, end_time, coarse_minutes=15.0, refine_factor=10, levels=2, keep=5, workers=None):
+    """
+    Search candidate birth times between two times, coarse grid first then
+    finer grids only around the best windows, all in parallel. Generator,
+    yields the ranking every time something new is found so the first
+    answer (the coarse pass) comes back straight away.
+
+    Args:
+    score (callable): score(julian days array) -> array, higher is better,
+        eg: rising_sign_score(ZodiacName.Leo, lat, lon).
+    start_time, end_time: Window to search, julian days, Time or datetime.
+    coarse_minutes (float): Step of the first pass.
+    refine_factor (int): Each refinement step is this much finer.
+    levels (int): Refinement passes after the coarse one.
+    keep (int): Windows followed & candidates ranked.
+    workers (int): Threads, None lets the executor pick.
+
+    Each ranking is a list best first of {"Time": julian day UT, "Score",
+    "PrecisionMinutes"}.
+    """
+    start = float(to_julian_day(start_time))
+    end = float(to_julian_day(end_time))
+    step = coarse_minutes / 1440.0
+
+    def ranking(candidates):
+        ranked = sorted(candidates.values(), key=lambda candidate: -candidate["Score"])
+        return ranked[:keep]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        # one step past both ends so a slope running off the window is no peak
+        times = np.arange(start - step, end + step * 1.5, step)
+        chunks = [times[index:index + _CHUNK] for index in range(0, len(times), _CHUNK)]
+        scores = np.concatenate([np.asarray(part, dtype=np.float64) for part in executor.map(score, chunks)])
+
+        # one candidate per window, refined in place as finer answers come in
+        candidates = {}
+        for window, (time, value) in enumerate(_peaks(times, scores, keep)):
+            candidates[window] = {"Time": time, "Score": value, "PrecisionMinutes": coarse_minutes}
+        yield ranking(candidates)
+
+        for _ in range(levels):
+            fine = step / refine_factor
+            futures = {executor.submit(_refine, score, candidate["Time"], step, fine, start, end): window
+                       for window, candidate in candidates.items()}
+            for future in concurrent.futures.as_completed(futures):
+                time, value = future.result()
+                candidates[futures[future]] = {"Time": time, "Score": value, "PrecisionMinutes": fine * 1440.0}
+                yield ranking(candidates)
+            step = fine
@@ -0,0 +1,269 @@
+import collections
+import concurrent.futures
+import inspect
+import json
+import threading
+from enum import Enum
+
+import numpy as np
+import requests
+
+from .vedastro import Time
+from .calculate import Calculate
+from .julian_day import to_julian_day, julian_day_to_datetime64, julian_day_to_time
+
+__all__ = [
+    "calculate_series",
+    "SERIES_CACHE_SIZE",
+    "clear_series_cache",
+    "series_time_parameter",
+    "series_request_key",
+    "fetch_cached_payloads",
+]
+
+# payloads kept, the least recently used are dropped past this
+SERIES_CACHE_SIZE = 100000
+
+# (endpoint, time string, place, args, ayanamsa, backend) -> payload, shared
+# by every series call so overlapping ranges are only fetched once
+_series_cache = collections.OrderedDict()
+_cache_lock = threading.Lock()
+
+_DEFAULT_WORKERS = 16
+
+
+def clear_series_cache():
+    """
+    Forget every payload fetched by Calculate.series.
+    """
+    with _cache_lock:
+        _series_cache.clear()
+
+
+def series_time_parameter(method, args):
+    """
+    Name of the endpoint argument the times go into, the first one not
+    already given in args.
+    """
+    for name in inspect.signature(method).parameters:
+        if name not in args:
+            return name
+    raise ValueError(f"{method.__name__} has no argument left for the times, all given in args")
+
+
+def _hashable(value):
+    """
+    Cache key form of an argument, enums & Times by name.
+    """
+    if isinstance(value, Enum):
+        return (type(value).__name__, value.name)
+    if isinstance(value, Time):
+        return (value.time_string, value.geolocation.location_name)
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+def series_request_key(calculate, endpoint, args):
+    """
+    Part of the cache key shared by every time of one call, the endpoint, its
+    other arguments & the client's ayanamsa and backend.
+    """
+    return (endpoint, tuple(sorted((key, _hashable(value)) for key, value in args.items())),
+            _hashable(getattr(calculate, "Ayanamsa", None)), getattr(calculate, "backend", "http"))
+
+
+def _checked_request(cls, endpoint, params):
+    """
+    Same request as the generated Calculate._make_request, but a failed call
+    raises instead of printing the "Fail" payload or returning "Error: ..."
+    text, which would otherwise be cached as an answer.
+    """
+    url = f"{cls.base_url}/{endpoint}"
+    params["APIKey"] = cls.api_key
+    query_string = "/".join(f"{key}/{value}" for key, value in params.items())
+    response = requests.get(f"{url}/{query_string}")
+    if response.status_code != 200:
+        raise RuntimeError(f"API request failed with status code {response.status_code}")
+    data = json.loads(response.text)
+    if data.get("Status") == "Fail":
+        raise RuntimeError(f"{endpoint} failed: {data.get('Payload')}")
+    payload = data.get("Payload")
+    if not payload:
+        raise ValueError("Payload is missing or empty")
+    return payload if isinstance(payload, list) else list(payload.values())[0]
+
+
+def _checked_client(calculate):
+    """
+    The client with _checked_request in place of the generated request, a
+    client that brings its own _make_request is used as it is.
+    """
+    if getattr(calculate._make_request, "__func__", None) is not Calculate._make_request.__func__:
+        return calculate
+    return type(calculate.__name__, (calculate,), {"_make_request": classmethod(_checked_request)})
+
+
+def _failure(payload):
+    """
+    The exception for a failed call, also for "Error: ..." text, else None.
+    """
+    if isinstance(payload, Exception):
+        return payload
+    if isinstance(payload, str) and payload.startswith("Error:"):
+        return RuntimeError(payload[len("Error:"):].strip())
+    return None
+
+
+def fetch_cached_payloads(calculate, endpoint, time_parameter, requests, max_workers=_DEFAULT_WORKERS, args=None):
+    """
+    Payload of every request, the ones not cached yet fetched concurrently.
+
+    Args:
+    calculate (type): Calculate class (or subclass) making the calls.
+    endpoint (str): Calculate method name.
+    time_parameter (str): Argument the Time goes into, see series_time_parameter.
+    requests (dict): Cache key -> Time, keys end with series_request_key.
+    max_workers (int): Requests in flight at once.
+    args (dict): Other arguments of the method.
+
+    Returns cache key -> payload, or the exception for a failed call (HTTP
+    errors & "Fail" responses included). Failures are not cached so they
+    are fetched again next time.
+    """
+    args = args or {}
+    method = getattr(_checked_client(calculate), endpoint)
+
+    def fetch(time):
+        try:
+            payload = method(**args, **{time_parameter: time})
+        except Exception as error:
+            return error
+        return _failure(payload) or payload
+
+    found = {}
+    with _cache_lock:
+        for key in requests:
+            if key in _series_cache:
+                _series_cache.move_to_end(key)
+                found[key] = _series_cache[key]
+
+    pending = {key: time for key, time in requests.items() if key not in found}
+    if pending:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = dict(zip(pending, executor.map(fetch, pending.values())))
+        found.update(fetched)
+        with _cache_lock:
+            _series_cache.update((key, payload) for key, payload in fetched.items()
+                                 if not isinstance(payload, Exception))
+            while len(_series_cache) > SERIES_CACHE_SIZE:
+                _series_cache.popitem(last=False)
+    return {key: found[key] for key in requests}
+
+
+def _flatten(payload, prefix, row):
+    """
+    Nested dicts become prefix_key columns, anything else one column.
+    """
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            _flatten(value, f"{prefix}_{key}" if prefix else str(key), row)
+    else:
+        row[prefix] = payload
+    return row
+
+
+def _column(values):
+    """
+    float64 when every value reads as a number, bool for true/false text,
+    else an object array. Missing values are NaN in numeric columns, a true/false
+    column with missing values is float64 1.0/0.0 with NaN for those.
+    """
+    present = [value for value in values if value is not None]
+    if present and all(isinstance(value, (bool, np.bool_)) or str(value).strip().lower() in ("true", "false")
+                       for value in present):
+        flags = [None if value is None else str(value).strip().lower() == "true" for value in values]
+        if len(present) == len(values):
+            return np.array(flags)
+        return np.array([np.nan if flag is None else float(flag) for flag in flags], dtype=np.float64)
+    try:
+        return np.array([np.nan if value is None else float(value) for value in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def calculate_series(calculate, endpoint, times, geolocation=None, offset="+00:00",
+                     max_workers=_DEFAULT_WORKERS, as_frame=True, **args):
+    """
+    Run one endpoint for every time & return the answers as columns, see
+    Calculate.series.
+    """
+    time_parameter = series_time_parameter(getattr(calculate, endpoint), args)
+
+    # times to Time objects, Time inputs keep their own place & offset
+    if isinstance(times, (list, tuple)) and times and isinstance(times[0], Time):
+        time_objects = list(times)
+    else:
+        if geolocation is None:
+            raise ValueError("geolocation is needed to turn datetimes into Time objects")
+        jd = np.atleast_1d(to_julian_day(times))
+        time_objects = [julian_day_to_time(value, geolocation, offset) for value in jd]
+
+    shared = series_request_key(calculate, endpoint, args)
+    keys = [(time.time_string, time.geolocation.location_name, time.geolocation.longitude,
+             time.geolocation.latitude) + shared for time in time_objects]
+
+    # duplicates & anything fetched before are not asked for again
+    payloads = fetch_cached_payloads(calculate, endpoint, time_parameter, dict(zip(keys, time_objects)),
+                                     max_workers, args)
+
+    rows, errors = [], []
+    for key in keys:
+        payload = payloads[key]
+        if isinstance(payload, Exception):
+            rows.append({})
+            errors.append(str(payload))
+        else:
+            rows.append(_flatten(payload, endpoint if not isinstance(payload, dict) else "", {}))
+            errors.append(None)
+
+    names = list(dict.fromkeys(name for row in rows for name in row))
+    columns = {"time": julian_day_to_datetime64(np.array([to_julian_day(time) for time in time_objects]))}
+    columns.update((name, _column([row.get(name) for row in rows])) for name in names)
+    if any(errors):
+        columns["error"] = np.array(errors, dtype=object)
+
+    if as_frame:
+        try:
+            import pandas as pd
+        except ImportError:
+            return columns
+        return pd.DataFrame(columns).set_index("time")
+    return columns
+
+
+def _series(cls, endpoint, times, geolocation=None, offset="+00:00", max_workers=_DEFAULT_WORKERS,
+            as_frame=True, **args):
+    """
+    One endpoint over many times, eg: Calculate.series("AllPlanetData",
+    pd.date_range(...), geolocation, planetName=PlanetName.Sun).
+
+    Args:
+    endpoint (str): Calculate method name.
+    times: pandas DatetimeIndex, datetime64 array or list of Time (these keep
+        their own place & offset).
+    geolocation (GeoLocation): Place for times that are not Time objects.
+    offset (str): Timezone offset those Time objects are written in.
+    max_workers (int): Requests in flight at once.
+    as_frame (bool): False for a dict of arrays.
+    args: Other arguments of the endpoint, by name.
+
+    Calls run concurrently, repeated times are fetched once & cached across
+    calls. Returns a DataFrame indexed by time (dict of arrays without
+    pandas) with nested fields flattened to key_subkey, numbers parsed to
+    float64 & an error column when some calls failed.
+    """
+    return calculate_series(cls, endpoint, times, geolocation, offset, max_workers, as_frame, **args)
+
+
+Calculate.series = classmethod(_series)
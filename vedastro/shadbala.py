@@ -0,0 +1,362 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day, julian_centuries
+from .ayanamsa import ayanamsa_degree
+from .ephemeris import planet_nirayana_longitude, mean_obliquity, mean_heliocentric_longitude
+from .houses import HouseCusps
+from .sunrise import vedic_day_bounds
+from .upagraha import weekday_index
+from .hora import hora_lord_index
+from .aspects import drishti_matrix
+from .tables import SIGN_LORDS, NATURAL_RELATIONS
+from .validation import angle_difference, parity_table
+
+__all__ = [
+    "SHADBALA_PLANETS",
+    "NAISARGIKA_BALA",
+    "REQUIRED_SHADBALA",
+    "SHADBALA_COMPONENTS",
+    "Shadbala",
+    "shadbala_parity_table",
+]
+
+# order of the last axis of every array, also the weekday lords from Sunday
+SHADBALA_PLANETS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury,
+    PlanetName.Jupiter, PlanetName.Venus, PlanetName.Saturn,
+]
+
+# natural strength in shashtiamsas (virupas), fixed for every chart
+NAISARGIKA_BALA = {
+    PlanetName.Sun: 60.0, PlanetName.Moon: 51.43, PlanetName.Venus: 42.85, PlanetName.Jupiter: 34.28,
+    PlanetName.Mercury: 25.70, PlanetName.Mars: 17.14, PlanetName.Saturn: 8.57,
+}
+
+# minimum shadbala in rupas for a planet to be called strong
+REQUIRED_SHADBALA = {
+    PlanetName.Sun: 6.5, PlanetName.Moon: 6.0, PlanetName.Mars: 5.0, PlanetName.Mercury: 7.0,
+    PlanetName.Jupiter: 6.5, PlanetName.Venus: 5.5, PlanetName.Saturn: 5.0,
+}
+
+# every component array on Shadbala & the Calculate method it stands for
+SHADBALA_COMPONENTS = {
+    "ochcha": "PlanetOchchaBala",
+    "saptavargaja": "PlanetSaptavargajaBala",
+    "ojayugmarasyamsa": "PlanetOjayugmarasyamsaBala",
+    "kendra": "PlanetKendraBala",
+    "drekkana": "PlanetDrekkanaBala",
+    "sthana": "PlanetSthanaBala",
+    "dig": "PlanetDigBala",
+    "nathonnatha": "PlanetNathonnathaBala",
+    "paksha": "PlanetPakshaBala",
+    "tribhaga": "PlanetTribhagaBala",
+    "abda": "PlanetAbdaBala",
+    "masa": "PlanetMasaBala",
+    "vara": "PlanetVaraBala",
+    "hora": "PlanetHoraBala",
+    "ayana": "PlanetAyanaBala",
+    "yuddha": "PlanetYuddhaBala",
+    "kala": "PlanetKalaBala",
+    "chesta": "PlanetChestaBala",
+    "naisargika": "PlanetNaisargikaBala",
+    "drik": "PlanetDrikBala",
+    "pinda": "PlanetShadbalaPinda",
+}
+
+# PlanetYuddhaBala takes the other planets' balas as an argument that can't
+# go in a url, yuddha is still checked as part of kala & pinda
+_NO_PARITY = {"yuddha"}
+
+_SUN, _MOON, _MARS, _MERCURY, _JUPITER, _VENUS, _SATURN = range(7)
+
+# deep debilitation point of each planet, uchcha is 180 degrees away
+_DEBILITATION = np.array([190.0, 213.0, 118.0, 345.0, 275.0, 177.0, 20.0])
+
+# moolatrikona sign & degree range in the rasi chart
+_MOOLATRIKONA = np.array([(4, 0, 20), (1, 3, 30), (0, 0, 12), (5, 15, 20), (8, 0, 10), (6, 0, 15), (10, 0, 20)])
+
+# saptavargaja points for compound relation -2 (great enemy) ... +2 (great friend),
+# own sign 30 & moolatrikona (rasi only) 45
+_RELATION_POINTS = np.array([1.875, 3.75, 7.5, 15.0, 22.5])
+_OWN_POINTS = 30.0
+_MOOLATRIKONA_POINTS = 45.0
+
+# trimsamsa degree bounds & sign for odd & even signs
+_TRIMSAMSA_ODD = (np.array([5.0, 10.0, 18.0, 25.0]), np.array([0, 10, 8, 2, 6]))
+_TRIMSAMSA_EVEN = (np.array([5.0, 12.0, 20.0, 25.0]), np.array([1, 5, 11, 9, 7]))
+
+# 0 male, 1 neuter, 2 female, each gets drekkana bala in that drekkana
+_GENDER_DREKKANA = np.array([0, 2, 0, 1, 0, 2, 1])
+
+# house (0 based) whose middle is the powerless point for dig bala
+_DIG_POWERLESS_HOUSE = np.array([3, 9, 3, 6, 6, 9, 0])
+
+_BENEFIC = np.array([False, True, False, True, True, True, False])
+_NIGHT_STRONG = np.array([False, True, True, False, False, False, True])
+
+# tribhaga lords of the 3 parts of day & of night, Jupiter always gets it
+_DAY_THIRDS = np.array([_MERCURY, _SUN, _SATURN])
+_NIGHT_THIRDS = np.array([_MOON, _VENUS, _MARS])
+
+# kali yuga epoch (a Friday) for ahargana, 360 day years & 30 day months
+_KALI_EPOCH_DAY = 588466
+_KALI_EPOCH_WEEKDAY = 5
+
+_YUDDHA_PLANETS = [_MARS, _MERCURY, _JUPITER, _VENUS, _SATURN]
+_DEG = np.pi / 180.0
+
+
+def _arc(a, b):
+    return np.abs(angle_difference(a, b))
+
+
+def _varga_signs(longitudes):
+    """
+    Sign (0-11) in D1, D2, D3, D7, D9, D12 & D30 for every longitude, stacked
+    on a new first axis.
+    """
+    sign = np.floor(longitudes / 30.0).astype(np.int64)
+    degrees = longitudes - sign * 30.0
+    odd = sign % 2 == 0
+
+    first_half = degrees < 15.0
+    hora = np.where(odd == first_half, 4, 3)
+    drekkana = (sign + 4 * np.floor(degrees / 10.0).astype(np.int64)) % 12
+    saptamsa = (sign + np.where(odd, 0, 6) + np.floor(degrees * 7.0 / 30.0).astype(np.int64)) % 12
+    navamsa = np.floor(longitudes * 9.0 / 30.0).astype(np.int64) % 12
+    dwadasamsa = (sign + np.floor(degrees / 2.5).astype(np.int64)) % 12
+    trimsamsa = np.where(odd,
+                         _TRIMSAMSA_ODD[1][np.searchsorted(_TRIMSAMSA_ODD[0], degrees, side="right")],
+                         _TRIMSAMSA_EVEN[1][np.searchsorted(_TRIMSAMSA_EVEN[0], degrees, side="right")])
+    return np.stack([sign, hora, drekkana, saptamsa, navamsa, dwadasamsa, trimsamsa])
+
+
+class Shadbala:
+    def __init__(self, times, latitude, longitude, ayanamsa=None):
+        """
+        All six balas & their parts for the 7 planets of every chart in one
+        pass, longitudes, houses, sunrise & aspects are each worked out once
+        & shared by every component, like Calculate.AllPlanetStrength.
+
+        Args:
+        times: Birth times as julian days, Time objects, datetimes or datetime64.
+        latitude, longitude (float or array): Birth place in degrees, north &
+            east positive, broadcast against times.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+
+        Every name in SHADBALA_COMPONENTS is an attribute of shape
+        times.shape + (7,) in shashtiamsas, planets in SHADBALA_PLANETS order.
+        pinda is the total, rupas the same / 60.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        latitude = np.asarray(latitude, dtype=np.float64)
+        longitude = np.asarray(longitude, dtype=np.float64)
+        jd, latitude, longitude = np.broadcast_arrays(jd, latitude, longitude)
+
+        # shared intermediates
+        nirayana = np.stack([planet_nirayana_longitude(planet, jd, ayanamsa) for planet in SHADBALA_PLANETS],
+                            axis=-1) % 360.0
+        sayana = (nirayana + np.asarray(ayanamsa_degree(jd, ayanamsa))[..., None]) % 360.0
+        houses = HouseCusps(jd, latitude, longitude, ayanamsa)
+        sunrise, sunset, next_sunrise = vedic_day_bounds(jd, latitude, longitude)
+        vargas = _varga_signs(nirayana)
+        elongation = (nirayana[..., _MOON] - nirayana[..., _SUN]) % 360.0
+
+        self._sthana(nirayana, vargas, houses)
+        self.dig = _arc(nirayana, np.take_along_axis(houses.middle, np.broadcast_to(
+            _DIG_POWERLESS_HOUSE, nirayana.shape), axis=-1)) / 3.0
+        self._kala(jd, longitude, sayana, elongation, sunrise, sunset, next_sunrise)
+        self._chesta(jd, sayana)
+        self.naisargika = np.broadcast_to(np.array([NAISARGIKA_BALA[planet] for planet in SHADBALA_PLANETS]),
+                                          nirayana.shape).copy()
+        self._drik(nirayana, elongation)
+
+        # war between the 5 true planets within a degree, decided on the balas so far
+        before_war = self.sthana + self.dig + self.kala
+        self.yuddha = np.zeros_like(nirayana)
+        for first_index, first in enumerate(_YUDDHA_PLANETS):
+            for second in _YUDDHA_PLANETS[first_index + 1:]:
+                at_war = _arc(nirayana[..., first], nirayana[..., second]) < 1.0
+                difference = np.where(at_war, before_war[..., first] - before_war[..., second], 0.0)
+                self.yuddha[..., first] += difference
+                self.yuddha[..., second] -= difference
+        self.kala = self.kala + self.yuddha
+
+        self.pinda = self.sthana + self.dig + self.kala + self.chesta + self.naisargika + self.drik
+        self.rupas = self.pinda / 60.0
+        self.strength_ratio = self.rupas / np.array([REQUIRED_SHADBALA[planet] for planet in SHADBALA_PLANETS])
+
+    def _sthana(self, nirayana, vargas, houses):
+        self.ochcha = _arc(nirayana, _DEBILITATION) / 3.0
+
+        # temporary friends sit 2, 3, 4, 10, 11 or 12 signs from the planet,
+        # compound relation is natural + temporary (-2 ... +2)
+        rasi = vargas[0]
+        count = (rasi[..., None, :] - rasi[..., :, None]) % 12
+        temporary = np.where(np.isin(count, (1, 2, 3, 9, 10, 11)), 1, -1)
+        compound = NATURAL_RELATIONS + temporary
+
+        planets = np.arange(7)
+        points = []
+        for varga in vargas:
+            lord = SIGN_LORDS[varga]
+            relation = np.take_along_axis(compound, lord[..., None], axis=-1)[..., 0]
+            points.append(np.where(lord == planets, _OWN_POINTS, _RELATION_POINTS[relation + 2]))
+
+        # moolatrikona only counts in the rasi chart
+        degrees = nirayana - rasi * 30.0
+        in_moolatrikona = ((rasi == _MOOLATRIKONA[:, 0]) & (degrees >= _MOOLATRIKONA[:, 1])
+                           & (degrees < _MOOLATRIKONA[:, 2]))
+        points[0] = np.where(in_moolatrikona, _MOOLATRIKONA_POINTS, points[0])
+        self.saptavargaja = np.sum(points, axis=0)
+
+        # moon & venus like even signs & navamsas, the rest odd ones
+        wants_even = np.isin(planets, (_MOON, _VENUS))
+        self.ojayugmarasyamsa = (15.0 * ((rasi % 2 == 1) == wants_even)
+                                 + 15.0 * ((vargas[4] % 2 == 1) == wants_even))
+
+        # bhava the planet is in, from the house begin points
+        begin = houses.begin
+        offset = (nirayana - begin[..., :1]) % 360.0
+        edges = (begin - begin[..., :1]) % 360.0
+        house = np.sum(offset[..., :, None] >= edges[..., None, :], axis=-1) - 1
+        self.kendra = np.choose(house % 3, [60.0, 30.0, 15.0])
+
+        self.drekkana = np.where(np.floor(degrees / 10.0) == _GENDER_DREKKANA, 15.0, 0.0)
+        self.sthana = self.ochcha + self.saptavargaja + self.ojayugmarasyamsa + self.kendra + self.drekkana
+
+    def _kala(self, jd, longitude, sayana, elongation, sunrise, sunset, next_sunrise):
+        planets = np.arange(7)
+
+        # day strength runs from 0 at midnight to 60 at noon, night the reverse
+        noon = (sunrise + sunset) / 2.0
+        hours_from_noon = np.abs((jd - noon + 0.5) % 1.0 - 0.5) * 24.0
+        diva = (12.0 - hours_from_noon) * 5.0
+        self.nathonnatha = np.where(_NIGHT_STRONG, 60.0 - diva[..., None], diva[..., None])
+        self.nathonnatha[..., _MERCURY] = 60.0
+
+        # benefics gain as the moon waxes, malefics as it wanes, moon counts double
+        paksha = np.where(elongation > 180.0, 360.0 - elongation, elongation) / 3.0
+        self.paksha = np.where(_BENEFIC, paksha[..., None], 60.0 - paksha[..., None])
+        self.paksha[..., _MOON] *= 2.0
+
+        is_day = jd < sunset
+        part = np.where(is_day, (jd - sunrise) / (sunset - sunrise), (jd - sunset) / (next_sunrise - sunset))
+        third = np.clip(np.floor(part * 3.0), 0, 2).astype(np.int64)
+        tribhaga_lord = np.where(is_day, _DAY_THIRDS[third], _NIGHT_THIRDS[third])
+        self.tribhaga = np.where((planets == tribhaga_lord[..., None]) | (planets == _JUPITER), 60.0, 0.0)
+
+        # lords of the year, month, weekday & hour
+        weekday = weekday_index(sunrise, longitude)
+        ahargana = np.floor(sunrise + longitude / 360.0 + 0.5) - _KALI_EPOCH_DAY
+        abda_lord = (_KALI_EPOCH_WEEKDAY + 3 * (ahargana // 360)).astype(np.int64) % 7
+        masa_lord = (_KALI_EPOCH_WEEKDAY + 2 * (ahargana // 30)).astype(np.int64) % 7
+        hora_number = np.floor((jd - sunrise) / (next_sunrise - sunrise) * 24.0).astype(np.int64)
+        hora_lord = hora_lord_index(hora_number, weekday)
+        self.abda = np.where(planets == abda_lord[..., None], 15.0, 0.0)
+        self.masa = np.where(planets == masa_lord[..., None], 30.0, 0.0)
+        self.vara = np.where(planets == weekday[..., None], 45.0, 0.0)
+        self.hora = np.where(planets == hora_lord[..., None], 60.0, 0.0)
+
+        # declination north helps Sun, Mars, Jupiter & Venus, south helps Moon
+        # & Saturn, Mercury gains either way, the Sun's is doubled
+        obliquity = mean_obliquity(jd)[..., None] * _DEG
+        declination = np.degrees(np.arcsin(np.sin(obliquity) * np.sin(sayana * _DEG)))
+        declination = np.where(np.isin(planets, (_MOON, _SATURN)), -declination, declination)
+        declination[..., _MERCURY] = np.abs(declination[..., _MERCURY])
+        self.ayana = (24.0 + declination) / 48.0 * 60.0
+        self.ayana[..., _SUN] *= 2.0
+
+        self.kala = (self.nathonnatha + self.paksha + self.tribhaga + self.abda + self.masa
+                     + self.vara + self.hora + self.ayana)
+
+    def _chesta(self, jd, sayana):
+        # chesta kendra: seeghrochcha less the mean of mean & true longitude,
+        # sun & moon take their ayana & paksha bala instead
+        mean_sun = 280.46646 + 36000.76983 * julian_centuries(jd)
+        self.chesta = np.zeros_like(sayana)
+        self.chesta[..., _SUN] = self.ayana[..., _SUN]
+        self.chesta[..., _MOON] = self.paksha[..., _MOON]
+        for index in (_MARS, _MERCURY, _JUPITER, _VENUS, _SATURN):
+            heliocentric = mean_heliocentric_longitude(SHADBALA_PLANETS[index], jd)
+            if index in (_MERCURY, _VENUS):
+                mean, seeghrochcha = mean_sun, heliocentric
+            else:
+                mean, seeghrochcha = heliocentric, mean_sun
+            kendra = (seeghrochcha - (mean + sayana[..., index]) / 2.0) % 360.0
+            self.chesta[..., index] = np.where(kendra > 180.0, 360.0 - kendra, kendra) / 3.0
+
+    def _drik(self, nirayana, elongation):
+        # a fourth of benefic less malefic drishti received, waxing moon is benefic
+        drishti = drishti_matrix(nirayana, nirayana)
+        drishti[..., np.arange(7), np.arange(7)] = 0.0
+        benefic = np.broadcast_to(_BENEFIC, nirayana.shape).copy()
+        benefic[..., _MOON] = elongation < 180.0
+        sign = np.where(benefic, 1.0, -1.0)
+        self.drik = np.sum(drishti * sign[..., :, None], axis=-2) / 4.0
+
+    def planet_shadbala_pinda(self, planet, index=()):
+        """
+        Total strength in shashtiamsas of one planet, like Calculate.PlanetShadbalaPinda,
+        index (int or tuple) picks the chart when many were computed.
+        """
+        position = (index if isinstance(index, tuple) else (index,)) + (SHADBALA_PLANETS.index(planet),)
+        return float(self.pinda[position])
+
+    def all_planet_strength(self, index=()):
+        """
+        Pinda of every planet for one chart, strongest first, like Calculate.AllPlanetStrength.
+        """
+        pinda = self.pinda[index if isinstance(index, tuple) else (index,)]
+        order = np.argsort(-pinda, kind="stable")
+        return [(SHADBALA_PLANETS[planet], float(pinda[planet])) for planet in order]
+
+    def breakdown(self, planet, index=()):
+        """
+        Every component of one planet for one chart, keyed like SHADBALA_COMPONENTS.
+        """
+        position = (index if isinstance(index, tuple) else (index,)) + (SHADBALA_PLANETS.index(planet),)
+        return {name: float(getattr(self, name)[position]) for name in SHADBALA_COMPONENTS}
+
+
+def shadbala_parity_table(times, planets=None, components=("pinda", "sthana", "dig", "kala", "chesta", "drik")):
+    """
+    Compare local components against the API, one call per row, differences
+    in shashtiamsas (local - api).
+
+    Args:
+    times (list): Time objects, the chart place comes from their geolocation.
+    planets (list): Planets to check, defaults to all 7.
+    components (list): Names from SHADBALA_COMPONENTS, except yuddha.
+    """
+    from .calculate import Calculate
+
+    unsupported = sorted(set(components) & _NO_PARITY)
+    if unsupported:
+        raise ValueError(f"No API parity for {unsupported}, yuddha is checked within kala & pinda")
+
+    charts = {}
+
+    def local(case):
+        name, planet, time = case
+        if id(time) not in charts:
+            charts[id(time)] = Shadbala(time, time.geolocation.latitude, time.geolocation.longitude)
+        return charts[id(time)].breakdown(planet)[name]
+
+    def remote(case):
+        name, planet, time = case
+        method = getattr(Calculate, SHADBALA_COMPONENTS[name])
+        if name == "chesta":
+            return method(planet, time, True)
+        return method(planet, time)
+
+    def parse(value):
+        # strength comes back as a Shashtiamsa object or a bare number
+        if isinstance(value, dict):
+            value = next(iter(value.values()))
+        return float(value)
+
+    cases = [(name, planet, time) for time in times for planet in planets or SHADBALA_PLANETS
+             for name in components]
+    return parity_table(cases, local, remote, parse=parse, compare=lambda a, b: a - b)
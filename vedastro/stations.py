@@ -0,0 +1,210 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day
+from .ephemeris import planet_sayana_longitude
+from .validation import angle_difference, parity_table
+
+__all__ = [
+    "STATIONARY_SPEED",
+    "planet_speed",
+    "planet_stations",
+    "MotionTimeline",
+    "station_parity_table",
+]
+
+# below this many degrees a day (either way) the planet counts as
+# Stationary, a few % of its fastest motion. Sun, Moon & nodes never stop
+STATIONARY_SPEED = {
+    PlanetName.Mercury: 0.05,
+    PlanetName.Venus: 0.02,
+    PlanetName.Mars: 0.01,
+    PlanetName.Jupiter: 0.005,
+    PlanetName.Saturn: 0.003,
+}
+
+# sampling step in days, well under the shortest retrograde or stationary spell
+_SAMPLE_STEP_DAYS = {
+    PlanetName.Mercury: 0.5,
+    PlanetName.Venus: 1.0,
+    PlanetName.Mars: 1.0,
+    PlanetName.Jupiter: 2.0,
+    PlanetName.Saturn: 2.0,
+    "TrueRahu": 0.25,
+    "TrueKetu": 0.25,
+}
+_DEFAULT_STEP_DAYS = 1.0
+
+# half width of the central difference for speed, days
+_SPEED_STEP = 0.01
+_TOLERANCE_SECONDS = 1.0
+
+_STATES = np.array(["Direct", "Retrograde", "Stationary"], dtype=object)
+
+
+def planet_speed(planet, times):
+    """
+    Daily motion in tropical longitude (degrees/day, negative when
+    retrograde), like Calculate.PlanetSpeed.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    ahead = planet_sayana_longitude(planet, jd + _SPEED_STEP)
+    behind = planet_sayana_longitude(planet, jd - _SPEED_STEP)
+    return angle_difference(ahead, behind) / (2.0 * _SPEED_STEP)
+
+
+def _crossings(planet, samples, speeds, level):
+    """
+    Instants speed crosses level between consecutive samples, every bracket
+    bisected together for a fixed number of rounds. Returns the times & +1
+    where speed goes up through level, -1 where it goes down.
+    """
+    if samples.size < 2:
+        return np.empty(0), np.empty(0, dtype=np.int64)
+    side = np.sign(speeds - level)
+    changed = np.flatnonzero(side[1:] * side[:-1] < 0)
+    low, high = samples[changed], samples[changed + 1]
+    low_side = side[changed]
+    rounds = int(np.ceil(np.log2(max((samples[1] - samples[0]) * 86400.0 / _TOLERANCE_SECONDS, 2.0))))
+    for _ in range(rounds if changed.size else 0):
+        middle = (low + high) / 2.0
+        same = np.sign(planet_speed(planet, middle) - level) == low_side
+        low = np.where(same, middle, low)
+        high = np.where(same, high, middle)
+    return (low + high) / 2.0, -low_side.astype(np.int64)
+
+
+def _samples(planet, start, end):
+    step = _SAMPLE_STEP_DAYS.get(planet, _DEFAULT_STEP_DAYS)
+    samples = np.append(np.arange(start, end, step), end)
+    return samples, planet_speed(planet, samples)
+
+
+def planet_stations(planet, start_time, end_time):
+    """
+    Exact stations between two times, where the speed in longitude goes
+    through zero.
+
+    Args:
+    planet (PlanetName): Planet, also "TrueRahu" & "TrueKetu".
+    start_time, end_time: Julian days, Time objects or datetimes.
+
+    Returns (times, kinds), julian days UT & "StationRetrograde" or
+    "StationDirect" per station.
+    """
+    start = float(to_julian_day(start_time))
+    end = float(to_julian_day(end_time))
+    samples, speeds = _samples(planet, start, end)
+    times, direction = _crossings(planet, samples, speeds, 0.0)
+    kinds = np.where(direction < 0, "StationRetrograde", "StationDirect").astype(object)
+    return times, kinds
+
+
+class MotionTimeline:
+    def __init__(self, planet, start_time, end_time, stationary_speed=None):
+        """
+        Motion of one planet between two times as a list of intervals, each
+        Direct, Retrograde or Stationary, looked up by binary search instead
+        of one PlanetMotionName / IsPlanetRetrograde call per time.
+
+        Args:
+        planet (PlanetName): Planet, also "TrueRahu" & "TrueKetu".
+        start_time, end_time: Julian days, Time objects or datetimes.
+        stationary_speed (float): Degrees/day under which the planet is
+            Stationary, defaults to STATIONARY_SPEED (0 for Sun, Moon & nodes).
+
+        edges are the julian days (UT) bounding the intervals, one more than
+        states. stations & station_kinds are the exact stations, see
+        planet_stations.
+        """
+        start = float(to_julian_day(start_time))
+        end = float(to_julian_day(end_time))
+        limit = STATIONARY_SPEED.get(planet, 0.0) if stationary_speed is None else stationary_speed
+        self.planet = planet
+
+        samples, speeds = _samples(planet, start, end)
+        self.stations, direction = _crossings(planet, samples, speeds, 0.0)
+        self.station_kinds = np.where(direction < 0, "StationRetrograde", "StationDirect").astype(object)
+
+        # stationary band edges are where speed crosses +limit & -limit
+        cuts = [self.stations]
+        if limit > 0.0:
+            cuts += [_crossings(planet, samples, speeds, level)[0] for level in (limit, -limit)]
+        edges = np.unique(np.concatenate([[start, end]] + cuts))
+        if edges.size < 2:
+            # start == end, one empty interval
+            edges = np.array([start, end])
+
+        # state of each interval from the speed at its middle, then merge runs
+        middle = planet_speed(planet, (edges[:-1] + edges[1:]) / 2.0)
+        state = np.where(np.abs(middle) < limit, 2, np.where(middle < 0.0, 1, 0))
+        keep = np.concatenate([[True], state[1:] != state[:-1]])
+        self.edges = np.append(edges[:-1][keep], end)
+        self.states = _STATES[state[keep]]
+
+    def _interval(self, times):
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        if np.any(jd < self.edges[0]) or np.any(jd > self.edges[-1]):
+            raise ValueError("Time outside the timeline, widen start_time/end_time")
+        return np.clip(np.searchsorted(self.edges, jd, side="right") - 1, 0, len(self.states) - 1)
+
+    def planet_motion_name(self, times):
+        """
+        "Direct", "Retrograde" or "Stationary" at each time, like Calculate.PlanetMotionName.
+        """
+        return self.states[self._interval(times)]
+
+    def is_planet_retrograde(self, times):
+        """
+        Moving backwards at each time, like Calculate.IsPlanetRetrograde.
+        Stationary spells count by the side of the station they are on.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        self._interval(jd)
+        # speed sign only changes at a station, count the ones passed
+        passed = np.searchsorted(self.stations, jd, side="right")
+        start_retrograde = planet_speed(self.planet, self.edges[0]) < 0.0
+        retrograde = (passed % 2 == 1) != start_retrograde
+        return retrograde if np.ndim(retrograde) else bool(retrograde)
+
+    def rows(self):
+        """
+        One dict per interval, start & end julian days UT.
+        """
+        return [{"Start": float(start), "End": float(end), "Motion": state}
+                for start, end, state in zip(self.edges[:-1], self.edges[1:], self.states)]
+
+
+def station_parity_table(times, planets=None):
+    """
+    Compare speed & retrograde flags against the API, one call per row.
+    Speed differs in degrees/day, the flag gives 0 when they agree.
+
+    Args:
+    times (list): Time objects.
+    planets (list): Defaults to the planets in STATIONARY_SPEED.
+    """
+    from .calculate import Calculate
+
+    planets = planets or list(STATIONARY_SPEED)
+
+    def local(case):
+        method, planet, time = case
+        if method == "PlanetSpeed":
+            return float(planet_speed(planet, time))
+        jd = float(to_julian_day(time))
+        return MotionTimeline(planet, jd - 1.0, jd + 1.0).is_planet_retrograde(jd)
+
+    def remote(case):
+        method, planet, time = case
+        value = getattr(Calculate, method)(planet, time)
+        if method == "PlanetSpeed":
+            return float(value)
+        return str(value).strip().lower() == "true"
+
+    def compare(a, b):
+        return int(a != b) if isinstance(a, bool) else a - b
+
+    cases = [(method, planet, time) for time in times for planet in planets
+             for method in ("PlanetSpeed", "IsPlanetRetrograde")]
+    return parity_table(cases, local, remote, parse=lambda value: value, compare=compare)
@@ -0,0 +1,228 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day, local_dates, api_julian_day
+from .ephemeris import mean_equinox_longitude, terrestrial_time, nutation, mean_obliquity
+from .houses import local_sidereal_time
+from .validation import parity_table
+
+__all__ = [
+    "HINDU_RISING_ALTITUDE",
+    "STANDARD_RISING_ALTITUDE",
+    "SunriseTable",
+    "vedic_day_bounds",
+    "is_day_birth",
+    "is_night_birth",
+    "is_before_sunrise",
+    "sunrise_parity_table",
+]
+
+# altitude of the Sun's centre at rise & set in degrees, hindu rising is the
+# centre of the disc on the horizon without refraction (what the API uses),
+# standard is upper limb with refraction like almanacs
+HINDU_RISING_ALTITUDE = 0.0
+STANDARD_RISING_ALTITUDE = -50.0 / 60.0
+
+# degrees the hour angle of the Sun moves per day, sidereal rate less the
+# Sun's own ~1 degree a day
+_SOLAR_HOUR_ANGLE_RATE = 360.98564736629 - 0.9856
+_ITERATIONS = 4
+_DEG = np.pi / 180.0
+
+
+def _sun_hour_angle(jd, latitude, longitude, altitude):
+    """
+    Local hour angle of the Sun & its half day arc (hour angle at the rise
+    altitude) in degrees, plus the raw cosine of the half arc, above 1 the
+    Sun never rises & below -1 it never sets.
+    """
+    jd_tt = terrestrial_time(jd)
+    nutation_longitude, nutation_obliquity = nutation(jd_tt)
+    longitude_sun = (mean_equinox_longitude(PlanetName.Sun, jd) + nutation_longitude) * _DEG
+    obliquity = (mean_obliquity(jd_tt) + nutation_obliquity) * _DEG
+
+    right_ascension = np.degrees(np.arctan2(np.cos(obliquity) * np.sin(longitude_sun), np.cos(longitude_sun)))
+    declination = np.arcsin(np.sin(obliquity) * np.sin(longitude_sun))
+    hour_angle = (local_sidereal_time(jd, longitude) - right_ascension + 180.0) % 360.0 - 180.0
+
+    latitude = np.asarray(latitude, dtype=np.float64) * _DEG
+    cos_half_arc = ((np.sin(altitude * _DEG) - np.sin(latitude) * np.sin(declination))
+                    / (np.cos(latitude) * np.cos(declination)))
+    half_arc = np.degrees(np.arccos(np.clip(cos_half_arc, -1.0, 1.0)))
+    return hour_angle, half_arc, cos_half_arc
+
+
+def _solve_event(estimate, latitude, longitude, altitude, side):
+    """
+    Refine the time the Sun reaches hour angle side * half arc, side -1 rise,
+    0 transit, +1 set. Returns julian days & the last half arc cosine.
+    """
+    jd = estimate
+    for _ in range(_ITERATIONS):
+        hour_angle, half_arc, cos_half_arc = _sun_hour_angle(jd, latitude, longitude, altitude)
+        target = side * half_arc
+        jd = jd - ((hour_angle - target + 180.0) % 360.0 - 180.0) / _SOLAR_HOUR_ANGLE_RATE
+    return jd, cos_half_arc
+
+
+class SunriseTable:
+    def __init__(self, dates, latitude, longitude, altitude=HINDU_RISING_ALTITUDE, grid=True):
+        """
+        Sunrise, sunset & noon for every date at every location in one go,
+        like Calculate.SunriseTime, SunsetTime, NoonTime & DayDurationHours.
+
+        Args:
+        dates: Calendar days, as Time objects (their written date), dates,
+            datetime64 or julian days.
+        latitude, longitude (float or array): Degrees, north & east positive,
+            same shape, one entry per location.
+        altitude (float): Sun centre altitude at rise/set, see HINDU_RISING_ALTITUDE.
+        grid (bool): False to pair each date with the location at the same
+            index (plain numpy broadcasting) instead of every date x location.
+
+        Dates go down the first axis & locations across the rest, so a year of
+        dates against 500 cities gives (365, 500) arrays. sunrise, sunset &
+        noon are julian days (UT). rises & sets flag which events happen that
+        day, near the polar circles a day can have only one of them, the
+        missing one is NaN. polar_day & polar_night mark days with neither,
+        day_duration_hours is then 24 or 0 (NaN with only one event).
+        """
+        day = np.asarray(local_dates(dates), dtype=np.float64)
+        latitude = np.asarray(latitude, dtype=np.float64)
+        longitude = np.asarray(longitude, dtype=np.float64)
+        if grid:
+            day = day.reshape(day.shape + (1,) * max(latitude.ndim, longitude.ndim))
+
+        # local mean noon of the date is a good first guess for all 3 events
+        noon_estimate = day + 0.5 - longitude / 360.0
+        self.noon, _ = _solve_event(noon_estimate, latitude, longitude, altitude, 0)
+
+        _, half_arc, cos_half_arc = _sun_hour_angle(self.noon, latitude, longitude, altitude)
+        sunrise, rise_cos = _solve_event(self.noon - half_arc / _SOLAR_HOUR_ANGLE_RATE,
+                                         latitude, longitude, altitude, -1)
+        sunset, set_cos = _solve_event(self.noon + half_arc / _SOLAR_HOUR_ANGLE_RATE,
+                                       latitude, longitude, altitude, 1)
+
+        # keep whichever event happened, on the day polar day starts the Sun
+        # still rises but no longer sets
+        self.rises = np.abs(rise_cos) <= 1.0
+        self.sets = np.abs(set_cos) <= 1.0
+        self.sunrise = np.where(self.rises, sunrise, np.nan)
+        self.sunset = np.where(self.sets, sunset, np.nan)
+
+        # neither, noon tells if the Sun stays up or down
+        never_crossed = ~self.rises & ~self.sets
+        self.polar_day = never_crossed & (cos_half_arc < -1.0)
+        self.polar_night = never_crossed & (cos_half_arc > 1.0)
+
+        duration = (self.sunset - self.sunrise) * 24.0
+        duration = np.where(self.polar_day, 24.0, duration)
+        self.day_duration_hours = np.where(self.polar_night, 0.0, duration)
+
+    def is_daytime(self, times):
+        """
+        True where the times (same shape as the table, or broadcastable) fall
+        between that day's sunrise & sunset, polar days count as daytime. With
+        only one event that day, daytime is after the rise or before the set.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        after_rise = np.where(self.rises, jd >= self.sunrise, True)
+        before_set = np.where(self.sets, jd <= self.sunset, True)
+        return (after_rise & before_set & (self.rises | self.sets)) | self.polar_day
+
+
+def vedic_day_bounds(times, latitude, longitude, altitude=HINDU_RISING_ALTITUDE):
+    """
+    Sunrise, sunset & next sunrise (julian days) of the vedic day each time
+    is in, a vedic day runs from one sunrise to the next. Ready for Upagrahas
+    & upagraha_part_number. Inputs broadcast like numpy arrays.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+
+    # civil date from local mean time, step back a day when before its sunrise
+    local_date = np.floor(jd + longitude / 360.0 + 0.5) - 0.5
+    today = SunriseTable(local_date, latitude, longitude, altitude, grid=False)
+    before = jd < today.sunrise
+    start_date = np.where(before, local_date - 1.0, local_date)
+
+    days = SunriseTable(np.stack([start_date, start_date + 1.0]), latitude, longitude, altitude, grid=False)
+    return days.sunrise[0], days.sunset[0], days.sunrise[1]
+
+
+def is_day_birth(times, latitude, longitude, altitude=HINDU_RISING_ALTITUDE):
+    """
+    Born between sunrise & sunset of the birth date, like Calculate.IsDayBirth.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    table = SunriseTable(np.floor(jd + longitude / 360.0 + 0.5) - 0.5, latitude, longitude, altitude, grid=False)
+    day = table.is_daytime(jd)
+    return day if np.ndim(day) else bool(day)
+
+
+def is_night_birth(times, latitude, longitude, altitude=HINDU_RISING_ALTITUDE):
+    """
+    Opposite of is_day_birth, like Calculate.IsNightBirth.
+    """
+    night = np.logical_not(is_day_birth(times, latitude, longitude, altitude))
+    return night if np.ndim(night) else bool(night)
+
+
+def is_before_sunrise(times, latitude, longitude, altitude=HINDU_RISING_ALTITUDE):
+    """
+    Born after midnight but before that date's sunrise, like Calculate.IsBeforeSunrise.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    longitude = np.asarray(longitude, dtype=np.float64)
+    table = SunriseTable(np.floor(jd + longitude / 360.0 + 0.5) - 0.5, latitude, longitude, altitude, grid=False)
+    before = jd < table.sunrise
+    return before if np.ndim(before) else bool(before)
+
+
+def sunrise_parity_table(times):
+    """
+    Compare the local engine against the API, one call per row. Event times
+    are compared in minutes (local - api), the day/night flags give 0 when
+    they agree.
+
+    Args:
+    times (list): Time objects, each checked for all 7 methods.
+    """
+    from .calculate import Calculate
+
+    def table(time):
+        geolocation = time.geolocation
+        return SunriseTable(time, geolocation.latitude, geolocation.longitude)
+
+    def place(time):
+        return time.geolocation.latitude, time.geolocation.longitude
+
+    local = {
+        "SunriseTime": lambda time: float(table(time).sunrise),
+        "SunsetTime": lambda time: float(table(time).sunset),
+        "NoonTime": lambda time: float(table(time).noon),
+        "DayDurationHours": lambda time: float(table(time).day_duration_hours),
+        "IsDayBirth": lambda time: is_day_birth(time, *place(time)),
+        "IsNightBirth": lambda time: is_night_birth(time, *place(time)),
+        "IsBeforeSunrise": lambda time: is_before_sunrise(time, *place(time)),
+    }
+
+    def remote(case):
+        method, time = case
+        value = getattr(Calculate, method)(time)
+        if method in ("SunriseTime", "SunsetTime", "NoonTime"):
+            return api_julian_day(value, time)
+        if method == "DayDurationHours":
+            return float(value)
+        return str(value).strip().lower() == "true"
+
+    def compare(a, b):
+        if isinstance(a, bool):
+            return int(a != b)
+        # hours stay hours, julian days become minutes
+        return (a - b) * (1.0 if abs(a) < 100 else 1440.0)
+
+    cases = [(method, time) for time in times for method in local]
+    return parity_table(cases, lambda case: local[case[0]](case[1]), remote,
+                        parse=lambda value: value, compare=compare)
@@ -0,0 +1,69 @@
+import numpy as np
+
+from .vedastro import ConstellationName, HouseName, ZodiacName
+
+__all__ = [
+    "SIGN_LORDS",
+    "NATURAL_RELATIONS",
+    "YONI_ANIMALS",
+    "YONI_OF_CONSTELLATION",
+    "sign_index",
+    "constellation_index",
+    "house_index",
+]
+
+# tables shared by several local engines, planets are indexed in weekday
+# order: Sun, Moon, Mars, Mercury, Jupiter, Venus, Saturn
+
+# lord of each sign, Aries first
+SIGN_LORDS = np.array([2, 5, 3, 1, 0, 3, 5, 2, 4, 6, 6, 4])
+
+# natural relationship of row planet towards column planet: 1 friend, 0 neutral, -1 enemy
+NATURAL_RELATIONS = np.array([
+    [0, 1, 1, 0, 1, -1, -1],
+    [1, 0, 0, 1, 0, 0, 0],
+    [1, 1, 0, -1, 1, 0, 0],
+    [1, -1, 0, 0, 0, 1, 0],
+    [1, 1, 1, -1, 0, -1, 0],
+    [-1, -1, 0, 1, 0, 0, 1],
+    [-1, -1, -1, 1, 0, 1, 0],
+])
+
+YONI_ANIMALS = [
+    "Horse", "Elephant", "Sheep", "Serpent", "Dog", "Cat", "Rat",
+    "Cow", "Buffalo", "Tiger", "Deer", "Monkey", "Mongoose", "Lion",
+]
+
+# yoni animal of each constellation as index into YONI_ANIMALS, Aswini first
+YONI_OF_CONSTELLATION = np.array([
+    0, 1, 2, 3, 3, 4, 5, 2, 5, 6, 6, 7, 8, 9, 8, 9, 10, 10, 4, 11, 12, 11, 13, 0, 13, 7, 1,
+])
+
+
+def sign_index(values):
+    """
+    0-11 index from ZodiacName members or plain 0 based ints.
+    """
+    if isinstance(values, ZodiacName):
+        return list(ZodiacName).index(values)
+    if isinstance(values, (list, tuple)) and values and isinstance(values[0], ZodiacName):
+        return np.array([list(ZodiacName).index(value) for value in values])
+    return np.asarray(values, dtype=np.int64) % 12
+
+
+def constellation_index(values):
+    """
+    0-26 index from ConstellationName members (Aswini = 1) or plain 0 based ints.
+    """
+    if isinstance(values, ConstellationName):
+        return values.value - 1
+    if isinstance(values, (list, tuple)) and values and isinstance(values[0], ConstellationName):
+        return np.array([value.value - 1 for value in values])
+    return np.asarray(values, dtype=np.int64) % 27
+
+
+def house_index(house):
+    """
+    0-11 index from a HouseName member or a house number 1-12.
+    """
+    return (int(house.value[len("House"):]) if isinstance(house, HouseName) else int(house)) - 1
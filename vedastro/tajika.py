@@ -0,0 +1,184 @@
+import numpy as np
+
+from .vedastro import ConstellationName, PlanetName, Time, ZodiacName
+from .julian_day import to_julian_day, julian_day_to_datetime64, api_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .houses import ascendant_longitude
+from .validation import angle_difference, parity_table, parse_degrees
+
+__all__ = [
+    "SIDEREAL_YEAR_DAYS",
+    "RAMAN_YEAR_DAYS",
+    "TAJIKA_PLANETS",
+    "tajika_date_for_year",
+    "solar_return",
+    "TajikaChart",
+    "tajika_parity_table",
+]
+
+# sidereal year, also the mean time the nirayana Sun takes to come back
+SIDEREAL_YEAR_DAYS = 365.256363
+
+# year length used by Raman's Varshaphala tables (365d 6h 12m 36s)
+RAMAN_YEAR_DAYS = 365.2587565
+
+TAJIKA_PLANETS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury, PlanetName.Jupiter,
+    PlanetName.Venus, PlanetName.Saturn, PlanetName.Rahu, PlanetName.Ketu,
+]
+
+# newton steps from the mean year guess, the Sun's daily motion hardly
+# changes within a day of the answer so it is worked out once
+_NEWTON_STEPS = 3
+# half width in days of the difference used for the Sun's daily motion
+_MOTION_STEP = 0.05
+
+_CONSTELLATIONS = np.array([name for name in ConstellationName if name.value > 0], dtype=object)
+_SIGNS = np.array(list(ZodiacName), dtype=object)
+
+
+def _birth_jd_and_year(birth_times):
+    """
+    Julian day & civil year of birth, Time objects use the year as written.
+    """
+    jd = np.asarray(to_julian_day(birth_times), dtype=np.float64)
+    if isinstance(birth_times, Time):
+        return jd, np.asarray(int(birth_times.time_string.split()[1].split("/")[2]))
+    if isinstance(birth_times, (list, tuple)) and birth_times and isinstance(birth_times[0], Time):
+        return jd, np.array([int(time.time_string.split()[1].split("/")[2]) for time in birth_times])
+    return jd, julian_day_to_datetime64(jd).astype("datetime64[Y]").astype(np.int64) + 1970
+
+
+def _grid(birth_times, scan_years):
+    """
+    Birth julian days & elapsed years as an outer grid, births down the rows.
+    """
+    jd, year = _birth_jd_and_year(birth_times)
+    scan_years = np.asarray(scan_years, dtype=np.int64)
+    shape = jd.shape + (1,) * scan_years.ndim
+    return jd.reshape(shape), scan_years - year.reshape(shape)
+
+
+def tajika_date_for_year(birth_times, scan_years):
+    """
+    Start of the Tajika year the way Raman's Varshaphala counts it, whole
+    years of RAMAN_YEAR_DAYS added to the birth, like Calculate.TajikaDateForYear.
+    Julian days (UT), shape births.shape + years.shape.
+    """
+    jd, elapsed = _grid(birth_times, scan_years)
+    result = jd + elapsed * RAMAN_YEAR_DAYS
+    return result if result.ndim else float(result)
+
+
+def solar_return(birth_times, scan_years, ayanamsa=None):
+    """
+    Exact instant the nirayana Sun comes back to its birth longitude in each
+    scan year, like Calculate.TajikaDateForYear2.
+
+    Args:
+    birth_times: Birth times as julian days, Time objects, datetimes or datetime64.
+    scan_years (int or array): Calendar years, eg: range(2000, 2080).
+    ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+
+    All births & years are solved together by newton steps on the Sun's
+    longitude from the mean year guess, shape births.shape + years.shape
+    in julian days (UT).
+    """
+    jd, elapsed = _grid(birth_times, scan_years)
+    target = planet_nirayana_longitude(PlanetName.Sun, jd, ayanamsa)
+    guess = jd + elapsed * SIDEREAL_YEAR_DAYS
+    ahead = planet_nirayana_longitude(PlanetName.Sun, guess + _MOTION_STEP, ayanamsa)
+    behind = planet_nirayana_longitude(PlanetName.Sun, guess - _MOTION_STEP, ayanamsa)
+    motion = angle_difference(ahead, behind) / (2.0 * _MOTION_STEP)
+    for _ in range(_NEWTON_STEPS):
+        now = planet_nirayana_longitude(PlanetName.Sun, guess, ayanamsa)
+        guess = guess - angle_difference(now, target) / motion
+    return guess if np.ndim(guess) else float(guess)
+
+
+class TajikaChart:
+    def __init__(self, birth_times, scan_years, latitude, longitude, ayanamsa=None, raman=False):
+        """
+        Annual (varsha) charts for every birth & scan year at once, planets
+        & lagna at the solar return, cast for the birth place.
+
+        Args:
+        birth_times: Birth times as julian days, Time objects, datetimes or datetime64.
+        scan_years (int or array): Calendar years to cast.
+        latitude, longitude (float or array): Birth place in degrees,
+            broadcast against births.shape + years.shape.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+        raman (bool): Start the year by Raman's year count instead of the
+            exact solar return.
+
+        return_time holds the julian days (UT), longitudes is a dict of
+        TAJIKA_PLANETS -> nirayana degrees & lagna the ascendant, all in
+        the births.shape + years.shape grid.
+        """
+        if raman:
+            self.return_time = np.asarray(tajika_date_for_year(birth_times, scan_years))
+        else:
+            self.return_time = np.asarray(solar_return(birth_times, scan_years, ayanamsa))
+        self.longitudes = {planet: np.asarray(planet_nirayana_longitude(planet, self.return_time, ayanamsa))
+                           for planet in TAJIKA_PLANETS}
+        self.lagna = np.asarray(ascendant_longitude(self.return_time, latitude, longitude, ayanamsa))
+
+    def planet_tajika_longitude(self, planet):
+        """
+        Like Calculate.PlanetTajikaLongitude, for every chart.
+        """
+        longitude = self.longitudes[planet]
+        return longitude if longitude.ndim else float(longitude)
+
+    def planet_tajika_constellation(self, planet):
+        """
+        Constellation the planet is in, like Calculate.PlanetTajikaConstellation.
+        """
+        index = np.floor(self.longitudes[planet] / (360.0 / 27.0)).astype(np.int64) % 27
+        return _CONSTELLATIONS[index]
+
+    def planet_tajika_zodiac_sign(self, planet):
+        """
+        Sign the planet is in, like Calculate.PlanetTajikaZodiacSign.
+        """
+        index = np.floor(self.longitudes[planet] / 30.0).astype(np.int64) % 12
+        return _SIGNS[index]
+
+
+def tajika_parity_table(birth_times, scan_years):
+    """
+    Compare solar returns & Tajika Sun/Moon longitudes against the API, one
+    call per row. Dates differ in minutes, longitudes in degrees.
+
+    Args:
+    birth_times (list): Time objects.
+    scan_years (list): Years to check for each birth.
+    """
+    from .calculate import Calculate
+
+    def local(case):
+        method, time, year = case
+        if method == "TajikaDateForYear":
+            return float(tajika_date_for_year(time, year))
+        if method == "TajikaDateForYear2":
+            return float(solar_return(time, year))
+        chart = TajikaChart(time, year, time.geolocation.latitude, time.geolocation.longitude)
+        return chart.planet_tajika_longitude(method[1])
+
+    def remote(case):
+        method, time, year = case
+        if isinstance(method, tuple):
+            return Calculate.PlanetTajikaLongitude(method[1], time, year)
+        return api_julian_day(getattr(Calculate, method)(time, year), time)
+
+    def parse(value):
+        return value if isinstance(value, float) else parse_degrees(value)
+
+    def compare(a, b):
+        # julian days are large, degrees never are
+        return (a - b) * 1440.0 if abs(a) > 1000.0 else angle_difference(a, b)
+
+    methods = ["TajikaDateForYear", "TajikaDateForYear2",
+               ("PlanetTajikaLongitude", PlanetName.Sun), ("PlanetTajikaLongitude", PlanetName.Moon)]
+    cases = [(method, time, year) for time in birth_times for year in scan_years for method in methods]
+    return parity_table(cases, local, remote, parse=parse, compare=compare)
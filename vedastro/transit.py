@@ -0,0 +1,114 @@
+import functools
+import numpy as np
+
+from .vedastro import ConstellationName, PlanetName, ZodiacName
+from .julian_day import to_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .ayanamsa import default_ayanamsa
+from .validation import angle_difference
+
+__all__ = [
+    "SAMPLE_STEP_DAYS",
+    "ingress_times",
+    "planet_sign_transit",
+    "constellation_transit_start_times",
+]
+
+# sampling step per planet in days, short enough that no planet can leave a
+# nakshatra (13°20') & come back between two samples except right at a station
+SAMPLE_STEP_DAYS = {
+    PlanetName.Moon: 0.25,
+    PlanetName.Mercury: 0.5,
+    PlanetName.Sun: 1.0,
+    PlanetName.Venus: 1.0,
+    PlanetName.Mars: 1.0,
+    PlanetName.Jupiter: 2.0,
+    PlanetName.Saturn: 2.0,
+    PlanetName.Rahu: 2.0,
+    PlanetName.Ketu: 2.0,
+}
+_DEFAULT_STEP_DAYS = 2.0
+
+_CONSTELLATIONS = [name for name in ConstellationName if name.value > 0]
+_SIGNS = list(ZodiacName)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_ingresses(planet, start, end, division, ayanamsa, tolerance_seconds):
+    """
+    Ingresses between two julian days as a tuple of (time, from, to) tuples,
+    every argument is hashable so repeated questions cost nothing.
+    """
+    step = SAMPLE_STEP_DAYS.get(planet, _DEFAULT_STEP_DAYS)
+    samples = np.append(np.arange(start, end, step), end)
+    longitude = planet_nirayana_longitude(planet, samples, ayanamsa)
+    segment = np.floor(np.atleast_1d(longitude) / division).astype(np.int64)
+    count = int(round(360.0 / division))
+
+    changed = np.flatnonzero(segment[1:] != segment[:-1])
+    if changed.size == 0:
+        return ()
+
+    # boundary between the two segments, forward or backward (retrograde)
+    before, after = segment[changed], segment[changed + 1]
+    forward = (after - before) % count == 1
+    boundary = np.where(forward, after, before) * division
+
+    # bisect every bracket at once, a fixed number of rounds so the number of
+    # ephemeris evaluations is known up front
+    low, high = samples[changed], samples[changed + 1]
+    rounds = int(np.ceil(np.log2(max(step * 86400.0 / tolerance_seconds, 2.0))))
+    low_side = np.sign(angle_difference(longitude[changed], boundary))
+    for _ in range(rounds):
+        middle = (low + high) / 2.0
+        side = np.sign(angle_difference(planet_nirayana_longitude(planet, middle, ayanamsa), boundary))
+        same = side == low_side
+        low = np.where(same, middle, low)
+        high = np.where(same, high, middle)
+
+    return tuple(zip(((low + high) / 2.0).tolist(), (before % count).tolist(), (after % count).tolist()))
+
+
+def ingress_times(planet, start_time, end_time, division=30.0, ayanamsa=None, tolerance_seconds=1.0):
+    """
+    Every instant the planet moves from one division of the zodiac into
+    another, eg: 30 for signs or 360/27 for nakshatras, retrograde moves
+    back into the previous division count too.
+
+    Args:
+    planet (PlanetName): Any planet with a local ephemeris.
+    start_time, end_time: Range as julian days, Time objects or datetimes.
+    division (float): Width of each division in degrees.
+    ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+    tolerance_seconds (float): Bisection stops once brackets are this small.
+
+    Returns (times, from_index, to_index) arrays, julian days (UT) & 0 based
+    division indexes. Results are cached per argument set.
+    """
+    start = float(to_julian_day(start_time))
+    end = float(to_julian_day(end_time))
+    ayanamsa = ayanamsa if ayanamsa is not None else default_ayanamsa()
+    rows = _cached_ingresses(planet, start, end, float(division), ayanamsa, float(tolerance_seconds))
+    if not rows:
+        return np.zeros(0), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    times, before, after = (np.array(column) for column in zip(*rows))
+    return times, before, after
+
+
+def planet_sign_transit(planet, start_time, end_time, ayanamsa=None, tolerance_seconds=1.0):
+    """
+    Signs entered between two times with the exact julian day of entry,
+    like Calculate.PlanetSignTransit. List of (julian day, ZodiacName).
+    """
+    times, _, after = ingress_times(planet, start_time, end_time, 30.0, ayanamsa, tolerance_seconds)
+    return [(time, _SIGNS[sign]) for time, sign in zip(times.tolist(), after.tolist())]
+
+
+def constellation_transit_start_times(planet, start_time, end_time, ayanamsa=None, tolerance_seconds=1.0):
+    """
+    Constellations entered between two times with the exact julian day of
+    entry, like Calculate.GetConstellationTransitStartTime but to the second.
+    List of (julian day, ConstellationName).
+    """
+    times, _, after = ingress_times(planet, start_time, end_time, 360.0 / 27.0, ayanamsa, tolerance_seconds)
+    return [(time, _CONSTELLATIONS[star]) for time, star in zip(times.tolist(), after.tolist())]
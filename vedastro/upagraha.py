@@ -0,0 +1,143 @@
+import numpy as np
+
+from .vedastro import PlanetName
+from .julian_day import to_julian_day
+from .ephemeris import planet_nirayana_longitude
+from .houses import ascendant_longitude
+from .sunrise import vedic_day_bounds
+
+__all__ = [
+    "WEEKDAY_LORDS",
+    "UPAGRAHA_LORDS",
+    "weekday_index",
+    "sun_based_upagrahas",
+    "upagraha_part_number",
+    "Upagrahas",
+]
+
+# lords of Sunday ... Saturday, also the order the 8 day parts are ruled in
+WEEKDAY_LORDS = [
+    PlanetName.Sun, PlanetName.Moon, PlanetName.Mars, PlanetName.Mercury,
+    PlanetName.Jupiter, PlanetName.Venus, PlanetName.Saturn,
+]
+
+# time based upagrahas & the planet whose part of the day they rise in
+UPAGRAHA_LORDS = {
+    "Kaala": PlanetName.Sun,
+    "Mrityu": PlanetName.Mars,
+    "Arthaprahaara": PlanetName.Mercury,
+    "Yamaghantaka": PlanetName.Jupiter,
+    "Gulika": PlanetName.Saturn,
+}
+
+
+def weekday_index(jd, longitude):
+    """
+    Weekday 0 (Sunday) to 6 (Saturday) at the place, from local mean time.
+    Pass the sunrise to get the weekday of the vedic day.
+    """
+    local = np.asarray(jd, dtype=np.float64) + np.asarray(longitude, dtype=np.float64) / 360.0
+    return (np.floor(local + 0.5).astype(np.int64) + 1) % 7
+
+
+def sun_based_upagrahas(sun_longitude):
+    """
+    Dhuma, Vyatipaata, Parivesha, Indrachaapa & Upaketu, each a fixed offset
+    from the Sun, like Calculate.DhumaLongitude etc. Nirayana degrees.
+    """
+    sun = np.asarray(sun_longitude, dtype=np.float64)
+    dhuma = (sun + 133.0 + 20.0 / 60.0) % 360.0
+    vyatipaata = (360.0 - dhuma) % 360.0
+    parivesha = (vyatipaata + 180.0) % 360.0
+    indrachaapa = (360.0 - parivesha) % 360.0
+    upaketu = (indrachaapa + 16.0 + 40.0 / 60.0) % 360.0
+    return {
+        "Dhuma": dhuma,
+        "Vyatipaata": vyatipaata,
+        "Parivesha": parivesha,
+        "Indrachaapa": indrachaapa,
+        "Upaketu": upaketu,
+    }
+
+
+def _day_half(jd, sunrise, sunset, next_sunrise):
+    """
+    Start, length & first ruling weekday offset of the half (day or night)
+    each time falls in, night parts start from the 5th lord from the day's.
+    """
+    is_day = jd < sunset
+    start = np.where(is_day, sunrise, sunset)
+    length = np.where(is_day, sunset - sunrise, next_sunrise - sunset)
+    lord_offset = np.where(is_day, 0, 4)
+    return is_day, start, length, lord_offset
+
+
+def upagraha_part_number(times, planet, sunrise, sunset, next_sunrise, longitude):
+    """
+    Which of the 8 parts (1-8) of the current day or night half is ruled by
+    the planet, like Calculate.UpagrahaPartNumber.
+
+    Args:
+    times: Times within the vedic day that starts at sunrise.
+    planet (PlanetName): One of the 7 weekday lords.
+    sunrise, sunset, next_sunrise: Bounds of that vedic day.
+    longitude (float): East longitude of the place, for the weekday.
+    """
+    jd = np.asarray(to_julian_day(times), dtype=np.float64)
+    sunrise, sunset, next_sunrise = (np.asarray(to_julian_day(value), dtype=np.float64)
+                                     for value in (sunrise, sunset, next_sunrise))
+    _, _, _, lord_offset = _day_half(jd, sunrise, sunset, next_sunrise)
+    first_lord = (weekday_index(sunrise, longitude) + lord_offset) % 7
+    part = (WEEKDAY_LORDS.index(planet) - first_lord) % 7 + 1
+    return part if np.ndim(part) else int(part)
+
+
+class Upagrahas:
+    def __init__(self, times, latitude, longitude, sunrise=None, sunset=None, next_sunrise=None, ayanamsa=None):
+        """
+        All 11 upagraha longitudes for arrays of times in one go.
+
+        Args:
+        times: Julian days, Time objects, datetimes or datetime64 arrays.
+        latitude (float): Geographic latitude in degrees.
+        longitude (float): East longitude in degrees.
+        sunrise, sunset, next_sunrise: Bounds of the vedic day each time is in,
+            same shape as times, computed locally when not given.
+        ayanamsa (Ayanamsa): Defaults to Calculate.Ayanamsa.
+
+        Each upagraha is an attribute (dhuma ... maandi) holding nirayana
+        degrees, Kaala, Mrityu, Arthaprahaara, Yamaghantaka & Gulika are the
+        lagna at the start of their lord's part, Maandi at its middle.
+        """
+        jd = np.asarray(to_julian_day(times), dtype=np.float64)
+        if sunrise is None or sunset is None or next_sunrise is None:
+            sunrise, sunset, next_sunrise = vedic_day_bounds(jd, latitude, longitude)
+        sunrise, sunset, next_sunrise = (np.asarray(to_julian_day(value), dtype=np.float64)
+                                         for value in (sunrise, sunset, next_sunrise))
+
+        sun = planet_nirayana_longitude(PlanetName.Sun, jd, ayanamsa)
+        for name, value in sun_based_upagrahas(sun).items():
+            setattr(self, name.lower(), value)
+
+        _, start, length, lord_offset = _day_half(jd, sunrise, sunset, next_sunrise)
+        first_lord = (weekday_index(sunrise, longitude) + lord_offset) % 7
+        part_length = length / 8.0
+
+        # part start times of all 5 lords stacked, so the lagna is one call
+        lords = list(UPAGRAHA_LORDS.values())
+        parts = np.stack([(WEEKDAY_LORDS.index(lord) - first_lord) % 7 for lord in lords])
+        part_starts = start + parts * part_length
+        saturn_middle = part_starts[-1] + part_length / 2.0
+
+        lagna = ascendant_longitude(np.concatenate([part_starts, saturn_middle[None]]),
+                                    latitude, longitude, ayanamsa)
+        for index, name in enumerate(UPAGRAHA_LORDS):
+            setattr(self, name.lower(), lagna[index])
+        self.maandi = lagna[-1]
+
+    def to_dict(self):
+        """
+        All upagrahas keyed by name, same names as the Calculate methods.
+        """
+        names = ["Dhuma", "Vyatipaata", "Parivesha", "Indrachaapa", "Upaketu", *UPAGRAHA_LORDS, "Maandi"]
+        return {name: getattr(self, name.lower()) for name in names}
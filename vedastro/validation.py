@@ -0,0 +1,70 @@
+import re
+
+__all__ = ["parse_degrees", "angle_difference", "parity_table"]
+
+
+def parse_degrees(value):
+    """
+    Pull a float degree value out of whatever the API returned.
+
+    Handles plain numbers, numeric strings, "12° 30' 15\"" style strings and
+    Angle payloads like {"DegreeMinuteSecond": ..., "TotalDegrees": "12.5"}.
+    """
+    if isinstance(value, dict):
+        for key in ("TotalDegrees", "DegreesIn"):
+            if key in value:
+                return parse_degrees(value[key])
+        raise ValueError(f"No degree value found in {value}")
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    text = str(value).strip()
+    try:
+        return float(text)
+    except ValueError:
+        pass
+
+    # degree minute second text, eg: 23° 51' 25"
+    parts = [float(part) for part in re.findall(r"-?\d+(?:\.\d+)?", text)]
+    if not parts:
+        raise ValueError(f"Could not read degrees from '{text}'")
+    sign = -1.0 if text.startswith("-") else 1.0
+    total = abs(parts[0])
+    for index, part in enumerate(parts[1:3], start=1):
+        total += part / (60.0 ** index)
+    return sign * total
+
+
+def angle_difference(a, b):
+    """
+    Smallest signed difference a - b in degrees, wraps around 360.
+    """
+    return (a - b + 180.0) % 360.0 - 180.0
+
+
+def parity_table(cases, local, remote, parse=parse_degrees, compare=angle_difference):
+    """
+    Run the same inputs through a local engine and the API side by side.
+
+    Args:
+    cases (list): Inputs, each one passed to both callables.
+    local (callable): Local engine, called as local(case).
+    remote (callable): API call, called as remote(case), eg: a Calculate method.
+    parse (callable): Converts the raw API output into the local value type.
+    compare (callable): Returns the difference local - api, None to skip.
+
+    Returns a list of dict rows with case, local, api & difference, API
+    failures are kept in the row under "error" instead of stopping the run.
+    """
+    rows = []
+    for case in cases:
+        row = {"case": case, "local": local(case)}
+        try:
+            row["api"] = parse(remote(case))
+            row["difference"] = compare(row["local"], row["api"]) if compare else None
+        except Exception as e:
+            row["api"] = None
+            row["difference"] = None
+            row["error"] = str(e)
+        rows.append(row)
+    return rows